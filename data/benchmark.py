@@ -0,0 +1,243 @@
+# data/benchmark.py
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# 모듈 경로 추가
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(DATA_DIR)
+
+import synthetic
+
+# ---------------------------------------------------------
+# 파이프라인 벤치마크
+#  - 배율(1x/10x/100x)마다 합성 원본 생성 -> 단계별로 별도 프로세스에서 실행
+#  - 단계: 파일 정리 -> 엑셀 변환 -> 프로세서 3종 (Parquet 저장 포함) -> 증분 재실행
+#  - 단계별 wall time, 피크 RSS, 산출물 크기를 JSON으로 기록
+#    (결과 파일끼리 --compare로 비교하면 버전 간 성능 저하 확인 가능)
+# ---------------------------------------------------------
+STAGES = ["organizer", "xls_converter", "inbound", "outbound", "exchange", "rerun"]
+DEFAULT_SCALES = [1, 10, 100]
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def _stage_outputs(stage):
+    """단계별 산출물 크기 (byte)"""
+    from processors import common, output
+
+    if stage == "organizer":
+        return _dir_size(common.RAW_ROOT)
+    if stage == "xls_converter":
+        converted = [
+            f"{os.path.splitext(p)[0]}.csv"
+            for p in glob.glob(
+                os.path.join(common.RAW_ROOT, "**", "*.xls*"), recursive=True
+            )
+        ]
+        return sum(os.path.getsize(p) for p in converted if os.path.exists(p))
+    if stage == "rerun":
+        return _dir_size(common.CLEAN_DIR)
+
+    names = {
+        "inbound": "cleaned_inbound_tourism",
+        "outbound": "cleaned_outbound_tourism",
+        "exchange": "cleaned_exchange_rates",
+    }
+    size = 0
+    for ext in [".parquet", output.ARROW_EXT]:
+        path = os.path.join(common.CLEAN_DIR, f"{names[stage]}{ext}")
+        size += os.path.getsize(path) if os.path.exists(path) else 0
+    return size + _dir_size(os.path.join(output.long_dir(), f"series={stage}"))
+
+
+def run_stage(stage, jobs=1):
+    """
+    단계 1개 실행 (BIGDATA_DATA_DIR가 가리키는 데이터 루트 기준).
+    벤치마크 러너가 단계마다 새 프로세스로 호출하므로 피크 RSS가 단계별로 분리됩니다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    import file_organizer
+    import xls_converter
+    from processors import inbound, outbound, exchange, common, report
+
+    processors = {"inbound": inbound, "outbound": outbound, "exchange": exchange}
+    os.makedirs(common.CLEAN_DIR, exist_ok=True)
+
+    start = time.perf_counter()
+    if stage == "organizer":
+        file_organizer.run()
+    elif stage == "xls_converter":
+        xls_converter.run(jobs=jobs)
+    elif stage == "rerun":
+        # 원본 변경 없이 다시 실행 -> 매니페스트 캐시 적중 경로 측정
+        for processor in processors.values():
+            processor.process()
+    elif jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            processors[stage].process(force=True, executor=pool)
+    else:
+        processors[stage].process(force=True)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "stage": stage,
+        "wall_seconds": round(elapsed, 3),
+        "peak_rss_mb": report.peak_rss_mb(children=True),
+        "output_bytes": _stage_outputs(stage),
+    }
+
+
+def _run_stage_subprocess(stage, data_dir, jobs, log):
+    env = dict(os.environ, BIGDATA_DATA_DIR=data_dir)
+    cmd = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--stage",
+        stage,
+        "--jobs",
+        str(jobs),
+    ]
+    proc = subprocess.run(
+        cmd, env=env, capture_output=True, text=True, encoding="utf-8"
+    )
+    log.write(proc.stdout)
+    log.write(proc.stderr)
+    if proc.returncode != 0:
+        print(f"  ❌ [{stage}] 실패 (rc={proc.returncode})")
+        return {"stage": stage, "error": proc.stderr.strip().splitlines()[-1:]}
+    # 자식 프로세스의 마지막 줄이 결과 JSON
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=DATA_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(scales, jobs=1, work_dir=None, keep=False, seed=0):
+    results = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "jobs": jobs,
+        "runs": [],
+    }
+
+    for scale in scales:
+        data_dir = tempfile.mkdtemp(prefix=f"bench_{scale}x_", dir=work_dir)
+        print("-" * 60)
+        print(f"📏 [Benchmark] {scale}x  ({data_dir})")
+        years, countries, currencies = synthetic.scale_plan(scale)
+        summary = synthetic.generate(data_dir, years, countries, currencies, seed=seed)
+
+        run = dict(
+            scale=scale, input_files=summary["files"], input_bytes=summary["bytes"]
+        )
+        run.update(years=years, countries=countries, currencies=summary["currencies"])
+        run["stages"] = []
+        with open(
+            os.path.join(data_dir, "benchmark.log"), "w", encoding="utf-8"
+        ) as log:
+            for stage in STAGES:
+                record = _run_stage_subprocess(stage, data_dir, jobs, log)
+                run["stages"].append(record)
+                if "error" not in record:
+                    print(
+                        f"  ⏱️ {stage:<14} {record['wall_seconds']:>9.3f}s  "
+                        f"RSS {record['peak_rss_mb']} MB  "
+                        f"출력 {record['output_bytes'] / 1e6:.2f} MB"
+                    )
+        results["runs"].append(run)
+
+        if not keep:
+            shutil.rmtree(data_dir, ignore_errors=True)
+    return results
+
+
+def compare(current, baseline_path):
+    """이전 결과 파일 대비 단계별 wall time 비율 출력 (1.00보다 크면 느려짐)"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    old = {
+        (run["scale"], s["stage"]): s.get("wall_seconds")
+        for run in baseline["runs"]
+        for s in run["stages"]
+    }
+    print("-" * 60)
+    print(f"📊 [Benchmark] 비교: {baseline.get('git')} -> {current.get('git')}")
+    for run in current["runs"]:
+        for s in run["stages"]:
+            before = old.get((run["scale"], s["stage"]))
+            now = s.get("wall_seconds")
+            if before and now:
+                print(f"  {run['scale']:>5}x {s['stage']:<14} x{now / before:.2f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="BIGDATA_HW 파이프라인 벤치마크")
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="측정할 배율 목록 (기본: 1 10 100)",
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="병렬 워커 수")
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="결과 JSON 경로"
+    )
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--work-dir", help="합성 데이터 생성 위치 (기본: 임시 폴더)")
+    parser.add_argument(
+        "--keep", action="store_true", help="측정 후 합성 데이터를 지우지 않음"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stage", choices=STAGES, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.stage:
+        # 내부용: 단계 1개 실행 후 결과를 마지막 줄에 JSON으로 출력
+        print(json.dumps(run_stage(args.stage, args.jobs)))
+        return
+
+    scales = [int(s) if float(s).is_integer() else s for s in args.scales]
+    results = run_benchmark(scales, args.jobs, args.work_dir, args.keep, args.seed)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print("-" * 60)
+    print(f"🏁 [Benchmark] 결과 저장: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
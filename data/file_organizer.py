@@ -4,74 +4,84 @@ import shutil
 import glob
 from processors import common  # 공통 경로 설정 가져오기
 
+# 정리 대상 확장자
+EXTENSIONS = ["*.xls", "*.xlsx", "*.csv"]
 
-def run():
-    print(f"\n[1/3] 🧹 파일 자동 분류 및 정리 시작...")
+# 키워드 기반 분류 규칙 (위에서부터 먼저 일치하는 분류 사용)
+KEYWORDS = [
+    ("inbound", ["국적별", "입국", "방한"]),
+    ("exchange", ["환율", "ExRate", "MonAvg"]),
+    # Outbound는 보통 대륙명(Asia, Europe 등)이나 '국민' 키워드
+    (
+        "outbound",
+        ["Asia", "Europe", "Africa", "Oceania", "America", "국민", "해외"],
+    ),
+]
 
-    # 1. 타겟 폴더들 확인 및 생성
-    targets = {
+
+def target_dirs():
+    return {
         "inbound": common.RAW_INBOUND_DIR,
         "outbound": common.RAW_OUTBOUND_DIR,
         "exchange": common.RAW_EXCHANGE_DIR,
     }
-    for path in targets.values():
+
+
+def classify(filename):
+    """파일명 키워드로 분류 ("inbound" / "outbound" / "exchange"), 대상이 아니면 None"""
+    # 이미 정리된 파일이나 스크립트, 결과 파일은 건너뜀
+    if "cleaned_" in filename or filename.startswith("result_"):
+        return None
+    for category, keywords in KEYWORDS:
+        if any(keyword in filename for keyword in keywords):
+            return category
+    return None
+
+
+def organize_file(file_path):
+    """
+    파일 1개를 분류하여 해당 원본 폴더로 이동.
+    반환: (분류, 이동된 경로) / 분류 불가 또는 이동 실패면 (None, None)
+    """
+    filename = os.path.basename(file_path)
+    category = classify(filename)
+    if category is None:
+        # 분류 기준에 안 맞으면 스킵 (혹은 수동 확인 유도)
+        return None, None
+
+    destination = target_dirs()[category]
+    try:
+        os.makedirs(destination, exist_ok=True)
+        dest_path = os.path.join(destination, filename)
+        shutil.move(file_path, dest_path)
+        print(f"  └─ 🚚 이동: {filename} -> {os.path.basename(destination)}/")
+        return category, dest_path
+    except Exception as e:
+        print(f"  ⚠️ 이동 실패 ({filename}): {e}")
+        return None, None
+
+
+def run():
+    print(f"\n[1/3] 🧹 파일 자동 분류 및 정리 시작...")
+
+    # 1. 타겟 폴더들 확인 및 생성
+    for path in target_dirs().values():
         os.makedirs(path, exist_ok=True)
 
     # 2. 현재 폴더(data/)의 파일 탐색 (이미 정리된 폴더 제외)
-    # 정리 대상 확장자
-    extensions = ["*.xls", "*.xlsx", "*.csv"]
-    base_dir = os.path.dirname(os.path.abspath(__file__))
+    base_dir = common.BASE_DIR
 
     move_count = 0
 
-    for ext in extensions:
+    for ext in EXTENSIONS:
         # data/ 폴더 바로 아래 있는 파일만 검색
         files = glob.glob(os.path.join(base_dir, ext))
 
         for file_path in files:
-            filename = os.path.basename(file_path)
-
-            # 이미 정리된 파일이나 스크립트, 결과 파일은 건너뜀
-            if "cleaned_" in filename or filename.startswith("result_"):
-                continue
-
-            destination = None
-
-            # 3. 키워드 기반 분류 로직
-            if any(keyword in filename for keyword in ["국적별", "입국", "방한"]):
-                destination = targets["inbound"]
-            elif any(keyword in filename for keyword in ["환율", "ExRate", "MonAvg"]):
-                destination = targets["exchange"]
-            # Outbound는 보통 대륙명(Asia, Europe 등)이나 '국민' 키워드
-            elif any(
-                keyword in filename
-                for keyword in [
-                    "Asia",
-                    "Europe",
-                    "Africa",
-                    "Oceania",
-                    "America",
-                    "국민",
-                    "해외",
-                ]
-            ):
-                destination = targets["outbound"]
-
-            # 4. 이동 실행
-            if destination:
-                try:
-                    dest_path = os.path.join(destination, filename)
-                    shutil.move(file_path, dest_path)
-                    print(
-                        f"  └─ 🚚 이동: {filename} -> {os.path.basename(destination)}/"
-                    )
-                    move_count += 1
-                except Exception as e:
-                    print(f"  ⚠️ 이동 실패 ({filename}): {e}")
-            else:
-                # 분류 기준에 안 맞으면 스킵 (혹은 수동 확인 유도)
-                # print(f"  ❓ 분류 불가 (Skip): {filename}")
-                pass
+            # 3. 키워드 기반 분류 + 4. 이동 실행
+            category, _ = organize_file(file_path)
+            if category:
+                move_count += 1
 
     if move_count == 0:
         print("  ℹ️ 정리할 새로운 파일이 없습니다.")
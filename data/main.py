@@ -1,74 +1,160 @@
 # data/main.py
 import os
 import sys
-import pandas as pd
-import numpy as np  # 추가: NaN 처리를 위해 필요
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # 모듈 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from processors import inbound, outbound, exchange, common
+from processors import inbound, outbound, exchange, common, report
+from processors import correlation, lagcorr, rollcorr, elasticity, forecast
+
+# 정제 결과(cleaned_*.parquet)를 입력으로 쓰는 파생 분석 -> 프로세서 3개가 끝난 뒤 순서대로 실행
+DERIVED = [correlation, lagcorr, rollcorr, elasticity, forecast]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="BIGDATA_HW 데이터 파이프라인")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="매니페스트 캐시를 무시하고 모든 원본 파일을 다시 처리합니다.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="병렬 워커 수. 2 이상이면 세 프로세서를 동시에 실행하고 파일 파싱을 프로세스 풀로 분산합니다.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=None,
+        help="환율 파일을 크기와 상관없이 청크 단위 스트리밍으로 읽습니다. (기본: 대용량 파일만)",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Parquet과 함께 CSV(utf-8-sig)도 내보냅니다.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="단계별 cProfile 결과를 cleaned_data/profiles/*.prof 로 저장합니다.",
+    )
+    return parser.parse_args()
+
+
+def _run_stage(processor, profile=False, **kwargs):
+    """프로세서 1개를 리포트 단계로 실행. 실패해도 다른 프로세서는 계속 진행 (성공 여부 반환)"""
+    name = processor.__name__.split(".")[-1]
+    try:
+        with report.stage(name, profile=profile):
+            processor.process(**kwargs)
+    except Exception as e:
+        print(f"❌ [{name}] 단계 실패: {e}")
+        return False
+    return True
+
+
+def run_processors(force=False, jobs=1, stream=None, csv=False, profile=False):
+    """
+    inbound / outbound / exchange 프로세서 실행 후 파생 분석(DERIVED) 실행.
+    jobs > 1: 프로세서 3개는 스레드로 동시에 돌리고, 파일별 파싱은 공유 프로세스 풀에서 수행
+    (결과 프레임은 파일 정렬 순서대로 합치므로 직렬 실행과 결과 동일)
+    반환: 모든 단계 성공 여부
+    """
+    ok = _run_sources(force, jobs, stream, csv, profile)
+    return _run_derived(force, jobs, csv, profile) and ok
 
 
-def convert_to_parquet():
+def _run_derived(force, jobs, csv, profile):
     """
-    최종 생성된 CSV 파일들을 Parquet 포맷으로 변환합니다. (속도 최적화)
+    파생 분석은 서로의 결과를 쓰지 않지만 순서대로 실행 (단계별 리포트 측정값이 섞이지 않게).
+    jobs > 1이면 프로세스 풀을 넘겨 단계 내부 작업(예: 시리즈별 예측 적합)을 분산
     """
+    if jobs <= 1:
+        results = []
+        for processor in DERIVED:
+            print("-" * 60)
+            results.append(_run_stage(processor, profile, force=force, csv=csv))
+        return all(results)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for processor in DERIVED:
+            print("-" * 60)
+            results.append(
+                _run_stage(processor, profile, force=force, executor=pool, csv=csv)
+            )
+    return all(results)
+
+
+def _run_sources(force, jobs, stream, csv, profile):
+    processors = [
+        (inbound, {}),
+        (outbound, {}),
+        (exchange, {"stream": stream}),
+    ]
+
+    if jobs <= 1:
+        results = []
+        for processor, options in processors:
+            print("-" * 60)
+            results.append(
+                _run_stage(processor, profile, force=force, csv=csv, **options)
+            )
+        return all(results)
+
     print("-" * 60)
-    print("🔄 [Optimization] CSV -> Parquet 변환 시작...")
-
-    files = {
-        "inbound": "cleaned_inbound_tourism.csv",
-        "outbound": "cleaned_outbound_tourism.csv",
-        "exchange": "cleaned_exchange_rates.csv",
-    }
-
-    for key, filename in files.items():
-        csv_path = os.path.join(common.CLEAN_DIR, filename)
-        parquet_path = csv_path.replace(".csv", ".parquet")
-
-        if os.path.exists(csv_path):
-            try:
-                # CSV 읽기
-                df = pd.read_csv(csv_path, index_col="Date", parse_dates=True)
-
-                # Outbound 데이터의 경우, 0값을 NaN으로 치환 (여기서 한 번 더 확실하게 처리)
-                if key == "outbound" and "Total Outbound" in df.columns:
-                    # Total Outbound가 0인 행은 전체가 미래 데이터일 가능성이 높음
-                    mask = df["Total Outbound"] == 0
-                    df.loc[mask, :] = np.nan
-                    # 모든 컬럼이 NaN인 행 제거 (완전한 미래 데이터 삭제)
-                    df.dropna(how="all", inplace=True)
-
-                # Parquet 저장 (snappy 압축 사용 - 빠르고 용량 작음)
-                df.to_parquet(parquet_path, engine="pyarrow", compression="snappy")
-                print(f"  ✅ 변환 완료: {filename} -> {os.path.basename(parquet_path)}")
-            except Exception as e:
-                print(f"  ❌ 변환 실패 ({filename}): {e}")
-        else:
-            print(f"  ⚠️ 파일 없음 (Skipping): {filename}")
+    print(f"⚡ 병렬 모드: 워커 {jobs}개")
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        with ThreadPoolExecutor(max_workers=len(processors)) as runner:
+            futures = [
+                runner.submit(
+                    _run_stage,
+                    processor,
+                    profile,
+                    force=force,
+                    executor=pool,
+                    csv=csv,
+                    **options,
+                )
+                for processor, options in processors
+            ]
+            return all(future.result() for future in futures)
 
 
 def main():
+    args = parse_args()
     print("🚀 [BIGDATA_HW Data Pipeline] 데이터 팩토리를 가동합니다...")
 
     # 0. 폴더 생성 (안전장치)
     os.makedirs(common.CLEAN_DIR, exist_ok=True)
 
-    # 1. 데이터별 프로세서 실행 (CSV 생성)
-    print("-" * 60)
-    inbound.process()
+    report.start(vars(args))
 
-    print("-" * 60)
-    outbound.process()
-
-    print("-" * 60)
-    exchange.process()
+    # 1. 데이터별 프로세서 실행 (Parquet 직접 저장, --csv면 CSV도 함께)
+    ok = run_processors(
+        force=args.force,
+        jobs=args.jobs,
+        stream=args.stream,
+        csv=args.csv,
+        profile=args.profile,
+    )
 
-    # 2. Parquet 변환 (속도 최적화 단계 추가)
-    convert_to_parquet()
+    # 2. 단계/파일별 측정값 저장
+    report_file = report.finish()
 
     print("-" * 60)
+    print(f"📝 실행 리포트: {report_file}")
+    if not ok:
+        print(
+            "⚠️ 일부 단계가 실패했습니다. 리포트의 failed_stages / failed_files를 확인하세요."
+        )
+        sys.exit(1)
     print(f"🏁 모든 작업 완료! 결과물: {common.CLEAN_DIR}")
 
 
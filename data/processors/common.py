@@ -1,10 +1,17 @@
 # data/processors/common.py
+import csv
+import itertools
 import os
 
+import pandas as pd
+
 # ---------------------------------------------------------
 # 1. 경로 설정
 # ---------------------------------------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# BIGDATA_DATA_DIR 환경 변수로 데이터 루트 교체 가능 (합성 데이터 벤치마크 등)
+BASE_DIR = os.environ.get("BIGDATA_DATA_DIR") or os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
 RAW_ROOT = os.path.join(BASE_DIR, "original_data")
 RAW_INBOUND_DIR = os.path.join(RAW_ROOT, "inbound_data")
 RAW_OUTBOUND_DIR = os.path.join(RAW_ROOT, "outbound_data")
@@ -139,3 +146,88 @@ COUNTRY_MAP = {
     "팔라우": "Palau",
     "북마리아나(사이판)": "Northern Mariana Islands",
 }
+
+# 국가(영문) -> 해당 국가 통화 (환율 데이터에 있는 통화만)
+#  - 유로존 국가는 EUR, 미국 영토·달러 사용 국가는 USD
+COUNTRY_CURRENCY = {
+    "United States": "USD",
+    "Guam": "USD",
+    "Saipan": "USD",
+    "Northern Mariana Islands": "USD",
+    "Palau": "USD",
+    "Ecuador": "USD",
+    "Panama": "USD",
+    "Japan": "JPY",
+    "China": "CNH",
+    "Germany": "EUR",
+    "France": "EUR",
+    "Italy": "EUR",
+    "Spain": "EUR",
+    "Netherlands": "EUR",
+    "Belgium": "EUR",
+    "Austria": "EUR",
+    "Finland": "EUR",
+    "Greece": "EUR",
+    "Slovenia": "EUR",
+    "Slovakia": "EUR",
+    "Cyprus": "EUR",
+    "San Marino": "EUR",
+}
+
+# ---------------------------------------------------------
+# 3. 헤더 탐색 + 필요한 블록만 읽기
+#    (전체 파일을 문자열로 읽고 iterrows()로 훑는 대신 앞부분 N줄만 확인)
+# ---------------------------------------------------------
+ENCODINGS = ["utf-8-sig", "cp949"]
+HEADER_SNIFF_LINES = 200
+
+
+def locate_header(file, predicate, encodings=ENCODINGS, max_lines=HEADER_SNIFF_LINES):
+    """
+    파일 앞부분(max_lines 행)만 읽어 predicate(fields)가 참인 첫 행을 찾습니다.
+    반환: (인코딩, 행 번호, 해당 행 필드 리스트) / 못 찾으면 None
+    """
+    for encoding in encodings:
+        try:
+            with open(file, encoding=encoding, newline="") as f:
+                rows = itertools.islice(csv.reader(f), max_lines)
+                for i, fields in enumerate(rows):
+                    if predicate(fields):
+                        return encoding, i, fields
+            return None
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def read_block(file, predicate, rows_before=0, usecols=None, encodings=ENCODINGS):
+    """
+    헤더 행(위로 rows_before 행 포함)부터 필요한 컬럼만 문자열(dtype=str)로 읽습니다.
+    usecols: 헤더 행 필드 리스트를 받아 읽을 컬럼 번호 리스트를 반환하는 함수 (None이면 전체)
+
+    반환: (DataFrame, 헤더 필드) / 헤더를 못 찾으면 (None, None)
+    - DataFrame 컬럼은 원본 파일의 컬럼 번호, 0번 행이 시작 행
+    """
+    for encoding in encodings:
+        found = locate_header(file, predicate, [encoding])
+        if found is None:
+            continue
+        _, header_idx, fields = found
+        if header_idx < rows_before:
+            return None, None
+
+        cols = sorted(set(usecols(fields))) if usecols else None
+        try:
+            df = pd.read_csv(
+                file,
+                encoding=encoding,
+                header=None,
+                skiprows=header_idx - rows_before,
+                usecols=cols,
+                dtype=str,
+            )
+        except UnicodeDecodeError:
+            # 앞부분은 디코딩됐지만 뒷부분에서 실패 -> 다음 인코딩으로
+            continue
+        return df, fields
+    return None, None
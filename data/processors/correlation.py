@@ -0,0 +1,143 @@
+# data/processors/correlation.py
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from . import derived, manifest, output, report
+
+# ---------------------------------------------------------
+# 국가 x 통화 상관관계 (전체 쌍 사전 계산)
+#  - 입국/출국의 모든 국가 컬럼 x 모든 통화
+#  - pearson(수준) / spearman(순위) / logdiff(월간 로그 변화율의 pearson)
+#  - 쌍마다 둘 다 값이 있는 달만 사용 (pairwise complete) + 유효 표본 수 기록
+#  - 통화 1개당 (월 x 국가) 행렬 연산 1번 -> 국가 수가 늘어도 쌍별 pandas 호출 없음
+# 출력: derived/correlation.parquet, derived/correlation_overview.parquet (대시보드 히트맵용)
+# ---------------------------------------------------------
+ANALYSIS_VERSION = 1
+CORRELATION_FILE = "correlation.parquet"
+OVERVIEW_FILE = "correlation_overview.parquet"
+
+# 히트맵 변수: 입국/출국 합계 + 모든 통화
+OVERVIEW_TOTALS = {"inbound": "Total", "outbound": "Total Outbound"}
+
+CORRELATION_SCHEMA = pa.schema(
+    [
+        pa.field("series", pa.string(), nullable=False),
+        pa.field("country", pa.string(), nullable=False),
+        pa.field("currency", pa.string(), nullable=False),
+        pa.field("n", pa.int32(), nullable=False),
+        pa.field("pearson", pa.float64()),
+        pa.field("spearman", pa.float64()),
+        pa.field("n_diff", pa.int32(), nullable=False),
+        pa.field("logdiff", pa.float64()),
+    ]
+)
+
+
+def paired_ranks(x, y):
+    """쌍별 공통 표본 안에서의 순위 (동점은 평균 순위, 공통 표본 밖은 NaN)"""
+    mask = ~(np.isnan(x) | np.isnan(y))
+    x_rank = pd.DataFrame(np.where(mask, x, np.nan)).rank().to_numpy()
+    y_rank = pd.DataFrame(np.where(mask, y, np.nan)).rank().to_numpy()
+    return x_rank, y_rank
+
+
+def pair_table(series, df, fx):
+    """한 시리즈(입국/출국)의 모든 국가 x 모든 통화 상관관계 (long 프레임)"""
+    values = df.to_numpy()
+    diffs = derived.log_diff(values)
+    rows = []
+    for currency in fx.columns:
+        rate = np.broadcast_to(fx[currency].to_numpy()[:, None], values.shape)
+        pearson, n = derived.paired_pearson(values, rate)
+        spearman, _ = derived.paired_pearson(*paired_ranks(values, rate))
+        rate_diff = np.broadcast_to(
+            derived.log_diff(fx[[currency]].to_numpy()), values.shape
+        )
+        logdiff, n_diff = derived.paired_pearson(diffs, rate_diff)
+        rows.append(
+            pd.DataFrame(
+                {
+                    "series": series,
+                    "country": df.columns.astype(str),
+                    "currency": currency,
+                    "n": n.astype("int32"),
+                    "pearson": pearson,
+                    "spearman": spearman,
+                    "n_diff": n_diff.astype("int32"),
+                    "logdiff": logdiff,
+                }
+            )
+        )
+    return pd.concat(rows, ignore_index=True)
+
+
+def overview_matrix(frames, fx):
+    """입국/출국 합계 + 통화 간 상관행렬 (모든 변수에 값이 있는 달만 사용)"""
+    columns = {
+        name: frames[series][name]
+        for series, name in OVERVIEW_TOTALS.items()
+        if name in frames[series].columns
+    }
+    merged = pd.concat([pd.DataFrame(columns), fx], axis=1).dropna()
+    matrix = merged.corr()
+    matrix.index.name = "variable"
+    matrix.columns = matrix.columns.astype(str)
+    return matrix.reset_index()
+
+
+def process(force=False, executor=None, csv=False):
+    inputs = derived.input_paths()
+    section = manifest.load_section("correlation", ANALYSIS_VERSION)
+    paths = [
+        os.path.join(derived.derived_dir(), name)
+        for name in [CORRELATION_FILE, OVERVIEW_FILE]
+    ]
+    if not force and derived.outputs_current(section, inputs, paths):
+        print(" ⏩ [Correlation] 입력 변경 없음 (Skip)")
+        return
+
+    loaded = derived.load_inputs()
+    if loaded is None:
+        print("⚠️ [Correlation] 정제 결과가 없습니다. 프로세서를 먼저 실행하세요.")
+        report.note(status="empty", reason="no cleaned inputs")
+        return
+    frames, fx = loaded
+
+    print(
+        f"🔄 [Correlation] 국가 {sum(df.shape[1] for df in frames.values())}개 x "
+        f"통화 {fx.shape[1]}개 상관관계 계산 중..."
+    )
+    table = pd.concat(
+        [pair_table(series, df, fx) for series, df in frames.items()],
+        ignore_index=True,
+    )
+    overview = overview_matrix(frames, fx)
+    overview_schema = pa.schema(
+        [pa.field("variable", pa.string(), nullable=False)]
+        + [pa.field(c, pa.float64()) for c in overview.columns[1:]]
+    )
+
+    os.makedirs(derived.derived_dir(), exist_ok=True)
+    written = []
+    if output.save_frame(
+        section,
+        paths[0],
+        table,
+        CORRELATION_SCHEMA,
+        sort_by=("series", "country", "currency"),
+    ):
+        written.append(CORRELATION_FILE)
+    if output.save_frame(
+        section, paths[1], overview, overview_schema, sort_by=("variable",)
+    ):
+        written.append(OVERVIEW_FILE)
+
+    if written:
+        print(f" ✅ [Correlation] 완료 ({', '.join(written)})")
+    else:
+        print(" ⏩ [Correlation] 변경 없음 (Skip)")
+    derived.record_inputs(section, inputs)
+    manifest.save_section("correlation", section)
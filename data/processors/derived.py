@@ -0,0 +1,111 @@
+# data/processors/derived.py
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import common, manifest
+
+# ---------------------------------------------------------
+# 파생 분석 공통 (상관관계 등)
+#  - 입력: 프로세서가 저장한 cleaned_*.parquet (원본이 아니라 정제 결과)
+#  - 출력: cleaned_data/derived/*.parquet
+#  - 입력 파일 해시가 매니페스트 기록과 같으면 계산 자체를 건너뜀 (데이터셋 버전 단위 캐시)
+# ---------------------------------------------------------
+DERIVED_DIRNAME = "derived"
+
+# 분석 입력: 시리즈 이름 -> 정제 결과 파일명 (확장자 제외)
+TOURISM = {
+    "inbound": "cleaned_inbound_tourism",
+    "outbound": "cleaned_outbound_tourism",
+}
+FX = "cleaned_exchange_rates"
+
+# 입출국 제한 기간 (양 끝 포함): 탄력성 모형의 더미, 예측 모형의 학습 시작 기준
+COVID_PERIOD = ("2020-03-01", "2022-12-01")
+
+
+def derived_dir():
+    return os.path.join(common.CLEAN_DIR, DERIVED_DIRNAME)
+
+
+def input_paths():
+    names = [*TOURISM.values(), FX]
+    return [os.path.join(common.CLEAN_DIR, f"{name}.parquet") for name in names]
+
+
+def inputs_current(section, paths):
+    """입력 파일 해시가 지난 실행과 같으면 True (파일이 없으면 False)"""
+    recorded = section.get("inputs", {})
+    for path in paths:
+        entry = recorded.get(os.path.basename(path))
+        if not os.path.exists(path) or not entry:
+            return False
+        if entry != manifest.file_hash(path):
+            return False
+    return True
+
+
+def outputs_current(section, inputs, outputs):
+    """입력이 지난 실행과 같고 출력 파일이 모두 있으면 True (계산 생략 가능)"""
+    return inputs_current(section, inputs) and all(
+        os.path.exists(path) for path in outputs
+    )
+
+
+def record_inputs(section, paths):
+    section["inputs"] = {
+        os.path.basename(path): manifest.file_hash(path) for path in paths
+    }
+
+
+def load_inputs():
+    """
+    정제 결과를 월 단위 공통 인덱스(빈 달 없이 연속)에 맞춰 로드.
+    반환: ({"inbound": df, "outbound": df}, fx_df) / 입력이 없으면 None
+    """
+    paths = input_paths()
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    frames = {
+        series: pd.read_parquet(path).astype("float64")
+        for series, path in zip(TOURISM, paths)
+    }
+    fx = pd.read_parquet(paths[-1]).astype("float64")
+
+    dates = fx.index
+    for df in frames.values():
+        dates = dates.union(df.index)
+    months = pd.date_range(dates.min(), dates.max(), freq="MS", name="Date")
+    frames = {series: df.reindex(months) for series, df in frames.items()}
+    return frames, fx.reindex(months)
+
+
+def log_diff(values):
+    """월간 로그 변화율 (0 이하 값과 앞뒤 결측은 NaN). 첫 행은 NaN"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.log(np.where(values > 0, values, np.nan))
+    diff = np.full_like(logs, np.nan)
+    diff[1:] = logs[1:] - logs[:-1]
+    return diff
+
+
+def paired_pearson(x, y):
+    """
+    첫 번째 축(월) 방향 피어슨 상관계수. 나머지 축은 브로드캐스트되어 한 번에 계산.
+    둘 중 하나라도 NaN인 행은 제외.
+    반환: (r, n) / 표본 2개 미만이거나 분산이 0이면 r = NaN
+    """
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=0)
+    count = np.maximum(n, 1)
+    x_mean = np.where(mask, x, 0.0).sum(axis=0) / count
+    y_mean = np.where(mask, y, 0.0).sum(axis=0) / count
+    dx = np.where(mask, x - x_mean, 0.0)
+    dy = np.where(mask, y - y_mean, 0.0)
+    sxx = (dx * dx).sum(axis=0)
+    syy = (dy * dy).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = (dx * dy).sum(axis=0) / np.sqrt(sxx * syy)
+    r = np.where((n >= 2) & (sxx > 0) & (syy > 0), np.clip(r, -1.0, 1.0), np.nan)
+    return r, n
@@ -0,0 +1,164 @@
+# data/processors/elasticity.py
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from scipy import special
+
+from . import common, derived, manifest, output, report
+
+# ---------------------------------------------------------
+# 환율 탄력성 패널 회귀 (통화가 매핑된 모든 국가, common.COUNTRY_CURRENCY)
+#  - 국가별 모형: log(관광객 수) = a + b·log(환율) + 월 더미(11) + 코로나 더미 + e
+#    b = 환율 탄력성 (환율 1% 상승 시 관광객 수 b% 변화)
+#  - 국가별 설계행렬을 (국가 x 월 x 변수) 배열로 쌓고, 배치 SVD 한 번으로 모든 국가 해를 구함
+#    (결측/0 값인 달은 행 전체를 0으로 -> 해당 국가의 적합에서 빠짐)
+#  - 코로나 기간에 유효한 달이 없는 국가는 코로나 계수를 추정할 수 없음 -> covid = NaN
+# 출력: derived/elasticity.parquet
+# ---------------------------------------------------------
+ANALYSIS_VERSION = 2
+ELASTICITY_FILE = "elasticity.parquet"
+
+MIN_OBS = 36  # 국가별 최소 표본 수 (개월)
+
+ELASTICITY_SCHEMA = pa.schema(
+    [
+        pa.field("series", pa.string(), nullable=False),
+        pa.field("country", pa.string(), nullable=False),
+        pa.field("currency", pa.string(), nullable=False),
+        pa.field("n", pa.int32(), nullable=False),
+        pa.field("elasticity", pa.float64(), nullable=False),
+        pa.field("se", pa.float64(), nullable=False),
+        pa.field("p_value", pa.float64(), nullable=False),
+        pa.field("covid", pa.float64()),
+        pa.field("r2", pa.float64(), nullable=False),
+    ]
+)
+
+
+def design_matrix(dates, log_rates):
+    """
+    (국가 x 월 x 변수) 설계행렬.
+    변수: [상수, log(환율), 2~12월 더미, 코로나 더미] / log_rates: (월 x 국가)
+    """
+    months, countries = log_rates.shape
+    month_dummies = (dates.month.to_numpy()[:, None] == np.arange(2, 13)).astype(float)
+    start, end = derived.COVID_PERIOD
+    covid = ((dates >= start) & (dates <= end)).astype(float)
+    common_part = np.column_stack([np.ones(months), month_dummies, covid])
+    x = np.empty((countries, months, common_part.shape[1] + 1))
+    x[:, :, 0] = 1.0
+    x[:, :, 1] = log_rates.T
+    x[:, :, 2:] = common_part[None, :, 1:]
+    return x
+
+
+def batched_ols(x, y):
+    """
+    국가별 OLS (x: 국가 x 월 x 변수, y: 국가 x 월). 행 전체가 0인 달은 적합에서 빠진 것과 같음.
+    배치 SVD 1번으로 계수·랭크·공분산을 모두 계산 (비어 있는 더미 컬럼은 계수 0으로 처리).
+    반환: beta (국가 x 변수), 계수 표준오차, 잔차 제곱합, 자유도
+    """
+    u, s, vt = np.linalg.svd(x, full_matrices=False)
+    tol = s.max(axis=1, keepdims=True) * max(x.shape[1:]) * np.finfo(float).eps
+    keep = s > tol
+    s_inv = np.where(keep, 1.0 / np.where(keep, s, 1.0), 0.0)
+
+    uty = np.einsum("pmk,pm->pk", u, y)
+    beta = np.einsum("pkj,pk->pj", vt, s_inv * uty)
+    resid = y - np.einsum("pmj,pj->pm", x, beta)
+    rss = (resid * resid).sum(axis=1)
+    dof = (np.abs(x).sum(axis=2) > 0).sum(axis=1) - keep.sum(axis=1)
+
+    # (X'X)^+ 대각 = sum_k (V[j,k] / s_k)^2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s2 = rss / dof
+    se = np.sqrt(s2[:, None] * np.einsum("pkj,pk->pj", vt * vt, s_inv * s_inv))
+    return beta, se, rss, dof
+
+
+def fit_series(series, df, fx):
+    """한 시리즈(입국/출국)의 국가별 탄력성 (표본 부족 국가는 제외)"""
+    pairs = [
+        (country, common.COUNTRY_CURRENCY[country])
+        for country in df.columns
+        if common.COUNTRY_CURRENCY.get(country) in fx.columns
+    ]
+    if not pairs:
+        return pd.DataFrame()
+    countries = [country for country, _ in pairs]
+    currencies = [currency for _, currency in pairs]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_counts = np.log(df[countries].where(df[countries] > 0).to_numpy())
+        log_rates = np.log(fx[currencies].where(fx[currencies] > 0).to_numpy())
+    valid = ~(np.isnan(log_counts) | np.isnan(log_rates))
+    n = valid.sum(axis=0)
+
+    x = design_matrix(df.index, np.where(valid, log_rates, 0.0))
+    x[~valid.T] = 0.0
+    y = np.where(valid, log_counts, 0.0).T
+    beta, se, rss, dof = batched_ols(x, y)
+
+    count = np.maximum(n, 1)
+    y_mean = y.sum(axis=1) / count
+    tss = (np.where(valid.T, y - y_mean[:, None], 0.0) ** 2).sum(axis=1)
+    rate_mean = (x[:, :, 1].sum(axis=1) / count)[:, None]
+    rate_var = (np.where(valid.T, x[:, :, 1] - rate_mean, 0.0) ** 2).sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = beta[:, 1] / se[:, 1]
+        r2 = 1.0 - rss / tss
+    p_value = 2.0 * special.stdtr(np.maximum(dof, 1), -np.abs(t))
+    # 코로나 더미가 전부 0이면 batched_ols의 계수 0은 추정값이 아님 (최소 노름 해)
+    covid_identified = (x[:, :, -1] != 0).any(axis=1)
+    covid = np.where(covid_identified, beta[:, -1], np.nan)
+    ok = (n >= MIN_OBS) & (dof > 0) & (rate_var > 0) & (se[:, 1] > 0)
+
+    return pd.DataFrame(
+        {
+            "series": series,
+            "country": np.array(countries)[ok],
+            "currency": np.array(currencies)[ok],
+            "n": n[ok].astype("int32"),
+            "elasticity": beta[ok, 1],
+            "se": se[ok, 1],
+            "p_value": p_value[ok],
+            "covid": covid[ok],
+            "r2": r2[ok],
+        }
+    )
+
+
+def process(force=False, executor=None, csv=False):
+    inputs = derived.input_paths()
+    section = manifest.load_section("elasticity", ANALYSIS_VERSION)
+    path = os.path.join(derived.derived_dir(), ELASTICITY_FILE)
+    if not force and derived.outputs_current(section, inputs, [path]):
+        print(" ⏩ [Elasticity] 입력 변경 없음 (Skip)")
+        return
+
+    loaded = derived.load_inputs()
+    if loaded is None:
+        print("⚠️ [Elasticity] 정제 결과가 없습니다. 프로세서를 먼저 실행하세요.")
+        report.note(status="empty", reason="no cleaned inputs")
+        return
+    frames, fx = loaded
+
+    print("🔄 [Elasticity] 국가별 환율 탄력성 패널 회귀 중...")
+    table = pd.concat(
+        [fit_series(series, df, fx) for series, df in frames.items()],
+        ignore_index=True,
+    )
+    print(f" - 적합 국가: {len(table)}개 (표본 {MIN_OBS}개월 미만 제외)")
+
+    os.makedirs(derived.derived_dir(), exist_ok=True)
+    if output.save_frame(
+        section, path, table, ELASTICITY_SCHEMA, sort_by=("series", "country")
+    ):
+        print(f" ✅ [Elasticity] 완료 ({ELASTICITY_FILE})")
+    else:
+        print(" ⏩ [Elasticity] 변경 없음 (Skip)")
+    derived.record_inputs(section, inputs)
+    manifest.save_section("elasticity", section)
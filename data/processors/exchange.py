@@ -1,87 +1,291 @@
+import numpy as np
 import pandas as pd
+import functools
+import pyarrow as pa
 import glob
 import os
 import re
-from . import common
+from . import common, manifest, output, plans, report
 
+# 파싱 로직이 바뀌면 올려서 캐시된 중간 프레임을 무효화
+PARSER_VERSION = 3
 
-def process():
+# 파일별 파싱 결과 (일별 통계) 컬럼
+STAT_COLUMNS = ["open", "high", "low", "close", "sum", "sumsq", "count"]
+
+# 다중 해상도 저장소: cleaned_data/fx/fx_{레벨}.parquet
+#  D(일) / W(주, 월요일 시작) / M(월) / Q(분기) 별 평균·OHLC·표준편차
+FX_DIRNAME = "fx"
+FX_LEVELS = {"D": None, "W": "W-MON", "M": "MS", "Q": "QS"}
+FX_LEVEL_COLUMNS = ["mean", "open", "high", "low", "close", "std", "count"]
+
+# 날짜 패턴: 20xx.xx 또는 20xx/xx 또는 20xx-xx
+DATE_PATTERN = re.compile(r"20\d{2}[\.\-/]\d{1,2}")
+
+# 스트리밍 모드: 이 크기 이상인 파일은 청크 단위로 읽어 일별 누적값만 유지
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_ROWS = 200_000
+
+
+def _is_date_row(fields):
+    # 첫 번째 열이 날짜 형태인지 확인
+    return bool(fields) and DATE_PATTERN.match(fields[0].strip()) is not None
+
+
+def _value_columns(fields):
+    # 날짜(첫 열) + 마지막 컬럼(환율 값)
+    return [0, len(fields) - 1]
+
+
+def _detect_currency(file):
+    """파일명에서 통화 코드 추출 (없으면 None)"""
+    filename = os.path.basename(file).upper()
+    for code in ["USD", "JPY", "EUR", "CNH", "GBP"]:
+        if code in filename:
+            return code
+    return None
+
+
+def parse_file(file, stream=None, force=False):
+    """
+    환율 CSV 1개를 일별 통계 프레임으로 변환합니다. 대상이 아니면 None.
+    컬럼: (통화, [open, high, low, close, sum, sumsq, count]) / 인덱스: 일자
+    (월별 원본이면 매월 1일 한 줄씩 -> 월평균/주·분기 집계는 process()에서 계산)
+    stream=None이면 파일 크기로 자동 결정 (STREAM_THRESHOLD_BYTES 이상이면 스트리밍).
+    force=True면 저장된 파싱 플랜을 무시하고 헤더를 다시 탐색합니다.
+    """
+    # 통화 코드 추출
+    filename = os.path.basename(file).upper()
+    currency = _detect_currency(file)
+    if currency is None:
+        return None
+
+    if stream is None:
+        stream = os.path.getsize(file) >= STREAM_THRESHOLD_BYTES
+    if stream:
+        return _parse_stream(file, currency, force)
+
+    # 데이터 시작 행 찾기 (앞부분만 읽어 위치 확인 후 날짜/값 컬럼만 파싱)
+    data, _ = plans.read_block(
+        "exchange", file, _is_date_row, usecols=_value_columns, force=force
+    )
+    if data is None:
+        print(f"⚠️ [Exchange] 날짜 패턴을 찾을 수 없음: {filename}")
+        return None
+
+    return _finish_stats(_accumulate_chunk(data), currency)
+
+
+def _accumulate_chunk(chunk):
+    """청크 1개를 일별 (open, high, low, close, sum, sumsq, count)로 요약"""
+    # 날짜 포맷 통일 (2014/03 -> 2014-03-01)
+    dates = chunk[0].str.strip().str.replace(r"[./]", "-", regex=True)
+    dates = dates.where(dates.str.len() > 7, dates + "-01")
+    dates = pd.to_datetime(dates, errors="coerce")
+
+    # 마지막 컬럼을 환율 값으로 가정
+    vals = pd.to_numeric(chunk.iloc[:, -1].str.replace(",", ""), errors="coerce")
+    valid = (dates.notna() & vals.notna()).values
+
+    # 일 키는 numpy datetime64[D]로 (Timestamp 객체 박싱 비용 회피)
+    days = dates.values[valid].astype("datetime64[D]")
+    vals = vals[valid]
+    stats = vals.groupby(days).agg(["first", "max", "min", "last", "sum", "count"])
+    stats.columns = STAT_COLUMNS[:4] + ["sum", "count"]
+    stats["sumsq"] = (vals * vals).groupby(days).sum()
+    return stats
+
+
+def _merge_stats(parts):
+    """
+    파일 순서대로 읽은 청크별 요약을 한 번에 합침 (open은 앞쪽, close는 뒤쪽 값).
+    청크 경계에 걸친 날만 여러 행이 되므로 합치기 전 크기도 '일 수 + 청크 수' 수준
+    """
+    return (
+        pd.concat(parts)
+        .groupby(level=0)
+        .agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "sum": "sum",
+                "count": "sum",
+                "sumsq": "sum",
+            }
+        )
+    )
+
+
+def _finish_stats(acc, currency):
+    if acc is None or acc.empty:
+        return None
+    acc = acc.sort_index()[STAT_COLUMNS]
+    acc.index = pd.DatetimeIndex(acc.index.values.astype("datetime64[ns]"), name="Date")
+    acc.columns = pd.MultiIndex.from_product([[currency], STAT_COLUMNS])
+    return acc
+
+
+def _parse_stream(file, currency, force=False):
+    """
+    대용량(일별/분 단위) 환율 파일용 스트리밍 파서.
+    청크마다 일별 요약만 만들어 두고 마지막에 합치므로 메모리는 파일 크기와 무관하게 '일 수'에만 비례합니다.
+    결과는 parse_file()의 일반 경로와 동일합니다.
+    """
+    plan = plans.resolve(
+        "exchange", file, _is_date_row, usecols=_value_columns, force=force
+    )
+    if plan is None:
+        print(f"⚠️ [Exchange] 날짜 패턴을 찾을 수 없음: {os.path.basename(file)}")
+        return None
+
+    parts = []
+    reader = pd.read_csv(
+        file,
+        encoding=plan["encoding"],
+        header=None,
+        skiprows=plan["skiprows"],
+        usecols=plan["usecols"],
+        dtype=str,
+        chunksize=STREAM_CHUNK_ROWS,
+    )
+    for chunk in reader:
+        parts.append(_accumulate_chunk(chunk))
+
+    # 청크마다 누적본 전체를 다시 그룹핑하지 않고 마지막에 한 번만 합침 (청크 수에 선형)
+    return _finish_stats(_merge_stats(parts) if parts else None, currency)
+
+
+def _long_stats(daily):
+    """(일자 x (통화, 통계)) -> (통화, 일자) 행의 long 프레임"""
+    long_df = daily.stack(level=0, future_stack=True).dropna(subset=["count"])
+    long_df.index.names = ["Date", "currency"]
+    return long_df.swaplevel().sort_index()
+
+
+def aggregate_level(daily_long, rule):
+    """
+    일별 통계 -> 한 해상도(rule)의 (date, currency, mean, open, high, low, close, std, count).
+    평균/표준편차는 원본 관측치 기준 (sum, sumsq, count로 계산).
+    """
+    if rule is None:
+        stats = daily_long
+    else:
+        period = pd.Grouper(level="Date", freq=rule, label="left", closed="left")
+        stats = (
+            daily_long.groupby([pd.Grouper(level="currency"), period])
+            .agg(
+                {
+                    "open": "first",
+                    "high": "max",
+                    "low": "min",
+                    "close": "last",
+                    "sum": "sum",
+                    "sumsq": "sum",
+                    "count": "sum",
+                }
+            )
+            .query("count > 0")
+        )
+
+    n = stats["count"]
+    mean = stats["sum"] / n
+    var = (stats["sumsq"] - stats["sum"] * mean) / (n - 1).where(n > 1)
+    level = pd.DataFrame(
+        {
+            "mean": mean,
+            "open": stats["open"],
+            "high": stats["high"],
+            "low": stats["low"],
+            "close": stats["close"],
+            "std": np.sqrt(var.clip(lower=0)),
+            "count": n.astype("int64"),
+        }
+    )
+    level = level.reset_index().rename(columns={"Date": "date"})
+    return level[["date", "currency", *FX_LEVEL_COLUMNS]]
+
+
+def monthly_mean(daily_long):
+    """월평균 wide 프레임 (Date x 통화) -> cleaned_exchange_rates"""
+    level = aggregate_level(daily_long, "MS")
+    wide = level.pivot(index="date", columns="currency", values="mean")
+    wide.index.name = "Date"
+    wide.columns.name = None
+    # resample("MS")처럼 빈 달도 NaN 행으로 유지
+    return wide.sort_index().asfreq("MS")
+
+
+def fx_dir():
+    return os.path.join(common.CLEAN_DIR, FX_DIRNAME)
+
+
+def save_levels(section, daily_long):
+    """D/W/M/Q 레벨별 (date, currency, mean, OHLC, std, count) Parquet 저장"""
+    os.makedirs(fx_dir(), exist_ok=True)
+    written = []
+    for level, rule in FX_LEVELS.items():
+        table = aggregate_level(daily_long, rule)
+        value_type = output.rate_type(table[FX_LEVEL_COLUMNS[:-1]])
+        schema = pa.schema(
+            [
+                pa.field("date", pa.timestamp("ns"), nullable=False),
+                pa.field("currency", pa.string(), nullable=False),
+                *[pa.field(c, value_type) for c in FX_LEVEL_COLUMNS[:-1]],
+                pa.field("count", pa.int32()),
+            ]
+        )
+        path = os.path.join(fx_dir(), f"fx_{level}.parquet")
+        if output.save_frame(section, path, table, schema):
+            written.append(level)
+    if written:
+        print(f" ✅ [Exchange] 다중 해상도 저장: {', '.join(written)}")
+
+
+def process(force=False, executor=None, csv=False, stream=None):
     search_path = os.path.join(common.RAW_EXCHANGE_DIR, "*.csv")
-    files = glob.glob(search_path)
+    files = sorted(glob.glob(search_path))
 
     if not files:
         print(f"⚠️ [Exchange] 파일이 없습니다: {common.RAW_EXCHANGE_DIR}")
+        report.note(status="empty", reason="no input files")
         return
 
     print(f"🔄 [Exchange] {len(files)}개 파일 처리 중...")
-    final_df = pd.DataFrame()
-
-    # 날짜 패턴: 20xx.xx 또는 20xx/xx 또는 20xx-xx
-    date_pattern = re.compile(r"20\d{2}[\.\-/]\d{1,2}")
-
-    for file in files:
-        try:
-            # 통화 코드 추출
-            filename = os.path.basename(file).upper()
-            currency = "UNKNOWN"
-            for code in ["USD", "JPY", "EUR", "CNH", "GBP"]:
-                if code in filename:
-                    currency = code
-                    break
-            if currency == "UNKNOWN":
-                continue
-
-            try:
-                df = pd.read_csv(file, encoding="utf-8-sig", header=None)
-            except:
-                df = pd.read_csv(file, encoding="cp949", header=None)
-
-            # 데이터 시작 행 찾기 (수정된 부분)
-            start_row = -1
-            for i, row in df.iterrows():
-                # 첫 번째 열이 날짜 형태인지 확인
-                val = str(row[0]).strip()
-                if date_pattern.match(val):
-                    start_row = i
-                    break
-
-            if start_row == -1:
-                print(f"⚠️ [Exchange] 날짜 패턴을 찾을 수 없음: {filename}")
-                continue
-
-            # 데이터 정제
-            data = df.iloc[start_row:].copy()
-            # 날짜 포맷 통일 (2014/03 -> 2014-03-01)
-            dates = data[0].astype(str).str.replace(".", "-").str.replace("/", "-")
-            dates = dates.apply(lambda x: x + "-01" if len(x) <= 7 else x)
-
-            data.index = pd.to_datetime(dates, errors="coerce")
-            data.index.name = "Date"
-            data = data[~data.index.isna()]  # 유효하지 않은 날짜 제거
-
-            # 마지막 컬럼을 환율 값으로 가정
-            vals = pd.to_numeric(
-                data.iloc[:, -1].astype(str).str.replace(",", ""), errors="coerce"
-            )
-
-            # 월 단위로 리샘플링 (일별 데이터일 경우 대비)
-            vals = vals.resample("MS").mean()
+    # stream: None(크기 기준 자동) / True(항상 스트리밍)
+    parse_fn = functools.partial(parse_file, stream=stream, force=force)
+    frames, section = manifest.collect(
+        "exchange", "Exchange", files, parse_fn, PARSER_VERSION, force, executor
+    )
 
-            temp_df = pd.DataFrame({currency: vals})
+    daily_frames = []
+    seen = set()
+    for temp_df in frames:
+        # 같은 통화 파일이 여러 개면 먼저 읽힌 파일만 사용
+        currencies = set(temp_df.columns.get_level_values(0))
+        overlap = sorted(currencies & seen)
+        if overlap:
+            print(f"⚠️ [Exchange] 중복 통화 건너뜀: {', '.join(overlap)}")
+            continue
+        seen |= currencies
+        daily_frames.append(temp_df)
 
-            if final_df.empty:
-                final_df = temp_df
-            else:
-                final_df = final_df.join(temp_df, how="outer")
-
-        except Exception as e:
-            print(f"❌ [Exchange] Error {os.path.basename(file)}: {e}")
-
-    if not final_df.empty:
-        final_df.sort_index().to_csv(
-            os.path.join(common.CLEAN_DIR, "cleaned_exchange_rates.csv"),
-            encoding="utf-8-sig",
+    if daily_frames:
+        daily_long = _long_stats(pd.concat(daily_frames, axis=1).sort_index())
+        final_df = monthly_mean(daily_long)
+        output.save(
+            section,
+            "Exchange",
+            "cleaned_exchange_rates",
+            final_df,
+            output.rate_type(final_df),
+            csv,
+            series="exchange",
         )
-        print(" ✅ [Exchange] 완료")
+        save_levels(section, daily_long)
     else:
         print("⚠️ [Exchange] 결과 데이터가 없습니다.")
+        report.note(status="empty", reason="no rows parsed")
+
+    manifest.save_section("exchange", section)
@@ -0,0 +1,297 @@
+# data/processors/forecast.py
+import contextlib
+import os
+import signal
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+from . import derived, manifest, output, report
+
+# ---------------------------------------------------------
+# 시계열 예측: 입국/출국 모든 컬럼 + 통화별 환율, 향후 HORIZON개월
+#  - 모형: ETS (가법 오차, 감쇠 가법 추세) / 관광은 log1p 변환 + 12개월 가법 계절성
+#  - 관광은 코로나 이후(COVID_PERIOD 다음 달부터)만 학습 -> 급감 구간이 추세를 왜곡하지 않게
+#  - 시리즈 1개 = 작업 1개, 프로세스 풀에서 병렬 적합 + 시리즈별 시간 제한(FIT_TIMEOUT)
+#  - 예측값마다 원본 정제 결과의 해시(version)를 함께 저장 -> 앱은 현재 데이터로 만든 예측만 사용
+#  - 데이터셋 단위 증분: version이 지난 실행과 같은 데이터셋은 기존 예측을 그대로 재사용
+# 출력: derived/forecast.parquet (series, column, date, mean, lower, upper, version)
+# ---------------------------------------------------------
+ANALYSIS_VERSION = 1
+FORECAST_FILE = "forecast.parquet"
+
+HORIZON = 12
+SEASONAL_PERIODS = 12
+MIN_OBS = 2 * SEASONAL_PERIODS  # 계절성 추정에 필요한 최소 연속 표본 (개월)
+ALPHA = 0.05  # 95% 예측구간
+FIT_TIMEOUT = 30  # 시리즈 1개 적합 시간 제한 (초)
+MAX_ITER = 500
+VERSION_CHARS = 16
+
+FORECAST_SCHEMA = pa.schema(
+    [
+        pa.field("series", pa.string(), nullable=False),
+        pa.field("column", pa.string(), nullable=False),
+        pa.field("date", pa.timestamp("ns"), nullable=False),
+        pa.field("mean", pa.float64(), nullable=False),
+        pa.field("lower", pa.float64(), nullable=False),
+        pa.field("upper", pa.float64(), nullable=False),
+        pa.field("version", pa.string(), nullable=False),
+    ]
+)
+
+
+class FitTimeout(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """
+    워커 안에서 적합 시간 제한 (SIGALRM). 시그널을 쓸 수 없는 환경(Windows 등)에서는
+    process()의 전체 대기 시간 제한만 적용됨
+    """
+    usable = hasattr(signal, "SIGALRM") and (
+        threading.current_thread() is threading.main_thread()
+    )
+    if not usable:
+        yield
+        return
+
+    def _raise(signum, frame):
+        raise FitTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _raise)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def fit_window(values, dates, seasonal):
+    """
+    학습 구간: 마지막 값이 데이터셋 마지막 달인 연속 구간 (관광은 코로나 이후만).
+    반환: (values, dates) / 조건을 만족하지 못하면 None
+    """
+    valid = ~np.isnan(values)
+    if seasonal:
+        valid &= dates > pd.Timestamp(derived.COVID_PERIOD[1])
+    if not valid[-1]:
+        return None
+    gaps = np.flatnonzero(~valid)
+    start = gaps[-1] + 1 if len(gaps) else 0
+    if len(values) - start < MIN_OBS:
+        return None
+    return values[start:], dates[start:]
+
+
+def fit_one(series, column, dates, values, seasonal):
+    """
+    시리즈 1개 적합 + 예측 (워커 프로세스에서 실행되므로 모듈 레벨 함수).
+    반환: (series, column, 예측 DataFrame 또는 None, 상태, 소요 시간)
+    """
+    start = time.perf_counter()
+    window = fit_window(values, dates, seasonal)
+    if window is None:
+        return series, column, None, "short", 0.0
+    values, dates = window
+    y = pd.Series(np.log1p(values) if seasonal else np.log(values), index=dates)
+    y.index.freq = "MS"
+
+    try:
+        with time_limit(FIT_TIMEOUT), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model = ETSModel(
+                y,
+                error="add",
+                trend="add",
+                damped_trend=True,
+                seasonal="add" if seasonal else None,
+                seasonal_periods=SEASONAL_PERIODS if seasonal else None,
+            )
+            result = model.fit(disp=False, maxiter=MAX_ITER)
+            frame = result.get_prediction(
+                start=len(y), end=len(y) + HORIZON - 1
+            ).summary_frame(alpha=ALPHA)
+    except FitTimeout:
+        return series, column, None, "timeout", time.perf_counter() - start
+    except Exception as e:
+        return series, column, None, f"failed: {e}", time.perf_counter() - start
+
+    inverse = np.expm1 if seasonal else np.exp
+    forecast = pd.DataFrame(
+        {
+            "date": pd.date_range(dates[-1], periods=HORIZON + 1, freq="MS")[1:],
+            "mean": inverse(frame["mean"].to_numpy()),
+            "lower": inverse(frame["pi_lower"].to_numpy()),
+            "upper": inverse(frame["pi_upper"].to_numpy()),
+        }
+    )
+    if seasonal:
+        # 인원수는 음수가 될 수 없음
+        forecast[["mean", "lower", "upper"]] = forecast[
+            ["mean", "lower", "upper"]
+        ].clip(lower=0)
+    elapsed = time.perf_counter() - start
+    if not np.isfinite(forecast[["mean", "lower", "upper"]].to_numpy()).all():
+        return series, column, None, "failed: non-finite forecast", elapsed
+    return series, column, forecast, "ok", elapsed
+
+
+def load_sources():
+    """
+    정제 결과를 데이터셋별 월 인덱스 그대로 로드 (예측은 각 데이터셋의 마지막 달부터).
+    반환: {series: (df, 계절성 여부, version)} / 입력이 없으면 None
+    """
+    paths = derived.input_paths()
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    sources = {}
+    for series, path in zip([*derived.TOURISM, "exchange"], paths):
+        df = pd.read_parquet(path).astype("float64").asfreq("MS")
+        version = manifest.file_hash(path)[:VERSION_CHARS]
+        sources[series] = (df, series != "exchange", version)
+    return sources
+
+
+def _terminate(executor):
+    """
+    전용 풀의 워커를 강제 종료 (시간 제한을 넘긴 적합이 계속 CPU를 쓰지 않게).
+    ProcessPoolExecutor는 3.14 전까지 공개 API가 없어 워커 프로세스를 직접 종료
+    """
+    terminate_workers = getattr(executor, "terminate_workers", None)
+    if terminate_workers is not None:
+        terminate_workers()
+        return
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_fits(tasks, executor=None):
+    """
+    작업을 프로세스 풀에서 적합. executor가 없으면 이 단계 전용 풀을 만듦.
+    워커 안 시간 제한과 별도로, 전체 대기 시간이 한도를 넘으면 남은 작업은 timeout 처리
+    (전용 풀은 워커를 종료, 공유 풀은 대기 중인 작업만 취소하고 실행 중인 적합은 워커 안 제한으로 끝남)
+    """
+    own_pool = executor is None
+    # 공유 풀은 워커 수를 알 수 없으므로 1개로 보고 넉넉하게 대기
+    workers = min(len(tasks), os.cpu_count() or 1) if own_pool else 1
+    if own_pool:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    futures = {executor.submit(fit_one, *task): task for task in tasks}
+    budget = FIT_TIMEOUT * (len(tasks) // workers + 2)
+    done, pending = wait(futures, timeout=budget)
+
+    results = [future.result() for future in done]
+    for future in pending:
+        future.cancel()
+        series, column = futures[future][:2]
+        results.append((series, column, None, "timeout", float(budget)))
+    if own_pool:
+        if pending:
+            _terminate(executor)
+        else:
+            executor.shutdown()
+    return results
+
+
+def _reusable(section, sources, path):
+    """
+    지난 실행과 version이 같은 데이터셋의 기존 예측 행 (다시 적합하지 않음).
+    반환: (재사용 데이터셋 집합, 기존 예측 DataFrame 또는 None)
+    """
+    recorded = section.get("versions", {})
+    current = {
+        series
+        for series, (_, _, version) in sources.items()
+        if recorded.get(series) == version
+    }
+    if not current or not os.path.exists(path):
+        return set(), None
+    try:
+        previous = pd.read_parquet(path, filters=[("series", "in", sorted(current))])
+    except Exception:
+        return set(), None  # 손상/스키마 변경 -> 전체 다시 적합
+    versions = {series: sources[series][2] for series in current}
+    previous = previous[previous["version"] == previous["series"].map(versions)]
+    return current, previous
+
+
+def process(force=False, executor=None, csv=False):
+    inputs = derived.input_paths()
+    section = manifest.load_section("forecast", ANALYSIS_VERSION)
+    path = os.path.join(derived.derived_dir(), FORECAST_FILE)
+    if not force and derived.outputs_current(section, inputs, [path]):
+        print(" ⏩ [Forecast] 입력 변경 없음 (Skip)")
+        return
+
+    sources = load_sources()
+    if sources is None:
+        print("⚠️ [Forecast] 정제 결과가 없습니다. 프로세서를 먼저 실행하세요.")
+        report.note(status="empty", reason="no cleaned inputs")
+        return
+
+    kept, previous = (set(), None) if force else _reusable(section, sources, path)
+    if kept:
+        print(f" ⏩ [Forecast] 변경 없는 데이터셋 재사용: {', '.join(sorted(kept))}")
+
+    tasks = [
+        (series, str(column), df.index, df[column].to_numpy(), seasonal)
+        for series, (df, seasonal, _) in sources.items()
+        if series not in kept
+        for column in df.columns
+    ]
+    results = []
+    if tasks:
+        print(f"🔄 [Forecast] {len(tasks)}개 시리즈 {HORIZON}개월 예측 중...")
+        results = run_fits(tasks, executor)
+
+    frames = [] if previous is None or previous.empty else [previous]
+    status = {}
+    for series, column, forecast, state, _ in sorted(results, key=lambda r: r[:2]):
+        key = state.split(":")[0]
+        status[key] = status.get(key, 0) + 1
+        if key == "failed":
+            print(f"  ⚠️ [Forecast] {series}/{column} 적합 실패 ({state[8:]})")
+        if forecast is not None:
+            frames.append(
+                forecast.assign(
+                    series=series, column=column, version=sources[series][2]
+                )
+            )
+    if status:
+        print(
+            " - "
+            + " / ".join(f"{key} {count}개" for key, count in sorted(status.items()))
+        )
+    report.note(fits=status, reused=sorted(kept))
+    if not frames:
+        print("⚠️ [Forecast] 예측할 수 있는 시리즈가 없습니다.")
+        return
+    table = pd.concat(frames, ignore_index=True)
+
+    os.makedirs(derived.derived_dir(), exist_ok=True)
+    if output.save_frame(
+        section,
+        path,
+        table,
+        FORECAST_SCHEMA,
+        sort_by=("series", "column", "date"),
+    ):
+        print(f" ✅ [Forecast] 완료 ({FORECAST_FILE})")
+    else:
+        print(" ⏩ [Forecast] 변경 없음 (Skip)")
+    derived.record_inputs(section, inputs)
+    section["versions"] = {
+        series: version for series, (_, _, version) in sources.items()
+    }
+    manifest.save_section("forecast", section)
@@ -1,104 +1,113 @@
 # data/processors/inbound.py
 import pandas as pd
+import functools
 import glob
 import os
 import re
-from . import common
+from . import common, manifest, output, plans, report
 
+# 파싱 로직이 바뀌면 올려서 캐시된 중간 프레임을 무효화
+PARSER_VERSION = 2
 
-def process():
+# "YYYY년 M월" 또는 숫자형태 (헤더의 날짜 컬럼)
+DATE_COLUMN = re.compile(r"(\d{4})[^\d]*(\d{1,2})")
+
+# 국가가 아닌 행 (삭제 대상)
+DROP_LABELS = ["nan", "0.0", "성별", "전년동기", "성장률", "구성비", "인원(명)"]
+
+
+def _is_header(fields):
+    return "국적" in " ".join(fields)
+
+
+def _header_columns(fields):
+    """국적 컬럼 + 날짜 컬럼만 읽음 (합계 '계' 등은 파싱하지 않음)"""
+    return [0] + [
+        i for i, val in enumerate(fields) if "국적" in val or DATE_COLUMN.search(val)
+    ]
+
+
+def parse_file(file, force=False):
+    """원본 CSV 1개를 (Date x 국가) 프레임으로 변환합니다. 데이터가 없으면 None."""
+    # 1. 헤더 찾기 (같은 레이아웃의 플랜이 있으면 탐색 없이 바로 파싱)
+    df, _ = plans.read_block(
+        "inbound", file, _is_header, usecols=_header_columns, force=force
+    )
+    if df is None:
+        return None
+
+    df.columns = df.iloc[0]
+    df = df.iloc[1:]
+
+    # 인덱스 설정
+    country_col = next((c for c in df.columns if "국적" in str(c)), df.columns[0])
+    df = df.set_index(country_col)
+
+    # 2. Transpose
+    df_t = df.T
+
+    # 3. 날짜 파싱
+    idx_series = df_t.index.astype(str).to_series()
+    # "YYYY년 M월" 또는 숫자형태 추출
+    date_matches = idx_series.str.extract(DATE_COLUMN)
+
+    valid_indices = date_matches.dropna(subset=[0, 1]).index
+    df_t = df_t.loc[valid_indices].copy()
+    date_matches = date_matches.loc[valid_indices]
+
+    years = date_matches[0]
+    months = date_matches[1].str.zfill(2)
+    df_t.index = pd.to_datetime(years + "-" + months + "-01", errors="coerce")
+    df_t.index.name = "Date"
+
+    # 4. 컬럼 정제 및 영문 매핑
+    column_rename_map = {}
+    columns_to_drop = []
+
+    for col in df_t.columns:
+        k_name = str(col).strip()
+        k_name_clean = k_name.replace(" ", "")  # 공백 제거
+
+        # 삭제 조건 / 매핑 (공백 제거된 키로 검색)
+        if k_name_clean in DROP_LABELS:
+            columns_to_drop.append(col)
+        else:
+            column_rename_map[col] = common.COUNTRY_MAP.get(k_name_clean, k_name_clean)
+
+    df_t = df_t.drop(columns=columns_to_drop, errors="ignore").rename(
+        columns=column_rename_map
+    )
+
+    # 5. 숫자 변환
+    for col in df_t.columns:
+        df_t[col] = pd.to_numeric(
+            df_t[col].astype(str).str.replace(",", "").str.replace("-", "0"),
+            errors="coerce",
+        ).fillna(0)
+
+    return df_t
+
+
+def process(force=False, executor=None, csv=False):
     search_path = os.path.join(common.RAW_INBOUND_DIR, "*.csv")
-    files = glob.glob(search_path)
+    files = sorted(glob.glob(search_path))
 
     if not files:
         print(f"⚠️ [Inbound] 파일이 없습니다: {common.RAW_INBOUND_DIR}")
+        report.note(status="empty", reason="no input files")
         return
 
     print(f"🔄 [Inbound] {len(files)}개 파일 처리 중...")
-    all_dfs = []
-
-    for file in files:
-        try:
-            try:
-                df_raw = pd.read_csv(file, encoding="cp949", header=None)
-            except:
-                df_raw = pd.read_csv(file, encoding="utf-8-sig", header=None)
-
-            # 1. 헤더 찾기
-            header_idx = -1
-            for i, row in df_raw.iterrows():
-                if "국적" in " ".join(row.astype(str).values):
-                    header_idx = i
-                    break
-            if header_idx == -1:
-                continue
-
-            df = df_raw.iloc[header_idx:].copy()
-            df.columns = df.iloc[0]
-            df = df.iloc[1:]
-
-            # 인덱스 설정
-            country_col = next(
-                (c for c in df.columns if "국적" in str(c)), df.columns[0]
-            )
-            df = df.set_index(country_col)
-
-            # 2. Transpose
-            df_t = df.T
-
-            # 3. 날짜 파싱
-            idx_series = df_t.index.astype(str).to_series()
-            # "YYYY년 M월" 또는 숫자형태 추출
-            date_matches = idx_series.str.extract(r"(\d{4})[^\d]*(\d{1,2})")
-
-            valid_indices = date_matches.dropna(subset=[0, 1]).index
-            df_t = df_t.loc[valid_indices].copy()
-            date_matches = date_matches.loc[valid_indices]
-
-            years = date_matches[0]
-            months = date_matches[1].str.zfill(2)
-            df_t.index = pd.to_datetime(years + "-" + months + "-01", errors="coerce")
-            df_t.index.name = "Date"
-
-            # 4. 컬럼 정제 및 영문 매핑
-            column_rename_map = {}
-            columns_to_drop = []
-
-            for col in df_t.columns:
-                k_name = str(col).strip()
-                k_name_clean = k_name.replace(" ", "")  # 공백 제거
-
-                # 삭제 조건
-                if k_name_clean in [
-                    "nan",
-                    "0.0",
-                    "성별",
-                    "전년동기",
-                    "성장률",
-                    "구성비",
-                    "인원(명)",
-                ]:
-                    columns_to_drop.append(col)
-                    continue
-
-                # 매핑 (공백 제거된 키로 검색)
-                e_name = common.COUNTRY_MAP.get(k_name_clean, k_name_clean)
-                column_rename_map[col] = e_name
-
-            df_t = df_t.drop(columns=columns_to_drop, errors="ignore").rename(
-                columns=column_rename_map
-            )
-
-            # 5. 숫자 변환
-            for col in df_t.columns:
-                df_t[col] = pd.to_numeric(
-                    df_t[col].astype(str).str.replace(",", "").str.replace("-", "0"),
-                    errors="coerce",
-                ).fillna(0)
-
-            all_dfs.append(df_t)
-        except Exception as e:
-            print(f"❌ [Inbound] Error {os.path.basename(file)}: {e}")
+    all_dfs, section = manifest.collect(
+        "inbound",
+        "Inbound",
+        files,
+        functools.partial(parse_file, force=force),
+        PARSER_VERSION,
+        force,
+        executor,
+        rules=(common.COUNTRY_MAP, DROP_LABELS),
+    )
 
     if all_dfs:
         final_df = pd.concat(all_dfs).sort_index()
@@ -111,8 +120,17 @@ def process():
         # nan 컬럼 제거
         final_df = final_df.loc[:, ~final_df.columns.str.lower().isin(["nan", "none"])]
 
-        save_path = os.path.join(common.CLEAN_DIR, "cleaned_inbound_tourism.csv")
-        final_df.to_csv(save_path, encoding="utf-8-sig")
-        print(" ✅ [Inbound] 완료")
+        output.save(
+            section,
+            "Inbound",
+            "cleaned_inbound_tourism",
+            final_df,
+            output.count_type(final_df),
+            csv,
+            series="inbound",
+        )
     else:
         print("⚠️ [Inbound] 결과 데이터가 없습니다.")
+        report.note(status="empty", reason="no rows parsed")
+
+    manifest.save_section("inbound", section)
@@ -0,0 +1,178 @@
+# data/processors/lagcorr.py
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from . import derived, manifest, output, report
+
+# ---------------------------------------------------------
+# 시차 상관관계 (lead/lag): 국가 x 통화, 시차 -MAX_LAG ~ +MAX_LAG 개월
+#  - lag k > 0 : 환율이 k개월 먼저 움직임 (관광[t] vs 환율[t-k])
+#  - lag k < 0 : 관광이 먼저 움직임 (관광[t] vs 환율[t+|k|])
+#  - level(수준) / logdiff(월간 로그 변화율) 두 가지
+#  - 시차 1개당 (월 x 국가 x 통화) 배열 연산 1번, 쌍마다 둘 다 값이 있는 달만 사용
+# 출력: derived/lag_correlation.parquet (시차별 곡선), derived/lag_peak.parquet (쌍별 최대 |r| 시차)
+# ---------------------------------------------------------
+ANALYSIS_VERSION = 1
+LAG_FILE = "lag_correlation.parquet"
+PEAK_FILE = "lag_peak.parquet"
+
+MAX_LAG = 24
+MIN_PERIODS = 24  # 피크 후보가 되려면 필요한 최소 공통 표본 수 (개월)
+METHODS = ("level", "logdiff")
+
+KEY_FIELDS = [
+    pa.field("series", pa.string(), nullable=False),
+    pa.field("method", pa.string(), nullable=False),
+    pa.field("country", pa.string(), nullable=False),
+    pa.field("currency", pa.string(), nullable=False),
+]
+LAG_SCHEMA = pa.schema(
+    KEY_FIELDS
+    + [
+        pa.field("lag", pa.int16(), nullable=False),
+        pa.field("n", pa.int32(), nullable=False),
+        pa.field("r", pa.float64()),
+    ]
+)
+PEAK_SCHEMA = pa.schema(
+    KEY_FIELDS
+    + [
+        pa.field("peak_lag", pa.int16(), nullable=False),
+        pa.field("peak_r", pa.float64(), nullable=False),
+        pa.field("n", pa.int32(), nullable=False),
+        pa.field("r_lag0", pa.float64()),
+    ]
+)
+
+
+def shift_rows(values, lag):
+    """행(월) 방향 shift. lag > 0 이면 과거 값을 아래로 내림 (앞쪽은 NaN)"""
+    shifted = np.full_like(values, np.nan)
+    if lag > 0:
+        shifted[lag:] = values[:-lag]
+    elif lag < 0:
+        shifted[:lag] = values[-lag:]
+    else:
+        shifted[:] = values
+    return shifted
+
+
+def lag_scan(values, rates, max_lag=MAX_LAG):
+    """
+    (월 x 국가) 관광, (월 x 통화) 환율 -> 시차별 상관계수.
+    반환: lags, r (시차 x 국가 x 통화), n (같은 모양)
+    """
+    lags = np.arange(-max_lag, max_lag + 1)
+    r = np.empty((len(lags), values.shape[1], rates.shape[1]))
+    n = np.empty(r.shape, dtype="int64")
+    for i, lag in enumerate(lags):
+        r[i], n[i] = derived.paired_pearson(
+            values[:, :, None], shift_rows(rates, lag)[:, None, :]
+        )
+    return lags, r, n
+
+
+def peak_lags(lags, r, n):
+    """쌍별 |r|이 가장 큰 시차 (표본 MIN_PERIODS개 이상인 시차만 후보). 후보가 없으면 valid=False"""
+    strength = np.where((n >= MIN_PERIODS) & ~np.isnan(r), np.abs(r), -1.0)
+    best = strength.argmax(axis=0)
+    valid = strength.max(axis=0) >= 0
+    pick = np.take_along_axis
+    return (
+        lags[best],
+        pick(r, best[None], axis=0)[0],
+        pick(n, best[None], axis=0)[0],
+        valid,
+    )
+
+
+def lag_tables(series, df, fx):
+    """한 시리즈(입국/출국)의 (시차 곡선, 피크) long 프레임"""
+    countries = df.columns.astype(str).to_numpy()
+    currencies = fx.columns.astype(str).to_numpy()
+    curves, peaks = [], []
+    for method in METHODS:
+        values, rates = df.to_numpy(), fx.to_numpy()
+        if method == "logdiff":
+            values, rates = derived.log_diff(values), derived.log_diff(rates)
+        lags, r, n = lag_scan(values, rates)
+
+        # (시차, 국가, 통화) 격자를 펼쳐서 long 형태로
+        grid = np.meshgrid(lags, countries, currencies, indexing="ij")
+        curves.append(
+            pd.DataFrame(
+                {
+                    "series": series,
+                    "method": method,
+                    "country": grid[1].ravel(),
+                    "currency": grid[2].ravel(),
+                    "lag": grid[0].ravel().astype("int16"),
+                    "n": n.ravel().astype("int32"),
+                    "r": r.ravel(),
+                }
+            )
+        )
+
+        peak_lag, peak_r, peak_n, valid = peak_lags(lags, r, n)
+        grid = np.meshgrid(countries, currencies, indexing="ij")
+        peaks.append(
+            pd.DataFrame(
+                {
+                    "series": series,
+                    "method": method,
+                    "country": grid[0][valid],
+                    "currency": grid[1][valid],
+                    "peak_lag": peak_lag[valid].astype("int16"),
+                    "peak_r": peak_r[valid],
+                    "n": peak_n[valid].astype("int32"),
+                    "r_lag0": r[lags == 0][0][valid],
+                }
+            )
+        )
+    return pd.concat(curves, ignore_index=True), pd.concat(peaks, ignore_index=True)
+
+
+def process(force=False, executor=None, csv=False):
+    inputs = derived.input_paths()
+    section = manifest.load_section("lagcorr", ANALYSIS_VERSION)
+    paths = [
+        os.path.join(derived.derived_dir(), name) for name in [LAG_FILE, PEAK_FILE]
+    ]
+    if not force and derived.outputs_current(section, inputs, paths):
+        print(" ⏩ [LagCorr] 입력 변경 없음 (Skip)")
+        return
+
+    loaded = derived.load_inputs()
+    if loaded is None:
+        print("⚠️ [LagCorr] 정제 결과가 없습니다. 프로세서를 먼저 실행하세요.")
+        report.note(status="empty", reason="no cleaned inputs")
+        return
+    frames, fx = loaded
+
+    print(
+        f"🔄 [LagCorr] 시차 -{MAX_LAG}~+{MAX_LAG}개월 x "
+        f"{sum(df.shape[1] for df in frames.values()) * fx.shape[1]}쌍 계산 중..."
+    )
+    tables = [lag_tables(series, df, fx) for series, df in frames.items()]
+    curves = pd.concat([t[0] for t in tables], ignore_index=True)
+    peaks = pd.concat([t[1] for t in tables], ignore_index=True)
+
+    os.makedirs(derived.derived_dir(), exist_ok=True)
+    keys = ("series", "method", "country", "currency")
+    written = []
+    if output.save_frame(
+        section, paths[0], curves, LAG_SCHEMA, sort_by=keys + ("lag",)
+    ):
+        written.append(LAG_FILE)
+    if output.save_frame(section, paths[1], peaks, PEAK_SCHEMA, sort_by=keys):
+        written.append(PEAK_FILE)
+
+    if written:
+        print(f" ✅ [LagCorr] 완료 ({', '.join(written)})")
+    else:
+        print(" ⏩ [LagCorr] 변경 없음 (Skip)")
+    derived.record_inputs(section, inputs)
+    manifest.save_section("lagcorr", section)
@@ -0,0 +1,224 @@
+# data/processors/manifest.py
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+from . import common, report
+
+# ---------------------------------------------------------
+# 증분 실행용 매니페스트
+#  - 원본 파일별 (hash, size, mtime) + 파싱 결과 프레임(캐시) 경로 기록
+#  - 최종 산출물의 내용 해시를 기록하여 변경 없으면 다시 쓰지 않음
+# ---------------------------------------------------------
+MANIFEST_NAME = "manifest.json"
+CACHE_DIRNAME = ".cache"
+
+_lock = threading.Lock()
+
+
+def manifest_path():
+    return os.path.join(common.CLEAN_DIR, MANIFEST_NAME)
+
+
+def cache_dir():
+    return os.path.join(common.CLEAN_DIR, CACHE_DIRNAME)
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """파일 내용의 sha256 (대용량 대비 청크 단위로 읽음)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def frame_hash(df, salt=""):
+    """DataFrame 내용(인덱스/컬럼/값)의 해시 (salt: 저장 타입 등 내용 외에 결과를 바꾸는 값)"""
+    h = hashlib.sha256(salt.encode("utf-8"))
+    h.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return h.hexdigest()
+
+
+def _file_stat(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime": st.st_mtime}
+
+
+def _read_all():
+    path = manifest_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # 깨진 매니페스트는 무시하고 새로 작성
+        return {}
+
+
+def rules_digest(*rules):
+    """
+    파싱 규칙 다이제스트: common의 인코딩/헤더 탐색 범위 + 프로세서별 규칙(rules, 예: 국가명 매핑).
+    규칙을 고치면 PARSER_VERSION을 올리지 않아도 캐시된 중간 프레임이 무효화됨
+    """
+    values = [common.ENCODINGS, common.HEADER_SNIFF_LINES, *rules]
+    text = json.dumps(values, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def load_section(name, version):
+    """프로세서별 섹션 로드 (파서 버전이 다르면 빈 섹션)"""
+    with _lock:
+        section = _read_all().get(name)
+    if not section or section.get("version") != version:
+        return {"version": version, "files": {}, "outputs": {}}
+    section.setdefault("files", {})
+    section.setdefault("outputs", {})
+    return section
+
+
+def save_section(name, section):
+    """자기 섹션만 갱신 (다른 프로세서가 동시에 저장해도 안전하도록 read-merge-write)"""
+    os.makedirs(common.CLEAN_DIR, exist_ok=True)
+    with _lock:
+        data = _read_all()
+        data[name] = section
+        tmp_path = manifest_path() + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path())
+
+
+def _write_frame(name, key, digest, df):
+    if df is None:
+        return None
+    os.makedirs(cache_dir(), exist_ok=True)
+    # 파싱 결과는 파일명(통화 코드 등)에도 의존 -> 내용이 같은 파일끼리 캐시를 공유하지 않도록 경로도 포함
+    frame_key = hashlib.sha256(f"{key}\x1f{digest}".encode("utf-8")).hexdigest()
+    filename = f"{name}_{frame_key[:24]}.pkl"
+    df.to_pickle(os.path.join(cache_dir(), filename))
+    return filename
+
+
+def _read_frame(filename):
+    return pd.read_pickle(os.path.join(cache_dir(), filename))
+
+
+def _remove_frame(filename):
+    if filename:
+        try:
+            os.remove(os.path.join(cache_dir(), filename))
+        except OSError:
+            pass
+
+
+def _lookup(entry, path, stat):
+    """
+    캐시 적중 여부 확인.
+    size/mtime이 같으면 해시 계산 생략, 다르면 해시로 최종 판단.
+    반환: (적중 여부, 현재 파일 해시 or None)
+    """
+    if not entry:
+        return False, None
+    if entry["size"] == stat["size"] and entry["mtime"] == stat["mtime"]:
+        return True, entry["hash"]
+    digest = file_hash(path)
+    return digest == entry["hash"], digest
+
+
+def collect(
+    name, label, files, parse_fn, version, force=False, executor=None, rules=()
+):
+    """
+    files 각각에 대해 캐시된 프레임을 재사용하거나 parse_fn(file)로 새로 파싱합니다.
+    parse_fn은 프레임 또는 None(스킵)을 반환해야 합니다.
+    섹션 버전 = version(파서 버전) + rules_digest(rules) -> 파싱 규칙이 바뀌면 전체 재파싱.
+    executor(ProcessPoolExecutor)가 주어지면 파싱을 워커 프로세스로 분산합니다.
+    (parse_fn은 pickle 가능한 모듈 레벨 함수여야 함)
+
+    반환: (파일 순서대로 정렬된 프레임 리스트, 갱신된 섹션)
+    """
+    section = load_section(name, f"{version}-{rules_digest(*rules)}")
+    old_entries = {} if force else section["files"]
+    new_entries = {}
+    results = {}
+    misses = []
+
+    # 1. 변경 여부 판단 (캐시 적중 시 프레임 재사용)
+    for file in files:
+        key = os.path.relpath(file, common.RAW_ROOT)
+        stat = _file_stat(file)
+        entry = old_entries.get(key)
+        hit, digest = _lookup(entry, file, stat)
+        if hit:
+            try:
+                df = _read_frame(entry["frame"]) if entry["frame"] else None
+            except Exception:
+                hit = False  # 캐시 파일 손상/삭제 -> 다시 파싱
+        if hit:
+            results[file] = df
+            new_entries[key] = dict(entry, **stat)
+            report.record_file(file, "cached", df)
+        else:
+            misses.append((file, key, stat, digest))
+
+    # 2. 변경/신규 파일만 파싱 (병렬 모드면 워커에 먼저 모두 제출)
+    if executor is not None:
+        pending = [
+            executor.submit(report.timed_call, parse_fn, file)
+            for file, _, _, _ in misses
+        ]
+    else:
+        pending = [None] * len(misses)
+
+    for (file, key, stat, digest), future in zip(misses, pending):
+        try:
+            if future is not None:
+                df, metrics = future.result()
+            else:
+                df, metrics = report.timed_call(parse_fn, file)
+        except Exception as e:
+            print(f"❌ [{label}] Error {os.path.basename(file)}: {e}")
+            report.record_file(file, "failed", reason=f"{type(e).__name__}: {e}")
+            continue
+        if df is None:
+            report.record_file(file, "skipped", reason="no data", **metrics)
+        else:
+            report.record_file(file, "parsed", df, **metrics)
+        digest = digest or file_hash(file)
+        results[file] = df
+        new_entries[key] = dict(
+            stat, hash=digest, frame=_write_frame(name, key, digest, df)
+        )
+
+    # 3. 더 이상 쓰지 않는 캐시 프레임 정리
+    used_frames = {e["frame"] for e in new_entries.values()}
+    for entry in section["files"].values():
+        if entry.get("frame") not in used_frames:
+            _remove_frame(entry.get("frame"))
+
+    reused = len(files) - len(misses)
+    if reused:
+        print(f"  ♻️ [{label}] 캐시 재사용 {reused}개 / 새로 파싱 {len(misses)}개")
+
+    section["files"] = new_entries
+    frames = [results[f] for f in files if results.get(f) is not None]
+    return frames, section
+
+
+def output_current(section, path, digest):
+    """기록된 산출물 해시와 같고, 파일도 그대로 남아있으면 True"""
+    entry = section["outputs"].get(os.path.basename(path))
+    if not entry or entry.get("hash") != digest or not os.path.exists(path):
+        return False
+    return entry.get("size") == os.path.getsize(path) and entry.get(
+        "mtime"
+    ) == os.path.getmtime(path)
+
+
+def record_output(section, path, digest):
+    section["outputs"][os.path.basename(path)] = dict(_file_stat(path), hash=digest)
@@ -1,113 +1,132 @@
 # data/processors/outbound.py
 import pandas as pd
+import functools
 import glob
 import os
 import re
 import numpy as np
-from . import common
+from . import common, manifest, output, plans, report
 
+# 파싱 로직이 바뀌면 올려서 캐시된 중간 프레임을 무효화
+PARSER_VERSION = 2
 
-def process():
+
+def _is_header(fields):
+    return "명수" in " ".join(fields)
+
+
+def _header_columns(fields):
+    """년/월(0, 1열) + '명수' 컬럼만 읽음 (전년대비 등은 파싱하지 않음)"""
+    return [0, 1] + [i for i, val in enumerate(fields) if "명수" in val]
+
+
+def _column_labels(country_row, metric_row):
+    """'명수' 컬럼 번호 -> 원본 국가명 키 (국가명이 비어있는 컬럼은 제외)"""
+    names = {}
+    for col, metric in metric_row.items():
+        if "명수" not in str(metric):
+            continue
+        raw_country = str(country_row[col]).strip()
+        clean_country_key = raw_country.replace(" ", "")  # 공백 제거
+
+        if clean_country_key in ["nan", "None", ""]:
+            continue
+        names[str(col)] = clean_country_key
+    return names
+
+
+def parse_file(file, force=False):
+    """원본 CSV 1개(대륙별 시트)를 (Date x 목적지) 프레임으로 변환합니다. 데이터가 없으면 None."""
+    # 1. '명수' 행(Header Row) 찾기 (좌표 기반 추출을 위해)
+    #    같은 레이아웃의 플랜이 있으면 탐색 없이 국가명 행(바로 윗줄)부터 바로 파싱
+    df_raw, plan = plans.read_block(
+        "outbound",
+        file,
+        _is_header,
+        rows_before=1,
+        usecols=_header_columns,
+        force=force,
+    )
+
+    if df_raw is None:
+        print(f"  ⏩ Skip (No Data): {os.path.basename(file)}")
+        return None
+
+    # 2. 메타데이터 행 -> 컬럼별 국가명 (레이아웃마다 한 번만 계산하여 플랜에 저장)
+    #    영문 매핑은 COUNTRY_MAP 변경이 바로 반영되도록 매번 적용
+    if not plan["names"]:
+        # 명수 바로 윗줄이 국가명
+        plan["names"] = _column_labels(df_raw.iloc[0], df_raw.iloc[1])
+        plans.save("outbound", plan)
+
+    # 3. 데이터 영역 확보
+    data_part = df_raw.iloc[2:].copy()
+
+    # 4. 날짜 파싱 (0열:년, 1열:월)
+    # Series로 확실하게 변환 후 스트링 처리
+    year_series = data_part.iloc[:, 0].astype(str).str.replace(r"\D", "", regex=True)
+    year_series = year_series.replace("", pd.NA).ffill()
+
+    month_series = (
+        data_part.iloc[:, 1].astype(str).str.replace(r"\D", "", regex=True).str.zfill(2)
+    )
+
+    # 유효 날짜 마스크 생성
+    valid_months = [str(i).zfill(2) for i in range(1, 13)]
+    valid_mask = (year_series.str.len() == 4) & (month_series.isin(valid_months))
+
+    if not valid_mask.any():
+        return None
+
+    # 날짜 인덱스 생성
+    dates = pd.to_datetime(
+        year_series[valid_mask] + "-" + month_series[valid_mask] + "-01",
+        errors="coerce",
+    )
+
+    # 5. 데이터 추출 (좌표 기반, '명수' 컬럼 번호 -> 국가명)
+    extracted_data = {}
+
+    for col, country_key in plan["names"].items():
+        # 매핑 (공백 제거된 키 사용)
+        mapped_country = common.COUNTRY_MAP.get(country_key, country_key)
+
+        # 값 추출
+        vals = data_part[int(col)][valid_mask].astype(str)
+        vals = vals.str.replace(",", "").str.replace("-", "0")
+        vals = pd.to_numeric(vals, errors="coerce").fillna(0)
+
+        extracted_data[mapped_country] = vals.values
+
+    if not extracted_data:
+        return None
+
+    df_clean = pd.DataFrame(extracted_data, index=dates)
+    df_clean.index.name = "Date"
+    # 중복 날짜 제거
+    return df_clean.groupby(df_clean.index).last()
+
+
+def process(force=False, executor=None, csv=False):
     search_path = os.path.join(common.RAW_OUTBOUND_DIR, "*.csv")
-    files = glob.glob(search_path)
+    files = sorted(glob.glob(search_path))
 
     if not files:
         print(f"⚠️ [Outbound] 파일이 없습니다: {common.RAW_OUTBOUND_DIR}")
+        report.note(status="empty", reason="no input files")
         return
 
     print(f"🔄 [Outbound] {len(files)}개 파일 처리 중...")
-    all_dfs = []
-
-    for file in files:
-        try:
-            try:
-                df_raw = pd.read_csv(file, encoding="utf-8-sig", header=None)
-            except:
-                df_raw = pd.read_csv(file, encoding="cp949", header=None)
-
-            # 1. '명수' 행(Header Row) 찾기 (좌표 기반 추출을 위해)
-            header_idx = -1
-            for i, row in df_raw.iterrows():
-                row_str = " ".join(row.astype(str).values)
-                if "명수" in row_str:
-                    header_idx = i
-                    break
-
-            if header_idx == -1:
-                print(f"  ⏩ Skip (No Data): {os.path.basename(file)}")
-                continue
-
-            # 2. 메타데이터 행 확보
-            metric_row = df_raw.iloc[header_idx]
-            country_row = df_raw.iloc[header_idx - 1]  # 명수 바로 윗줄이 국가명
-
-            # 3. 데이터 영역 확보
-            data_part = df_raw.iloc[header_idx + 1 :].copy()
-
-            # 4. 날짜 파싱 (0열:년, 1열:월)
-            # Series로 확실하게 변환 후 스트링 처리
-            year_series = (
-                data_part.iloc[:, 0].astype(str).str.replace(r"\D", "", regex=True)
-            )
-            year_series = year_series.replace("", pd.NA).ffill()
-
-            month_series = (
-                data_part.iloc[:, 1]
-                .astype(str)
-                .str.replace(r"\D", "", regex=True)
-                .str.zfill(2)
-            )
-
-            # 유효 날짜 마스크 생성
-            valid_months = [str(i).zfill(2) for i in range(1, 13)]
-            valid_mask = (year_series.str.len() == 4) & (
-                month_series.isin(valid_months)
-            )
-
-            if not valid_mask.any():
-                continue
-
-            # 날짜 인덱스 생성
-            dates = pd.to_datetime(
-                year_series[valid_mask] + "-" + month_series[valid_mask] + "-01",
-                errors="coerce",
-            )
-
-            # 5. 데이터 추출 (좌표 기반)
-            # '명수'가 적힌 컬럼 인덱스들을 찾음
-            count_cols_indices = [
-                i for i, val in enumerate(metric_row) if "명수" in str(val)
-            ]
-
-            extracted_data = {}
-
-            for col_idx in count_cols_indices:
-                raw_country = str(country_row.iloc[col_idx]).strip()
-                clean_country_key = raw_country.replace(" ", "")  # 공백 제거
-
-                # 매핑 (공백 제거된 키 사용)
-                if clean_country_key in ["nan", "None", ""]:
-                    continue
-                mapped_country = common.COUNTRY_MAP.get(
-                    clean_country_key, clean_country_key
-                )
-
-                # 값 추출
-                vals = data_part.iloc[:, col_idx][valid_mask].astype(str)
-                vals = vals.str.replace(",", "").str.replace("-", "0")
-                vals = pd.to_numeric(vals, errors="coerce").fillna(0)
-
-                extracted_data[mapped_country] = vals.values
-
-            if extracted_data:
-                df_clean = pd.DataFrame(extracted_data, index=dates)
-                df_clean.index.name = "Date"
-                # 중복 날짜 제거
-                df_clean = df_clean.groupby(df_clean.index).last()
-                all_dfs.append(df_clean)
-
-        except Exception as e:
-            print(f"❌ [Outbound] Error {os.path.basename(file)}: {e}")
+    all_dfs, section = manifest.collect(
+        "outbound",
+        "Outbound",
+        files,
+        functools.partial(parse_file, force=force),
+        PARSER_VERSION,
+        force,
+        executor,
+        rules=(common.COUNTRY_MAP,),
+    )
 
     if all_dfs:
         final_df = pd.concat(all_dfs, axis=1)
@@ -126,8 +145,17 @@ def process():
         final_df = final_df.dropna(how="all")  # 전체가 NaN인 행 제거
         final_df.sort_index(inplace=True)
 
-        save_path = os.path.join(common.CLEAN_DIR, "cleaned_outbound_tourism.csv")
-        final_df.to_csv(save_path, encoding="utf-8-sig")
-        print(" ✅ [Outbound] 완료")
+        output.save(
+            section,
+            "Outbound",
+            "cleaned_outbound_tourism",
+            final_df,
+            output.count_type(final_df),
+            csv,
+            series="outbound",
+        )
     else:
         print("⚠️ [Outbound] 결과 데이터가 없습니다.")
+        report.note(status="empty", reason="no rows parsed")
+
+    manifest.save_section("outbound", section)
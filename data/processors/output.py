@@ -0,0 +1,219 @@
+# data/processors/output.py
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from . import common, manifest, report
+
+# ---------------------------------------------------------
+# 최종 산출물 저장
+#  - DataFrame -> 명시적 스키마의 Arrow 테이블 -> Parquet (CSV 왕복 없음)
+#  - Date 인덱스는 정렬된 timestamp 컬럼으로 저장 (pandas 메타데이터로 인덱스 복원)
+#  - CSV는 선택 사항 (--csv)
+#  - 대시보드용 Arrow IPC (Feather v2, 비압축) 파일도 함께 발행
+#    -> utils가 memory-map으로 열어 여러 Streamlit 프로세스가 같은 페이지 캐시를 공유
+#  - long 포맷 (date, country, value) 데이터셋도 함께 발행
+#    cleaned_data/long/series=<이름>/year=<연도>/*.parquet (hive 파티션)
+# ---------------------------------------------------------
+PARQUET_COMPRESSION = "snappy"
+ARROW_EXT = ".arrow"
+LONG_DIRNAME = "long"
+LONG_ROWS_PER_GROUP = 64 * 1024
+# 파티션 디렉터리 안의 "_" 파일은 pyarrow.dataset이 무시 -> 저장 완료 표식으로 사용
+LONG_STAMP = "_SUCCESS"
+
+LONG_SCHEMA = pa.schema(
+    [
+        pa.field("date", pa.timestamp("ns"), nullable=False),
+        pa.field("country", pa.string(), nullable=False),
+        pa.field("value", pa.float64()),
+        pa.field("series", pa.string(), nullable=False),
+        pa.field("year", pa.int16(), nullable=False),
+    ]
+)
+LONG_PARTITIONING = ds.partitioning(
+    pa.schema([("series", pa.string()), ("year", pa.int16())]), flavor="hive"
+)
+
+
+# 컴팩트 dtype 기준
+#  - 인원수: 결측 없으면 int32 (부호 있음: 뷰의 전월 대비 뺄셈이 언더플로하지 않도록),
+#            결측(NaN 마스킹) 있으면 float32 (2^24 이하 정수는 정확히 표현)
+#  - 환율: float32 왕복 오차가 고시 단위(0.01)의 절반 이하일 때만 float32
+#  - 기준을 벗어나면 int64 / float64 유지
+COUNT_FLOAT32_MAX = 2**24
+RATE_TOLERANCE = 0.005
+
+
+def count_type(df):
+    """인원수 프레임에 맞는 가장 작은 Arrow 타입"""
+    values = df.to_numpy(dtype="float64")
+    missing = np.isnan(values)
+    finite = values[~missing]
+    if finite.size and not np.array_equal(finite, np.round(finite)):
+        return pa.float64()
+    top = np.abs(finite).max() if finite.size else 0
+    if missing.any():
+        return pa.float32() if top <= COUNT_FLOAT32_MAX else pa.float64()
+    return pa.int32() if top < 2**31 else pa.int64()
+
+
+def rate_type(df, tolerance=RATE_TOLERANCE):
+    """환율 프레임: float32로 줄여도 오차가 tolerance 이하면 float32"""
+    values = df.to_numpy(dtype="float64")
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return pa.float32()
+    error = np.abs(values - values.astype(np.float32)).max()
+    return pa.float32() if error <= tolerance else pa.float64()
+
+
+def long_dir():
+    return os.path.join(common.CLEAN_DIR, LONG_DIRNAME)
+
+
+def schema_for(df, value_type):
+    """Date(timestamp) 인덱스 + 모든 값 컬럼을 value_type으로 고정한 스키마"""
+    fields = [pa.field("Date", pa.timestamp("ns"), nullable=False)]
+    fields += [pa.field(str(col), value_type) for col in df.columns]
+    return pa.schema(fields)
+
+
+def to_table(df, value_type):
+    df = df.sort_index().rename_axis(columns=None)
+    df.index = pd.DatetimeIndex(df.index, name="Date")
+    return pa.Table.from_pandas(
+        df, schema=schema_for(df, value_type), preserve_index=True
+    )
+
+
+def write_parquet(df, path, value_type):
+    tmp_path = f"{path}.tmp"
+    pq.write_table(to_table(df, value_type), tmp_path, compression=PARQUET_COMPRESSION)
+    os.replace(tmp_path, path)
+
+
+def write_arrow(df, path, value_type):
+    """
+    비압축 Feather v2 -> 읽을 때 압축 해제/파싱 없이 mmap 버퍼를 그대로 사용.
+    임시 파일 + os.replace: 이미 매핑 중인 프로세스는 이전 파일을 계속 보고, 새로 여는 쪽만 새 파일을 봄
+    """
+    tmp_path = f"{path}.tmp"
+    feather.write_feather(
+        to_table(df, value_type), tmp_path, compression="uncompressed", version=2
+    )
+    os.replace(tmp_path, path)
+
+
+def to_long(df, series):
+    """wide (Date x 국가) -> long (date, country, value, series, year). 값이 없는 칸은 제외"""
+    df = df.rename_axis(index="date", columns="country")
+    long_df = df.stack(future_stack=True).dropna().rename("value").reset_index()
+    long_df["date"] = pd.DatetimeIndex(long_df["date"])
+    long_df["country"] = long_df["country"].astype(str)
+    long_df["value"] = long_df["value"].astype("float64")
+    long_df["series"] = series
+    long_df["year"] = long_df["date"].dt.year.astype("int16")
+    # 파일 안에서 (국가, 날짜) 순으로 정렬 -> row group 통계(min/max)로 국가 필터 스킵
+    long_df = long_df.sort_values(["country", "date"], ignore_index=True)
+    return pa.Table.from_pandas(long_df, schema=LONG_SCHEMA, preserve_index=False)
+
+
+def write_long(df, series):
+    """series 파티션 전체를 다시 씀 (프로세서마다 자기 series 디렉터리만 건드림)"""
+    series_dir = os.path.join(long_dir(), f"series={series}")
+    shutil.rmtree(series_dir, ignore_errors=True)
+    table = to_long(df, series)
+    ds.write_dataset(
+        table,
+        long_dir(),
+        format="parquet",
+        partitioning=LONG_PARTITIONING,
+        basename_template=f"{series}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=LONG_ROWS_PER_GROUP,
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=PARQUET_COMPRESSION, write_statistics=True
+        ),
+    )
+    stamp = os.path.join(series_dir, LONG_STAMP)
+    with open(stamp, "w", encoding="utf-8") as f:
+        f.write(str(table.num_rows))
+    return stamp
+
+
+def save_frame(section, path, df, schema, sort_by=("currency", "date")):
+    """
+    long 형태 프레임 1개를 명시적 스키마로 Parquet 저장 (내용이 같으면 건너뜀).
+    sort_by 순으로 정렬 -> row group 통계로 통화/기간 필터 스킵
+    """
+    df = df.sort_values(list(sort_by), ignore_index=True)
+    digest = manifest.frame_hash(df, salt=str(schema))
+    if manifest.output_current(section, path, digest):
+        report.record_output(path, df, written=False)
+        return False
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    tmp_path = f"{path}.tmp"
+    pq.write_table(
+        table,
+        tmp_path,
+        compression=PARQUET_COMPRESSION,
+        row_group_size=LONG_ROWS_PER_GROUP,
+    )
+    os.replace(tmp_path, path)
+    manifest.record_output(section, path, digest)
+    report.record_output(path, df, written=True)
+    return True
+
+
+def _report_path(path):
+    # long 데이터셋은 표식 파일 대신 series 디렉터리로 기록
+    return os.path.dirname(path) if path.endswith(LONG_STAMP) else path
+
+
+def save(section, label, filename, df, value_type, csv=False, series=None):
+    """
+    Parquet(+선택적으로 CSV) 저장. 내용 해시가 같고 파일이 그대로면 건너뜁니다.
+    filename은 확장자 없는 이름 (예: "cleaned_inbound_tourism")
+    series가 주어지면 long 포맷 데이터셋의 해당 파티션도 갱신합니다.
+    """
+    digest = manifest.frame_hash(df, salt=str(value_type))
+    report.note(value_type=str(value_type))
+    targets = [
+        os.path.join(common.CLEAN_DIR, f"{filename}.parquet"),
+        os.path.join(common.CLEAN_DIR, f"{filename}{ARROW_EXT}"),
+    ]
+    if csv:
+        targets.append(os.path.join(common.CLEAN_DIR, f"{filename}.csv"))
+    if series:
+        targets.append(os.path.join(long_dir(), f"series={series}", LONG_STAMP))
+
+    stale = [p for p in targets if not manifest.output_current(section, p, digest)]
+    for path in targets:
+        if path not in stale:
+            report.record_output(_report_path(path), df, written=False)
+    if not stale:
+        print(f" ⏩ [{label}] 변경 없음 (Skip)")
+        return
+
+    for path in stale:
+        if path.endswith(".parquet"):
+            write_parquet(df, path, value_type)
+        elif path.endswith(ARROW_EXT):
+            write_arrow(df, path, value_type)
+        elif path.endswith(LONG_STAMP):
+            write_long(df, series)
+        else:
+            df.sort_index().to_csv(path, encoding="utf-8-sig")
+        manifest.record_output(section, path, digest)
+        report.record_output(_report_path(path), df, written=True)
+    names = [
+        f"long/series={series}" if p.endswith(LONG_STAMP) else os.path.basename(p)
+        for p in stale
+    ]
+    print(f" ✅ [{label}] 완료 ({', '.join(names)})")
@@ -0,0 +1,175 @@
+# data/processors/plans.py
+import csv
+import glob
+import hashlib
+import itertools
+import json
+import os
+import re
+
+import pandas as pd
+from . import common, manifest
+
+# ---------------------------------------------------------
+# 파싱 플랜 캐시
+#  - 플랜: 인코딩, 시작 행(skiprows), 읽을 컬럼(usecols), 컬럼 번호 -> 원본(한글) 라벨
+#    (영문 매핑은 COUNTRY_MAP이 바뀌어도 반영되도록 파싱 시점에 적용, 플랜에는 저장하지 않음)
+#  - 파일 앞부분(PREFIX_BYTES) 지문이 같으면 탐색 없이 바로 1회 파싱
+#  - 지문이 달라도 헤더 구조(숫자만 다른 경우)가 같으면 기존 플랜 재사용
+#  - force=True면 저장된 플랜을 무시하고 다시 탐색 (결과로 플랜 갱신)
+# ---------------------------------------------------------
+PLAN_VERSION = 2
+PREFIX_BYTES = 4096
+
+
+def plan_dir():
+    return os.path.join(manifest.cache_dir(), "plans")
+
+
+def _plan_path(name, layout):
+    return os.path.join(plan_dir(), f"{name}_L{layout}.json")
+
+
+def _alias_path(name, fp):
+    return os.path.join(plan_dir(), f"{name}_F{fp}.json")
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_json(path, data):
+    # 워커 프로세스끼리 동시에 써도 깨지지 않도록 임시 파일 -> 교체
+    os.makedirs(plan_dir(), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def fingerprint(file):
+    """파일 앞부분 PREFIX_BYTES 바이트의 sha1"""
+    with open(file, "rb") as f:
+        return hashlib.sha1(f.read(PREFIX_BYTES)).hexdigest()
+
+
+def _layout_key(rows):
+    """헤더 블록의 구조 키 (숫자는 #로 치환 -> 기간만 다른 파일은 같은 레이아웃)"""
+    masked = ["\x1f".join(re.sub(r"\d", "#", v.strip()) for v in row) for row in rows]
+    return hashlib.sha1("\x1e".join(masked).encode("utf-8")).hexdigest()[:16]
+
+
+def _head_rows(file, encoding, n):
+    with open(file, encoding=encoding, newline="") as f:
+        return list(itertools.islice(csv.reader(f), n))
+
+
+def _matches(file, plan, predicate):
+    """기존 플랜의 헤더 위치/구조가 이 파일에도 그대로 맞는지 확인 (앞부분만 읽음)"""
+    header_idx = plan["skiprows"] + len(plan["header"]) - 1
+    try:
+        rows = _head_rows(file, plan["encoding"], header_idx + 1)
+    except (UnicodeDecodeError, OSError):
+        return False
+    if len(rows) <= header_idx or not predicate(rows[header_idx]):
+        return False
+    if any(predicate(row) for row in rows[:header_idx]):
+        return False
+    return _layout_key(rows[plan["skiprows"] :]) == plan["layout"]
+
+
+def _detect(file, predicate, rows_before, usecols, encodings=common.ENCODINGS):
+    """헤더를 직접 탐색하여 새 플랜 생성 (못 찾으면 None)"""
+    found = common.locate_header(file, predicate, encodings)
+    if found is None or found[1] < rows_before:
+        return None
+    encoding, header_idx, fields = found
+    skiprows = header_idx - rows_before
+    header = _head_rows(file, encoding, header_idx + 1)[skiprows:]
+    return {
+        "version": PLAN_VERSION,
+        "encoding": encoding,
+        "skiprows": skiprows,
+        "usecols": sorted(set(usecols(fields))) if usecols else None,
+        "header": header,
+        "layout": _layout_key(header),
+        "names": {},
+    }
+
+
+def save(name, plan):
+    _save_json(_plan_path(name, plan["layout"]), plan)
+
+
+def _cached(name, file, fp, predicate):
+    """저장된 플랜 중 이 파일에 맞는 것 (지문 -> 레이아웃 순, 없으면 None)"""
+    alias = _load_json(_alias_path(name, fp))
+    if alias:
+        plan = _load_json(_plan_path(name, alias["layout"]))
+        if plan and plan.get("version") == PLAN_VERSION:
+            return plan
+
+    for path in sorted(glob.glob(_plan_path(name, "*"))):
+        plan = _load_json(path)
+        if plan and plan.get("version") == PLAN_VERSION:
+            if _matches(file, plan, predicate):
+                _save_json(_alias_path(name, fp), {"layout": plan["layout"]})
+                return plan
+    return None
+
+
+def resolve(name, file, predicate, rows_before=0, usecols=None, force=False):
+    """
+    파일에 맞는 파싱 플랜 반환 (헤더가 없으면 None)
+    1) 앞부분 지문이 같은 파일을 본 적 있음 -> 해당 플랜
+    2) 같은 프로세서의 기존 레이아웃과 헤더 구조가 일치 -> 해당 플랜
+    3) 헤더 직접 탐색 -> 새 플랜 저장 (force=True면 1, 2를 건너뜀)
+    """
+    fp = fingerprint(file)
+    if not force:
+        plan = _cached(name, file, fp, predicate)
+        if plan is not None:
+            return plan
+
+    plan = _detect(file, predicate, rows_before, usecols)
+    if plan is None:
+        return None
+    save(name, plan)
+    _save_json(_alias_path(name, fp), {"layout": plan["layout"]})
+    return plan
+
+
+def read(file, plan):
+    return pd.read_csv(
+        file,
+        encoding=plan["encoding"],
+        header=None,
+        skiprows=plan["skiprows"],
+        usecols=plan["usecols"],
+        dtype=str,
+    )
+
+
+def read_block(name, file, predicate, rows_before=0, usecols=None, force=False):
+    """
+    common.read_block()의 플랜 캐시 버전.
+    반환: (DataFrame, 플랜) / 헤더를 못 찾으면 (None, None)
+    """
+    plan = resolve(name, file, predicate, rows_before, usecols, force)
+    if plan is None:
+        return None, None
+    try:
+        return read(file, plan), plan
+    except UnicodeDecodeError:
+        # 앞부분만 같고 본문 인코딩이 다른 경우 -> 나머지 인코딩으로 다시 탐색
+        others = [e for e in common.ENCODINGS if e != plan["encoding"]]
+        plan = _detect(file, predicate, rows_before, usecols, others)
+        if plan is None:
+            return None, None
+        save(name, plan)
+        _save_json(_alias_path(name, fingerprint(file)), {"layout": plan["layout"]})
+        return read(file, plan), plan
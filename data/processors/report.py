@@ -0,0 +1,318 @@
+# data/processors/report.py
+import contextlib
+import cProfile
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource  # 피크 메모리 측정 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+from . import common
+
+# ---------------------------------------------------------
+# 실행 리포트 (cleaned_data/run_report.json)
+#  - 단계(stage)별: wall/CPU 시간, 입력/출력 행·열, 읽은/쓴 바이트, 피크 메모리, 실패 사유
+#  - 파일별: 상태(parsed/cached/skipped/failed), 파싱 시간, 크기, 결과 행·열, 사유
+#  - 피크 메모리는 단계/파일 실행 구간의 RSS 최대값 (프로세스 전체 최대값이 아님)
+#    CPU 시간에는 구간 동안 종료된 자식 프로세스(예: 단계가 직접 만든 풀)의 CPU도 포함
+#  - 단계는 스레드별로 추적 -> 병렬 모드(프로세서 3개 동시 실행)에서도 섞이지 않음
+#  - 현재 단계가 없으면 (프로세서 단독 실행 등) 기록 함수는 아무것도 하지 않음
+# ---------------------------------------------------------
+REPORT_NAME = "run_report.json"
+PROFILE_DIRNAME = "profiles"
+
+# 구간 RSS 샘플링 주기 (초)
+RSS_SAMPLE_SECONDS = 0.05
+
+_lock = threading.Lock()
+_local = threading.local()
+_run = None
+
+# 측정 중인 RSS 구간들 + 샘플러 스레드 (포크된 워커에서는 새로 시작)
+_rss_lock = threading.Lock()
+_rss_windows = []
+_rss_sampler = None
+
+
+def report_path():
+    return os.path.join(common.CLEAN_DIR, REPORT_NAME)
+
+
+def profile_dir():
+    return os.path.join(common.CLEAN_DIR, PROFILE_DIRNAME)
+
+
+def peak_rss_mb(children=False):
+    """현재 프로세스(children=True면 종료된 자식 포함)의 최대 RSS (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux는 KB, macOS는 byte 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def current_rss_mb():
+    """현재 RSS (MB). /proc가 없으면 (macOS 등) 최대 RSS로 대체"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+
+def _children_cpu():
+    """종료(회수)된 자식 프로세스들의 누적 CPU 시간 (user + sys)"""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _sample_rss():
+    global _rss_sampler
+    while True:
+        time.sleep(RSS_SAMPLE_SECONDS)
+        rss = current_rss_mb()
+        with _rss_lock:
+            if not _rss_windows:
+                _rss_sampler = None
+                return
+            for window in _rss_windows:
+                window["peak"] = max(window["peak"], rss)
+
+
+def _reset_rss_sampler():
+    # 포크된 자식에는 샘플러 스레드가 없고 락 상태도 알 수 없음 -> 초기화
+    global _rss_lock, _rss_windows, _rss_sampler
+    _rss_lock = threading.Lock()
+    _rss_windows = []
+    _rss_sampler = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rss_sampler)
+
+
+def rss_start():
+    """
+    RSS 측정 구간 시작 -> window["start"], window["peak"] (MB, rss_stop() 후 확정)
+    짧은 스파이크는 샘플링 대신 ru_maxrss 증가분으로 잡음 (구간 중 최대값이 갱신된 경우)
+    RSS는 프로세스 단위이므로 동시에 실행 중인 단계의 메모리도 포함됩니다.
+    """
+    global _rss_sampler
+    start_rss = current_rss_mb()
+    window = {"start": start_rss, "peak": start_rss, "max_before": peak_rss_mb()}
+    if start_rss is None:
+        return window
+    with _rss_lock:
+        _rss_windows.append(window)
+        if _rss_sampler is None:
+            _rss_sampler = threading.Thread(target=_sample_rss, daemon=True)
+            _rss_sampler.start()
+    return window
+
+
+def rss_stop(window):
+    """RSS 측정 구간 종료 (window["peak"] 확정)"""
+    if window["start"] is None:
+        return window
+    with _rss_lock:
+        if window in _rss_windows:
+            _rss_windows.remove(window)
+    peak = max(window["peak"], current_rss_mb())
+    max_after = peak_rss_mb()
+    if max_after is not None and max_after > window["max_before"]:
+        peak = max(peak, max_after)
+    window["peak"] = peak
+    return window
+
+
+def _rss_delta(window):
+    """구간 시작 대비 RSS 최대 증가량 (MB)"""
+    if window["start"] is None:
+        return None
+    return round(window["peak"] - window["start"], 1)
+
+
+def start(options=None):
+    """새 실행 리포트 시작"""
+    global _run
+    with _lock:
+        _run = {
+            "started": datetime.datetime.now().isoformat(timespec="seconds"),
+            "argv": sys.argv[1:],
+            "options": options or {},
+            "stages": [],
+        }
+        _run["_t0"] = time.perf_counter()
+
+
+def current():
+    return getattr(_local, "stage", None)
+
+
+@contextlib.contextmanager
+def stage(name, profile=False):
+    """
+    with report.stage("inbound"): ...
+    블록 안에서 발생한 예외는 단계 실패로 기록한 뒤 그대로 다시 발생시킵니다.
+    profile=True면 cProfile 결과를 cleaned_data/profiles/{name}.prof 로 저장
+    """
+    record = {
+        "name": name,
+        "status": "ok",
+        "rows_in": 0,
+        "cols_in": 0,
+        "rows_out": None,
+        "cols_out": None,
+        "bytes_read": 0,
+        "bytes_written": 0,
+        "files": [],
+        "outputs": [],
+    }
+    _local.stage = record
+    profiler = cProfile.Profile() if profile else None
+    wall0, cpu0 = time.perf_counter(), time.thread_time()
+    children0 = _children_cpu()
+    window = rss_start()
+    try:
+        if profiler:
+            profiler.enable()
+        yield record
+    except Exception as e:
+        record["status"] = "failed"
+        record["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+            os.makedirs(profile_dir(), exist_ok=True)
+            record["profile"] = os.path.join(profile_dir(), f"{name}.prof")
+            profiler.dump_stats(record["profile"])
+        rss_stop(window)
+        record["wall_seconds"] = round(time.perf_counter() - wall0, 4)
+        # 공유 풀의 워커는 풀 종료 시점에야 회수되므로 파일별 합계(worker_cpu_seconds)로 따로 기록
+        record["children_cpu_seconds"] = round(_children_cpu() - children0, 4)
+        record["cpu_seconds"] = round(
+            time.thread_time() - cpu0 + record["children_cpu_seconds"], 4
+        )
+        record["worker_cpu_seconds"] = round(
+            sum(f.get("cpu_seconds", 0) for f in record["files"] if f.get("worker")),
+            4,
+        )
+        record["peak_rss_mb"] = window["peak"]
+        record["rss_delta_mb"] = _rss_delta(window)
+        _local.stage = None
+        with _lock:
+            if _run is not None:
+                _run["stages"].append(record)
+
+
+def timed_call(fn, file):
+    """
+    fn(file) 실행 + 측정값. 워커 프로세스에서도 호출되므로 모듈 레벨 함수.
+    반환: (결과, 측정값 dict)
+    """
+    wall0, cpu0 = time.perf_counter(), time.process_time() + _children_cpu()
+    window = rss_start()
+    try:
+        result = fn(file)
+    finally:
+        rss_stop(window)
+    metrics = {
+        "wall_seconds": round(time.perf_counter() - wall0, 4),
+        "cpu_seconds": round(time.process_time() + _children_cpu() - cpu0, 4),
+        "peak_rss_mb": window["peak"],
+        "rss_delta_mb": _rss_delta(window),
+        "pid": os.getpid(),
+    }
+    return result, metrics
+
+
+def record_file(file, status, df=None, reason=None, **fields):
+    """원본 파일 1개의 처리 결과 기록 (parsed / cached / skipped / failed)"""
+    record = current()
+    if record is None:
+        return
+    entry = {"file": os.path.relpath(file, common.RAW_ROOT), "status": status}
+    if status == "parsed":
+        entry["bytes_read"] = os.path.getsize(file)
+        record["bytes_read"] += entry["bytes_read"]
+    if df is not None:
+        entry["rows"], entry["cols"] = df.shape
+        record["rows_in"] += df.shape[0]
+        record["cols_in"] += df.shape[1]
+    if reason:
+        entry["reason"] = reason
+    entry.update(fields)
+    if fields.get("pid") is not None:
+        entry["worker"] = fields["pid"] != os.getpid()
+    record["files"].append(entry)
+
+
+def record_output(path, df, written):
+    """최종 산출물 기록 (written=False면 내용이 같아 건너뜀)"""
+    record = current()
+    if record is None:
+        return
+    # 첫 산출물(주 데이터셋) 기준으로 단계의 출력 행·열 기록
+    if record["rows_out"] is None:
+        record["rows_out"], record["cols_out"] = df.shape
+    entry = {"path": os.path.relpath(path, common.CLEAN_DIR), "written": written}
+    entry["rows"], entry["cols"] = df.shape
+    if written:
+        entry["bytes"] = _path_size(path)
+        record["bytes_written"] += entry["bytes"]
+    else:
+        entry["reason"] = "unchanged"
+    record["outputs"].append(entry)
+
+
+def note(**fields):
+    """현재 단계에 임의 필드 기록 (예: status="empty", reason=...)"""
+    record = current()
+    if record is not None:
+        record.update(fields)
+
+
+def _path_size(path):
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(root, f))
+            for root, _, files in os.walk(path)
+            for f in files
+        )
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def finish():
+    """리포트를 run_report.json으로 저장하고 경로 반환 (start() 전이면 None)"""
+    global _run
+    with _lock:
+        if _run is None:
+            return None
+        run, _run = _run, None
+    run["finished"] = datetime.datetime.now().isoformat(timespec="seconds")
+    run["wall_seconds"] = round(time.perf_counter() - run.pop("_t0"), 4)
+    run["cpu_seconds"] = round(time.process_time(), 4)
+    run["peak_rss_mb"] = peak_rss_mb(children=True)
+    run["failed_stages"] = [s["name"] for s in run["stages"] if s["status"] == "failed"]
+    run["failed_files"] = [
+        f["file"] for s in run["stages"] for f in s["files"] if f["status"] == "failed"
+    ]
+
+    os.makedirs(common.CLEAN_DIR, exist_ok=True)
+    tmp_path = report_path() + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(run, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, report_path())
+    return report_path()
@@ -0,0 +1,144 @@
+# data/processors/rollcorr.py
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from . import derived, manifest, output, report
+
+# ---------------------------------------------------------
+# 이동(rolling) 상관관계: 국가 x 통화, 12 / 24 / 36개월 창
+#  - x, y, x², y², xy, 표본 수의 누적합 -> 창 하나 = 누적합 차이 (창 이동 O(1), 창 길이와 무관)
+#  - (월 x 국가 x 통화) 배열로 모든 쌍을 한 번에 계산
+#  - 쌍마다 둘 다 값이 있는 달만 사용, 창의 MIN_FILL 이상 채워져야 값 기록
+#  - 누적합 전에 컬럼별로 중심화/스케일 -> 큰 값(관광객 수)의 제곱합 상쇄 오차 방지
+# 출력: derived/rolling_correlation.parquet (date = 창의 마지막 달)
+# ---------------------------------------------------------
+ANALYSIS_VERSION = 1
+ROLLING_FILE = "rolling_correlation.parquet"
+
+WINDOWS = (12, 24, 36)
+MIN_FILL = 0.75  # 창 길이 대비 최소 공통 표본 비율
+VAR_EPS = 1e-10  # (스케일된 값 기준) 분산이 이보다 작으면 상수 구간으로 보고 NaN
+
+ROLLING_SCHEMA = pa.schema(
+    [
+        pa.field("series", pa.string(), nullable=False),
+        pa.field("country", pa.string(), nullable=False),
+        pa.field("currency", pa.string(), nullable=False),
+        pa.field("window", pa.int16(), nullable=False),
+        pa.field("date", pa.timestamp("ns"), nullable=False),
+        pa.field("n", pa.int16(), nullable=False),
+        pa.field("r", pa.float64(), nullable=False),
+    ]
+)
+
+
+def min_periods(window):
+    return math.ceil(window * MIN_FILL)
+
+
+def standardize(values):
+    """컬럼별 (x - 평균) / 표준편차 (NaN 무시). 표준편차가 0이면 1로 나눔"""
+    with np.errstate(invalid="ignore"):
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0)
+    std = np.where(np.isnan(std) | (std == 0), 1.0, std)
+    return (values - mean) / std
+
+
+def window_sums(cumsum, window):
+    """누적합(앞에 0행 포함) -> 각 달로 끝나는 창의 합. 창이 덜 찬 앞부분도 있는 만큼 합산"""
+    sums = cumsum[1:].copy()
+    sums[window:] -= cumsum[1:-window]
+    return sums
+
+
+def rolling_pearson(x, y, windows=WINDOWS):
+    """
+    (월 x ...) 배열 x, y (브로드캐스트 가능)의 이동 상관계수.
+    반환: {window: (r, n)} / r은 표본 부족·상수 구간이면 NaN
+    """
+    mask = ~(np.isnan(x) | np.isnan(y))
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+    # 누적합 6종을 한 배열로: (통계, 월+1, ...)
+    stats = np.stack(np.broadcast_arrays(mask, x, y, x * x, y * y, x * y))
+    cumsum = np.zeros((stats.shape[0], stats.shape[1] + 1) + stats.shape[2:])
+    np.cumsum(stats, axis=1, out=cumsum[:, 1:])
+
+    result = {}
+    for window in windows:
+        n, sx, sy, sxx, syy, sxy = (window_sums(c, window) for c in cumsum)
+        count = np.maximum(n, 1)
+        vx = sxx - sx * sx / count
+        vy = syy - sy * sy / count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = (sxy - sx * sy / count) / np.sqrt(vx * vy)
+        valid = (n >= min_periods(window)) & (vx > VAR_EPS * n) & (vy > VAR_EPS * n)
+        result[window] = np.where(valid, np.clip(r, -1.0, 1.0), np.nan), n
+    return result
+
+
+def rolling_table(series, df, fx):
+    """한 시리즈(입국/출국)의 모든 국가 x 통화 이동 상관계수 (long 프레임, NaN 제외)"""
+    countries = df.columns.astype(str).to_numpy()
+    currencies = fx.columns.astype(str).to_numpy()
+    values = standardize(df.to_numpy())
+    rates = standardize(fx.to_numpy())
+    result = rolling_pearson(values[:, :, None], rates[:, None, :])
+
+    grid = np.meshgrid(df.index.to_numpy(), countries, currencies, indexing="ij")
+    rows = []
+    for window, (r, n) in result.items():
+        keep = ~np.isnan(r)
+        rows.append(
+            pd.DataFrame(
+                {
+                    "series": series,
+                    "country": grid[1][keep],
+                    "currency": grid[2][keep],
+                    "window": np.int16(window),
+                    "date": grid[0][keep],
+                    "n": n[keep].astype("int16"),
+                    "r": r[keep],
+                }
+            )
+        )
+    return pd.concat(rows, ignore_index=True)
+
+
+def process(force=False, executor=None, csv=False):
+    inputs = derived.input_paths()
+    section = manifest.load_section("rollcorr", ANALYSIS_VERSION)
+    path = os.path.join(derived.derived_dir(), ROLLING_FILE)
+    if not force and derived.outputs_current(section, inputs, [path]):
+        print(" ⏩ [RollCorr] 입력 변경 없음 (Skip)")
+        return
+
+    loaded = derived.load_inputs()
+    if loaded is None:
+        print("⚠️ [RollCorr] 정제 결과가 없습니다. 프로세서를 먼저 실행하세요.")
+        report.note(status="empty", reason="no cleaned inputs")
+        return
+    frames, fx = loaded
+
+    print(
+        f"🔄 [RollCorr] {'/'.join(map(str, WINDOWS))}개월 창 x "
+        f"{sum(df.shape[1] for df in frames.values()) * fx.shape[1]}쌍 계산 중..."
+    )
+    table = pd.concat(
+        [rolling_table(series, df, fx) for series, df in frames.items()],
+        ignore_index=True,
+    )
+
+    os.makedirs(derived.derived_dir(), exist_ok=True)
+    sort_by = ("series", "country", "currency", "window", "date")
+    if output.save_frame(section, path, table, ROLLING_SCHEMA, sort_by=sort_by):
+        print(f" ✅ [RollCorr] 완료 ({ROLLING_FILE}, {len(table):,}행)")
+    else:
+        print(" ⏩ [RollCorr] 변경 없음 (Skip)")
+    derived.record_inputs(section, inputs)
+    manifest.save_section("rollcorr", section)
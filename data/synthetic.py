@@ -0,0 +1,253 @@
+# data/synthetic.py
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from processors import common
+
+# ---------------------------------------------------------
+# 합성 원본 데이터 생성기 (벤치마크용)
+#  - 실제 원본과 같은 레이아웃으로 data 루트에 "정리 전" 파일을 생성
+#    · 입국: KTO '국적별 입국' (국가 x 월) wide 표, utf-8-sig
+#    · 출국: 대륙별 '명수/전년대비' 2단 헤더 시트, cp949 CSV 또는 xlsx
+#    · 환율: 수출입은행 MonAvgStdExRate{통화}.csv (월 x 1)
+#  - 규모: 연도 수 x 국가 수 x 통화 수
+# ---------------------------------------------------------
+END_YEAR = 2024
+BASE_YEARS = 22  # 1x 기준 (2003 ~ 2024, 실제 출국 데이터 기간과 비슷)
+# 환율 파서의 날짜 패턴(20xx) 범위 안에서만 생성 -> 길어지면 2000년부터 미래 방향으로 연장
+FIRST_YEAR = 2000
+MAX_YEARS = 100
+INBOUND_YEARS_PER_FILE = 2
+
+CONTINENTS = [
+    ("Asia", "아시아"),
+    ("Europe", "유럽"),
+    ("America", "미주"),
+    ("Africa", "아프리카"),
+    ("Oceania", "대양주"),
+]
+
+# 통화 코드 -> (원본 통화명, 기준 환율). processors/exchange.py가 인식하는 통화만 생성 가능
+CURRENCIES = {
+    "USD": ("미국 달러 (USD)", 1150.0),
+    "JPY": ("일본 옌 (JPY)", 1000.0),
+    "EUR": ("유로 (EUR)", 1400.0),
+    "CNH": ("위안화 (CNH)", 175.0),
+    "GBP": ("영국 파운드 (GBP)", 1650.0),
+}
+
+
+def base_countries():
+    """COUNTRY_MAP의 실제 국가 (집계 항목/중복 영문명 제외) -> 한글 원본 이름 목록"""
+    names, seen = [], set()
+    keys = list(common.COUNTRY_MAP)
+    for key in keys[keys.index("일본") :]:
+        english = common.COUNTRY_MAP[key]
+        if english not in seen:
+            seen.add(english)
+            names.append(key)
+    return names
+
+
+def country_list(count):
+    """국가 count개. 실제 국가가 모자라면 SYN0001 형태의 합성 국가로 채움"""
+    names = base_countries()[:count]
+    names += [f"SYN{i:04d}" for i in range(1, count - len(names) + 1)]
+    return names
+
+
+def scale_plan(scale):
+    """
+    배율 -> (연도 수, 국가 수, 통화 수).
+    연도는 MAX_YEARS까지만 늘리고, 남는 배율은 국가 수로 반영합니다.
+    (예: 1x -> 22년 x 94개국, 10x -> 100년 x 약 2.2배 국가, 100x -> 100년 x 약 22배 국가)
+    """
+    year_factor = min(scale, MAX_YEARS / BASE_YEARS)
+    years = int(round(BASE_YEARS * year_factor))
+    countries = int(round(len(base_countries()) * scale / year_factor))
+    return years, countries, len(CURRENCIES)
+
+
+def _months(years):
+    start = max(FIRST_YEAR, END_YEAR - years + 1)
+    return [(y, m) for y in range(start, start + years) for m in range(1, 13)]
+
+
+def _series(rng, n_months, n_series, level):
+    """추세 + 계절성 + 잡음이 있는 (월 x 시리즈) 양수 행렬"""
+    t = np.arange(n_months)[:, None]
+    scale = level * rng.lognormal(0.0, 1.0, size=n_series)
+    trend = 1.0 + 0.002 * t
+    season = 1.0 + 0.15 * np.sin(
+        2 * np.pi * (t % 12) / 12 + rng.uniform(0, 6.28, n_series)
+    )
+    noise = rng.lognormal(0.0, 0.05, size=(n_months, n_series))
+    return scale * trend * season * noise
+
+
+def write_inbound(out_dir, rng, months, countries):
+    """국적별 입국_*.csv : 국적 x 월 (INBOUND_YEARS_PER_FILE년 단위로 파일 분할)"""
+    values = _series(rng, len(months), len(countries), 3000).round().astype(np.int64)
+    labels = [
+        f"{name[0]}  {name[1:]}" if len(name) == 2 else name for name in countries
+    ]
+    step = INBOUND_YEARS_PER_FILE * 12
+    paths = []
+    for start in range(0, len(months), step):
+        chunk = slice(start, start + step)
+        block = values[chunk]
+        path = os.path.join(out_dir, f"국적별 입국_syn{start // step:05d}.csv")
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["국적별", *[f"{y}년{m:02d}월" for y, m in months[chunk]], "계"]
+            )
+            writer.writerow(["", *["인원(명)"] * (block.shape[0] + 1)])
+            writer.writerow(["아시아주", *block.sum(axis=1), block.sum()])
+            for label, col in zip(labels, block.T):
+                writer.writerow([label, *col, col.sum()])
+            writer.writerow(["전 체", *block.sum(axis=1), block.sum()])
+        paths.append(path)
+    return paths
+
+
+def _outbound_rows(title, months, countries, values):
+    """대륙별 시트의 행 목록 (제목 / 국가명(한글, 영문) / 명수·전년대비 / 데이터)"""
+    header = ["", "", "법무부?KTO", ""]
+    metric = ["", "", "명수", "전년대비"]
+    for name in countries:
+        header += [name, common.COUNTRY_MAP.get(name, name)]
+        metric += ["명수", "전년대비"]
+    rows = [[title] + [""] * (len(header) - 1), header, metric]
+
+    totals = values.sum(axis=1)
+    for i, (y, m) in enumerate(months):
+        row = [f"{y}년" if m == 1 else "", f"{m}월", f"{totals[i]:,} ", ""]
+        for v in values[i]:
+            row += [f"{v:,} ", ""]
+        rows.append(row)
+    return rows
+
+
+def write_outbound(out_dir, rng, months, countries, fmt="xlsx"):
+    """Asia / Europe / ... 대륙별 시트 (국가는 대륙 파일에 번갈아 배치)"""
+    values = _series(rng, len(months), len(countries), 2000).round().astype(np.int64)
+    paths = []
+    for i, (continent, korean) in enumerate(CONTINENTS):
+        idx = list(range(i, len(countries), len(CONTINENTS)))
+        rows = _outbound_rows(
+            f"국민 해외관광객({korean})",
+            months,
+            [countries[j] for j in idx],
+            values[:, idx],
+        )
+        if fmt == "xlsx":
+            path = os.path.join(out_dir, f"{continent}.xlsx")
+            _write_xlsx(path, rows)
+        else:
+            path = os.path.join(out_dir, f"{continent}.csv")
+            with open(path, "w", encoding="cp949", newline="", errors="replace") as f:
+                csv.writer(f).writerows(rows)
+        paths.append(path)
+    return paths
+
+
+def _write_xlsx(path, rows):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def write_exchange(out_dir, rng, months, currencies):
+    """MonAvgStdExRate{통화}.csv : 날짜, 통화명, 월평균 매매기준율"""
+    paths = []
+    for code in list(CURRENCIES)[:currencies]:
+        label, level = CURRENCIES[code]
+        walk = np.exp(np.cumsum(rng.normal(0, 0.02, size=len(months))))
+        rates = level * walk / walk.mean()
+        path = os.path.join(out_dir, f"MonAvgStdExRate{code}.csv")
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["0", "1", "2"])
+            writer.writerow(["날짜", "통화명", "월평균 매매기준율"])
+            for (y, m), rate in zip(months, rates):
+                writer.writerow([f"{y}.{m:02d}", label, f"{rate:.2f}"])
+        paths.append(path)
+    return paths
+
+
+def generate(out_dir, years, countries, currencies, seed=0, outbound_format="xlsx"):
+    """
+    out_dir 루트에 정리 전 원본 파일 생성 (file_organizer가 분류할 위치).
+    반환: 생성 요약 dict
+    """
+    if currencies > len(CURRENCIES):
+        print(f"⚠️ [Synthetic] 통화는 최대 {len(CURRENCIES)}개까지 생성합니다.")
+        currencies = len(CURRENCIES)
+    years = min(years, MAX_YEARS)
+
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    months = _months(years)
+    names = country_list(countries)
+
+    files = []
+    files += write_inbound(out_dir, rng, months, names)
+    files += write_outbound(out_dir, rng, months, names, outbound_format)
+    files += write_exchange(out_dir, rng, months, currencies)
+
+    summary = {
+        "years": years,
+        "countries": countries,
+        "currencies": currencies,
+        "files": len(files),
+        "bytes": sum(os.path.getsize(p) for p in files),
+    }
+    print(
+        f"🧪 [Synthetic] {years}년 x 국가 {countries}개 x 통화 {currencies}개 "
+        f"-> 파일 {summary['files']}개 ({summary['bytes'] / 1e6:.1f} MB)"
+    )
+    return summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="합성 원본 데이터 생성기")
+    parser.add_argument("out_dir", help="생성 위치 (data 루트처럼 사용할 폴더)")
+    parser.add_argument(
+        "--scale", type=float, default=1, help="배율 (연도/국가 수 자동 결정)"
+    )
+    parser.add_argument("--years", type=int, help="연도 수 (배율 대신 직접 지정)")
+    parser.add_argument("--countries", type=int, help="국가 수 (배율 대신 직접 지정)")
+    parser.add_argument("--currencies", type=int, help="통화 수 (최대 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--outbound-format",
+        choices=["xlsx", "csv"],
+        default="xlsx",
+        help="출국 시트 형식 (xlsx면 xls_converter 단계까지 포함)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    years, countries, currencies = scale_plan(args.scale)
+    generate(
+        args.out_dir,
+        args.years or years,
+        args.countries or countries,
+        args.currencies or currencies,
+        seed=args.seed,
+        outbound_format=args.outbound_format,
+    )
@@ -0,0 +1,195 @@
+# data/watcher.py
+import argparse
+import os
+import sys
+import threading
+import time
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+# 모듈 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import file_organizer
+import xls_converter
+from processors import inbound, outbound, exchange, common, derived
+from processors import correlation, lagcorr, rollcorr, elasticity, forecast
+
+# ---------------------------------------------------------
+# 감시 모드
+#  - data/ (새 파일 투입 위치) + 원본 폴더 3곳을 감시
+#  - 이벤트가 DEBOUNCE_SECONDS 동안 잠잠해지면 한 번에 처리
+#    (복사 중인 파일, 연속 저장 이벤트를 하나로 묶음)
+#  - 분류/이동 -> (엑셀이면) CSV 변환 -> 영향받은 프로세서만 증분 실행
+# ---------------------------------------------------------
+DEBOUNCE_SECONDS = 2.0
+POLL_SECONDS = 0.5
+WATCH_EXTENSIONS = (".csv", ".xls", ".xlsx")
+
+PROCESSORS = {
+    "inbound": inbound,
+    "outbound": outbound,
+    "exchange": exchange,
+}
+# 정제 결과를 입력으로 쓰는 파생 분석 (정제 결과 파일이 실제로 바뀐 경우에만 실행)
+DERIVED = [correlation, lagcorr, rollcorr, elasticity, forecast]
+
+
+class RawFileHandler(FileSystemEventHandler):
+    """관심 확장자의 생성/수정/이동 이벤트 경로만 모아둠"""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.last_event = 0.0
+        # 감시 모드가 직접 만든 파일(이동 결과, 변환 CSV)의 (size, mtime) -> 자기 이벤트로 재실행하지 않음
+        self.settled = {}
+
+    def _add(self, path):
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
+        name = os.path.basename(path)
+        # 임시 파일(엑셀 잠금 파일, 변환 중 .tmp 등)은 무시
+        if name.startswith(("~$", ".")) or not name.lower().endswith(WATCH_EXTENSIONS):
+            return
+        with self.lock:
+            self.pending.add(path)
+            self.last_event = time.monotonic()
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._add(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._add(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._add(event.dest_path)
+
+    def take_ready(self):
+        """마지막 이벤트 이후 DEBOUNCE_SECONDS가 지났으면 모인 경로를 꺼냄"""
+        with self.lock:
+            if not self.pending:
+                return []
+            if time.monotonic() - self.last_event < DEBOUNCE_SECONDS:
+                return []
+            ready, self.pending = sorted(self.pending), set()
+        return [path for path in ready if not self._is_settled(path)]
+
+    def _is_settled(self, path):
+        signature = self.settled.get(path)
+        return signature is not None and signature == _signature(path)
+
+    def settle(self, paths):
+        for path in paths:
+            self.settled[path] = _signature(path)
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime
+
+
+def _category_of(path):
+    """원본 폴더 안의 파일이면 해당 분류, 아니면 None"""
+    folder = os.path.abspath(os.path.dirname(path))
+    for category, target in file_organizer.target_dirs().items():
+        if folder == os.path.abspath(target):
+            return category
+    return None
+
+
+def handle_batch(paths, options):
+    """
+    경로 묶음 1개 처리.
+    반환: (실행한 프로세서 이름 목록, 처리 중 만들어진/확인된 파일 경로 목록)
+    """
+    affected = set()
+    produced = []
+    for path in paths:
+        if not os.path.exists(path):
+            continue  # 이미 이동/삭제됨
+
+        category = _category_of(path)
+        if category is None:
+            # data/ 에 새로 들어온 파일 -> 키워드 분류 후 원본 폴더로 이동
+            category, path = file_organizer.organize_file(path)
+            if category is None:
+                continue
+
+        produced.append(path)
+        if path.lower().endswith((".xls", ".xlsx")):
+            ok, message = xls_converter.convert_file(path)
+            print(message)
+            if not ok:
+                continue
+            produced.append(f"{os.path.splitext(path)[0]}.csv")
+
+        affected.add(category)
+
+    # 영향받은 프로세서만 실행 (매니페스트 덕분에 바뀐 파일만 다시 파싱)
+    # 정제 결과는 내용이 같으면 다시 쓰지 않으므로 (size, mtime)으로 변경 여부 판단
+    inputs_before = [_signature(path) for path in derived.input_paths()]
+    for category in sorted(affected):
+        print("-" * 60)
+        PROCESSORS[category].process(**options.get(category, {}))
+    inputs_after = [_signature(path) for path in derived.input_paths()]
+    if affected and inputs_after != inputs_before:
+        for processor in DERIVED:
+            print("-" * 60)
+            processor.process()
+    return sorted(affected), produced
+
+
+def watch(options=None):
+    options = options or {}
+    for path in file_organizer.target_dirs().values():
+        os.makedirs(path, exist_ok=True)
+
+    handler = RawFileHandler()
+    observer = Observer()
+    # data/ 바로 아래(투입 위치) + 원본 폴더 3곳. cleaned_data는 감시하지 않음 (출력 -> 재실행 루프 방지)
+    for path in [common.BASE_DIR, *file_organizer.target_dirs().values()]:
+        observer.schedule(handler, path, recursive=False)
+    observer.start()
+    print(f"👀 [Watch] 감시 시작: {common.BASE_DIR} (종료: Ctrl+C)")
+
+    try:
+        while True:
+            time.sleep(POLL_SECONDS)
+            paths = handler.take_ready()
+            if not paths:
+                continue
+            print("-" * 60)
+            print(f"📥 [Watch] 변경 감지: {len(paths)}개 파일")
+            try:
+                affected, produced = handle_batch(paths, options)
+            except Exception as e:
+                print(f"❌ [Watch] 처리 실패: {e}")
+                continue
+            handler.settle(produced)
+            if affected:
+                print(f"🏁 [Watch] 갱신 완료: {', '.join(affected)}")
+    except KeyboardInterrupt:
+        print("\n🛑 [Watch] 감시 종료")
+    finally:
+        observer.stop()
+        observer.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="원본 파일 감시 + 증분 파이프라인")
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Parquet과 함께 CSV(utf-8-sig)도 내보냅니다.",
+    )
+    args = parser.parse_args()
+    watch({category: {"csv": args.csv} for category in PROCESSORS})
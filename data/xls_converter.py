@@ -1,14 +1,141 @@
 # data/xls_converter.py
-import pandas as pd
+import argparse
+import csv
 import glob
 import os
+import sys
 import warnings
-from processors import common
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from processors import common, manifest
 
 warnings.filterwarnings("ignore")
 
+# 변환 기록 (원본 size/mtime/hash)은 매니페스트의 "xls" 섹션에 저장
+MANIFEST_SECTION = "xls"
+MANIFEST_VERSION = 1
+
+
+def _is_html(file):
+    """공공데이터 구형 엑셀(.xls 확장자의 HTML 표)인지 앞부분만 보고 판단"""
+    with open(file, "rb") as f:
+        head = f.read(512).lstrip().lower()
+    return head.startswith((b"<", b"\xef\xbb\xbf<"))
+
+
+def _replace_csv(output_csv, write):
+    """write(임시 경로)로 기록한 뒤 교체 -> 변환 중 실패해도 기존 CSV는 그대로 유지"""
+    tmp_path = f"{output_csv}.{os.getpid()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, output_csv)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_frame(df, output_csv):
+    # UTF-8-SIG (엑셀 호환)로 저장
+    _replace_csv(
+        output_csv, lambda path: df.to_csv(path, index=False, encoding="utf-8-sig")
+    )
+
+
+def _convert_html(file, output_csv):
+    for encoding in ["cp949", "utf-8"]:
+        try:
+            dfs = pd.read_html(file, encoding=encoding)
+        except Exception:
+            continue
+        df = max(dfs, key=len)  # 가장 데이터가 많은 표 선택
+        _write_frame(df, output_csv)
+        return True
+    return False
+
+
+def _convert_xlsx(file, output_csv):
+    """openpyxl read-only 모드로 첫 시트를 한 행씩 읽어 바로 CSV로 기록 (메모리 일정)"""
+    from openpyxl import load_workbook
+
+    def write(path):
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            for row in sheet.iter_rows(values_only=True):
+                writer.writerow(["" if v is None else v for v in row])
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        _replace_csv(output_csv, write)
+    finally:
+        workbook.close()
+    return True
+
+
+def _convert_excel(file, output_csv):
+    # 일반 엑셀 파싱 (openpyxl or xlrd 자동 선택)
+    _write_frame(pd.read_excel(file), output_csv)
+    return True
 
-def run():
+
+def convert_file(file):
+    """
+    엑셀 1개를 같은 이름의 CSV로 변환 (워커 프로세스에서 실행).
+    앞 단계가 실패(False/예외)하면 다음 방식으로 넘어가고, 마지막은 항상 pd.read_excel.
+    반환: (성공 여부, 메시지)
+    """
+    output_csv = f"{os.path.splitext(file)[0]}.csv"
+    name = os.path.basename(file)
+
+    # 1. HTML 포맷 엑셀 (공공데이터 구형 파일)
+    # 2. xlsx -> openpyxl 스트리밍
+    # 3. 일반 엑셀 파싱
+    converters = []
+    if _is_html(file):
+        converters.append(_convert_html)
+    if file.lower().endswith(".xlsx"):
+        converters.append(_convert_xlsx)
+    converters.append(_convert_excel)
+
+    error = None
+    for convert in converters:
+        try:
+            if convert(file, output_csv):
+                return True, f"  └─ 🔨 변환 성공: {name} -> CSV"
+        except Exception as e:
+            error = e
+
+    if error is not None:
+        return False, f"  ❌ 에러 발생 ({name}): {error}"
+    return False, f"  ⚠️ 변환 실패 (포맷 확인 필요): {name}"
+
+
+def _is_current(file, output_csv, entry):
+    """
+    CSV가 원본 엑셀 기준으로 최신인지 판단.
+    - 변환 기록이 있으면: size/mtime이 같거나 내용 해시가 같으면 최신
+    - 기록이 없으면 (직접 만든 CSV 등): CSV가 원본보다 나중에 수정됐으면 최신
+    """
+    if not os.path.exists(output_csv):
+        return False
+    st = os.stat(file)
+    if entry:
+        if entry["size"] == st.st_size and entry["mtime"] == st.st_mtime:
+            return True
+        return entry["hash"] == manifest.file_hash(file)
+    return os.path.getmtime(output_csv) >= st.st_mtime
+
+
+def _record(file):
+    st = os.stat(file)
+    return {"size": st.st_size, "mtime": st.st_mtime, "hash": manifest.file_hash(file)}
+
+
+def run(jobs=None, force=False):
     print(f"\n[2/3] 🔄 Excel -> CSV 포맷 변환 시작 (Target: {common.RAW_ROOT})...")
 
     # original_data 폴더 하위의 모든 xls, xlsx 탐색 (recursive=True)
@@ -18,50 +145,51 @@ def run():
         files.extend(
             glob.glob(os.path.join(common.RAW_ROOT, "**", ext), recursive=True)
         )
+    files.sort()
 
     if not files:
         print("  ℹ️ 변환할 Excel 파일이 없습니다.")
         return
 
-    count = 0
+    # 원본이 바뀌지 않았고 CSV가 남아있으면 스킵 (같은 이름의 CSV가 있어도 원본이 바뀌면 재변환)
+    section = manifest.load_section(MANIFEST_SECTION, MANIFEST_VERSION)
+    entries = {}
+    targets = []
     for file in files:
-        try:
-            # 변환된 파일명 (.xls -> .csv)
-            base_name = os.path.splitext(file)[0]
-            output_csv = f"{base_name}.csv"
-
-            # 이미 CSV가 존재하면 스킵 (중복 변환 방지)
-            if os.path.exists(output_csv):
-                continue
-
-            df = None
-            # 1. HTML 포맷 엑셀 (공공데이터 구형 파일) 파싱 시도
-            try:
-                dfs = pd.read_html(file, encoding="cp949")
-                df = max(dfs, key=len)  # 가장 데이터가 많은 표 선택
-            except:
-                try:
-                    dfs = pd.read_html(file, encoding="utf-8")
-                    df = max(dfs, key=len)
-                except:
-                    # 2. 일반 엑셀 파싱 시도
-                    try:
-                        df = pd.read_excel(file)  # openpyxl or xlrd
-                    except:
-                        pass
-
-            if df is not None:
-                # UTF-8-SIG (엑셀 호환)로 저장
-                df.to_csv(output_csv, index=False, encoding="utf-8-sig")
-                print(f"  └─ 🔨 변환 성공: {os.path.basename(file)} -> CSV")
-                count += 1
-
-                # (선택) 원본 엑셀 파일 삭제하고 싶으면 아래 주석 해제
-                # os.remove(file)
-            else:
-                print(f"  ⚠️ 변환 실패 (포맷 확인 필요): {os.path.basename(file)}")
+        key = os.path.relpath(file, common.RAW_ROOT)
+        output_csv = f"{os.path.splitext(file)[0]}.csv"
+        entry = section["files"].get(key)
+        if not force and _is_current(file, output_csv, entry):
+            entries[key] = entry or _record(file)
+        else:
+            targets.append((file, key))
 
-        except Exception as e:
-            print(f"  ❌ 에러 발생 ({os.path.basename(file)}): {e}")
+    if len(files) > len(targets):
+        print(f"  ⏩ 변경 없음 (Skip): {len(files) - len(targets)}개")
 
+    # 파일별 변환은 서로 독립적인 CPU 작업 -> 프로세스 풀로 분산
+    count = 0
+    if targets:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(convert_file, [file for file, _ in targets])
+            for (file, key), (ok, message) in zip(targets, results):
+                print(message)
+                if ok:
+                    entries[key] = _record(file)
+                    count += 1
+
+    section["files"] = entries
+    manifest.save_section(MANIFEST_SECTION, section)
     print(f"  ✨ 총 {count}개 파일 변환 완료.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="XLS/XLSX -> CSV 변환")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None, help="변환 워커 수 (기본: CPU 수)"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="변환 기록을 무시하고 모두 다시 변환"
+    )
+    args = parser.parse_args()
+    run(jobs=args.jobs, force=args.force)
@@ -1,51 +1,393 @@
 import pandas as pd
 import streamlit as st
 import os
+import glob
+import functools
+import hashlib
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import platform
 import plotly.io as pio
+import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from scipy import special
 
 # Plotly 기본 템플릿 설정 (전역 설정)
 pio.templates.default = "plotly_white"
 
+# pandas Copy-on-Write (pandas 3.0 기본 동작): 공유 캐시 프레임에서 꺼낸 프레임을
+# 페이지에서 수정해도 실제 쓰기 시점에만 복사되고, 캐시 원본은 바뀌지 않음
+pd.set_option("mode.copy_on_write", True)
+
+DATA_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "cleaned_data"
+)
+# Arrow IPC (Feather v2, 비압축) 파일: memory-map으로 열어 프로세스 간 페이지 캐시 공유
+ARROW_EXT = ".arrow"
+# long 포맷 데이터셋 (data/processors/output.py 에서 발행)
+LONG_DIR = os.path.join(DATA_DIR, "long")
+LONG_PARTITIONING = ds.partitioning(
+    pa.schema([("series", pa.string()), ("year", pa.int16())]), flavor="hive"
+)
+# 다중 해상도 환율 (data/processors/exchange.py 에서 발행): 레벨 -> 한 점이 차지하는 대략의 일수
+FX_DIR = os.path.join(DATA_DIR, "fx")
+FX_LEVEL_DAYS = {"Q": 91.3, "M": 30.4, "W": 7.0, "D": 1.0}
+FX_PX_PER_POINT = 3  # 차트 가로 픽셀당 필요한 점 간격
+
+# 캐시 무효화: 시간(ttl) 대신 데이터 파일 버전(mtime, size)을 캐시 키에 포함
+#  -> 파이프라인이 파일을 교체한 직후 바로 새 데이터, 바뀌지 않았으면 계속 재사용
+#  -> 이전 버전 항목은 max_entries를 넘으면 오래된 순으로 밀려남
+# 데이터 프레임은 st.cache_resource에 한 벌만 두고 (세션/리런마다 pickle 복사 없음)
+# 호출자에게는 Copy-on-Write 얕은 복사(O(컬럼 수))를 돌려줌
+CACHE_ENTRIES = 64
+
+
+def file_version(path):
+    """파일 버전 (mtime_ns, size), 파일이 없으면 None. 파이프라인이 파일을 교체하면 값이 바뀜"""
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return None
+    return st_.st_mtime_ns, st_.st_size
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def open_arrow(path, version):
+    """
+    Arrow IPC 파일을 memory-map으로 열어 Table 반환.
+    버퍼가 OS 페이지 캐시를 그대로 가리키므로 압축 해제/파싱이 없고,
+    같은 파일을 연 Streamlit 프로세스끼리 물리 메모리를 공유합니다.
+    version이 바뀌면(파일 교체) 새로 매핑합니다.
+    """
+    source = pa.memory_map(path, "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+# 데이터셋 이름 -> 파일명 (확장자 제외)
+DATASETS = {
+    "inbound": "cleaned_inbound_tourism",
+    "outbound": "cleaned_outbound_tourism",
+    "exchange": "cleaned_exchange_rates",
+}
+
+
+def _dataset_paths(name):
+    """(arrow, parquet, csv) 경로"""
+    base = os.path.join(DATA_DIR, DATASETS[name])
+    return f"{base}{ARROW_EXT}", f"{base}.parquet", f"{base}.csv"
+
+
+def dataset_version(name):
+    """
+    데이터셋 버전: (arrow, parquet, csv) 파일 버전 튜플.
+    이 값을 캐시 키에 넣은 함수는 데이터가 바뀔 때 정확히 한 번 다시 계산됩니다.
+    """
+    return tuple(file_version(path) for path in _dataset_paths(name))
+
+
+def dataset_columns(name):
+    """
+    데이터셋의 값 컬럼 목록 (Date 제외). 파일 스키마만 읽으므로 데이터는 로드하지 않습니다.
+    (사이드바 선택지 구성용)
+    """
+    return _dataset_columns(name, dataset_version(name))
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _dataset_columns(name, version):
+    arrow_path, path, csv_path = _dataset_paths(name)
+    if version[0] is not None:
+        schema = open_arrow(arrow_path, version[0]).schema
+    elif version[1] is not None:
+        schema = pq.read_schema(path)
+    elif version[2] is not None:
+        return pd.read_csv(csv_path, index_col="Date", nrows=0).columns.tolist()
+    else:
+        return []
+    return [c for c in schema.names if c != "Date"]
+
+
+def load_dataset(name, columns=None):
+    """
+    데이터셋 1개 로드 (name: inbound / outbound / exchange).
+    columns를 주면 해당 컬럼만 읽습니다 (없는 컬럼은 무시). Date 인덱스는 항상 포함.
+    (데이터셋, 컬럼, 파일 버전) 조합별로 캐시 -> 페이지가 실제로 쓰는 데이터만 메모리에 올라가고,
+    파이프라인 실행으로 파일이 바뀌면 다음 호출에서 바로 새로 읽음
+    """
+    if columns is not None:
+        columns = tuple(columns)
+    return _load_dataset(name, columns, dataset_version(name)).copy(deep=False)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _load_dataset(name, columns, version):
+    # 날짜 인덱스는 로드 시 한 번만 정렬·중복 제거 -> 이후 구간 조회는 위치 슬라이스
+    df = _read_dataset(name, columns, version)
+    if not (df.index.is_monotonic_increasing and df.index.is_unique):
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+    return df
+
+
+def _read_dataset(name, columns, version):
+    arrow_path, path, csv_path = _dataset_paths(name)
+    if columns is not None:
+        available = set(_dataset_columns(name, version))
+        columns = [c for c in columns if c in available]
+
+    if version[0] is not None:
+        try:
+            # memory-map Arrow 파일 (숫자 컬럼은 가능한 한 복사 없이 변환)
+            table = open_arrow(arrow_path, version[0])
+            if columns is not None:
+                table = table.select(["Date", *columns])
+            return table.to_pandas(split_blocks=True)
+        except Exception as e:
+            st.warning(f"Arrow 파일 로드 실패, Parquet으로 대체합니다: {e}")
+    if version[1] is not None:
+        try:
+            # Parquet 로드 (필요한 컬럼만 읽음, 저장된 int32/float32 타입 그대로 유지)
+            return pd.read_parquet(path, columns=columns)
+        except Exception as e:
+            st.error(f"데이터 로드 오류: {e}")
+            return pd.DataFrame()
+    # Parquet 파일이 없으면 CSV로 폴백(Fallback) 시도
+    if version[2] is not None:
+        if columns is None:
+            return pd.read_csv(csv_path, index_col="Date", parse_dates=True)
+        df = pd.read_csv(
+            csv_path, index_col="Date", parse_dates=True, usecols=["Date", *columns]
+        )
+        return df[columns]  # usecols는 파일 순서로 읽으므로 요청 순서로 맞춤
+    st.warning(f"파일을 찾을 수 없습니다: {DATASETS[name]}.parquet")
+    return pd.DataFrame()
+
 
-@st.cache_data(ttl=3600)  # 1시간 동안 메모리에 캐시 유지
 def load_data():
     """
-    Parquet 파일에서 데이터를 로드합니다. (CSV보다 10배 이상 빠름)
+    모든 데이터셋을 전체 컬럼으로 로드 -> {"inbound": df, "outbound": df, "exchange": df}
+    한 데이터셋만 필요한 페이지는 load_dataset()을 사용하세요.
+    """
+    return {name: load_dataset(name) for name in DATASETS}
+
+
+def _long_filter(series, start_date, end_date, countries):
+    """파티션(series/year) + 값(date/country) 조건을 pyarrow 필터 식으로 변환"""
+    conditions = []
+    if series is not None:
+        series = [series] if isinstance(series, str) else list(series)
+        conditions.append(ds.field("series").isin(series))
+    if start_date is not None:
+        start = pd.Timestamp(start_date)
+        conditions.append(ds.field("year") >= start.year)
+        conditions.append(ds.field("date") >= pa.scalar(start, pa.timestamp("ns")))
+    if end_date is not None:
+        end = pd.Timestamp(end_date)
+        conditions.append(ds.field("year") <= end.year)
+        conditions.append(ds.field("date") <= pa.scalar(end, pa.timestamp("ns")))
+    if countries is not None:
+        conditions.append(ds.field("country").isin(list(countries)))
+
+    expr = None
+    for condition in conditions:
+        expr = condition if expr is None else expr & condition
+    return expr
+
+
+def long_version():
+    """long 데이터셋 버전: series별 저장 완료 표식(_SUCCESS) 파일 버전 (데이터를 다 쓴 뒤 갱신됨)"""
+    stamps = sorted(glob.glob(os.path.join(LONG_DIR, "series=*", "_SUCCESS")))
+    return tuple(
+        (os.path.basename(os.path.dirname(p)), file_version(p)) for p in stamps
+    )
+
+
+def load_long(series=None, start_date=None, end_date=None, countries=None):
+    """
+    long 포맷 (date, country, value, series) 데이터 로드.
+    기간/국가 조건은 pyarrow로 내려보내 필요한 파티션과 row group만 읽습니다.
     """
-    base_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "data", "cleaned_data"
+    if countries is not None:
+        countries = tuple(countries)
+    df = _load_long(series, start_date, end_date, countries, long_version())
+    return df.copy(deep=False)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _load_long(series, start_date, end_date, countries, version):
+    if not version:
+        return pd.DataFrame(columns=["date", "country", "value", "series"])
+
+    dataset = ds.dataset(LONG_DIR, format="parquet", partitioning=LONG_PARTITIONING)
+    table = dataset.to_table(
+        columns=["date", "country", "value", "series"],
+        filter=_long_filter(series, start_date, end_date, countries),
     )
+    return table.to_pandas()
 
-    data = {}
-    # 파일명 매핑 (.parquet 확장자 확인)
-    files = {
-        "inbound": "cleaned_inbound_tourism.parquet",
-        "outbound": "cleaned_outbound_tourism.parquet",
-        "exchange": "cleaned_exchange_rates.parquet",
-    }
 
-    for key, filename in files.items():
-        path = os.path.join(base_path, filename)
-        if os.path.exists(path):
-            try:
-                # Parquet 로드 (훨씬 빠름)
-                data[key] = pd.read_parquet(path)
-            except Exception as e:
-                st.error(f"데이터 로드 오류: {e}")
-                data[key] = pd.DataFrame()
-        else:
-            # Parquet 파일이 없으면 CSV로 폴백(Fallback) 시도
-            csv_path = path.replace(".parquet", ".csv")
-            if os.path.exists(csv_path):
-                data[key] = pd.read_csv(csv_path, index_col="Date", parse_dates=True)
-            else:
-                st.warning(f"파일을 찾을 수 없습니다: {filename}")
-                data[key] = pd.DataFrame()
-
-    return data
+def load_series(series, start_date=None, end_date=None, countries=None):
+    """
+    long 데이터셋에서 한 시리즈를 load_data()와 같은 wide 형태(Date x 국가)로 로드
+    """
+    df = load_long(series, start_date, end_date, countries)
+    if df.empty:
+        return pd.DataFrame()
+    wide = df.pivot(index="date", columns="country", values="value").sort_index()
+    wide.index.name = "Date"
+    wide.columns.name = None
+    return wide
+
+
+# 파이프라인 파생 분석 결과 (data/processors/derived.py) -> cleaned_data/derived/{name}.parquet
+DERIVED_DIR = os.path.join(DATA_DIR, "derived")
+
+
+def load_derived(name, filters=None):
+    """
+    파이프라인이 미리 계산해 둔 분석 결과 로드 (예: correlation, correlation_overview).
+    filters: [(컬럼, 연산자, 값), ...] -> pyarrow로 내려보내 필요한 row group만 읽음
+    (예: 이동 상관관계에서 국가/통화 한 쌍만)
+    파일이 없으면 빈 DataFrame -> 페이지에서 직접 계산으로 대체
+    """
+    if filters is not None:
+        filters = tuple(tuple(f) for f in filters)
+    path = os.path.join(DERIVED_DIR, f"{name}.parquet")
+    return _load_derived(path, filters, file_version(path)).copy(deep=False)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _load_derived(path, filters, version):
+    if version is None:
+        return pd.DataFrame()
+    if filters is None:
+        return pd.read_parquet(path)
+    return pd.read_parquet(path, filters=list(filters))
+
+
+# 파이프라인 예측 결과 (data/processors/forecast.py): 원본 정제 결과 해시 앞 16자리를 version으로 저장
+FORECAST_VERSION_CHARS = 16
+
+
+def dataset_digest(name):
+    """데이터셋 Parquet 내용 해시 (파이프라인 예측의 version과 비교용). 파일 버전별로 한 번만 계산"""
+    return _dataset_digest(name, dataset_version(name)[1])
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _dataset_digest(name, version):
+    if version is None:
+        return None
+    h = hashlib.sha256()
+    with open(_dataset_paths(name)[1], "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:FORECAST_VERSION_CHARS]
+
+
+def load_forecast(name, columns=None):
+    """
+    향후 예측 (date, column, mean, lower, upper). name: inbound / outbound / exchange.
+    현재 데이터셋으로 만든 예측이 아니면(파이프라인 미실행 등) 빈 DataFrame
+    """
+    digest = dataset_digest(name)
+    if digest is None:
+        return pd.DataFrame()
+    filters = [("series", "==", name), ("version", "==", digest)]
+    if columns is not None:
+        filters.append(("column", "in", tuple(columns)))
+    return load_derived("forecast", filters)
+
+
+def add_forecast(fig, name, columns):
+    """
+    px.line 추이 그래프에 예측 평균(점선)과 95% 예측구간(음영)을 같은 색으로 겹쳐 그림.
+    반환: 예측을 그린 컬럼 수
+    """
+    forecast = load_forecast(name, columns)
+    if forecast.empty:
+        return 0
+    colors = {trace.name: trace.line.color for trace in fig.data}
+    drawn = 0
+    for column, fc in forecast.groupby("column", sort=False):
+        color = colors.get(column)
+        fig.add_trace(
+            go.Scatter(
+                x=pd.concat([fc["date"], fc["date"][::-1]]),
+                y=pd.concat([fc["upper"], fc["lower"][::-1]]),
+                fill="toself",
+                fillcolor=color,
+                opacity=0.15,
+                line=dict(width=0),
+                hoverinfo="skip",
+                showlegend=False,
+                legendgroup=column,
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=fc["date"],
+                y=fc["mean"],
+                mode="lines",
+                line=dict(color=color, dash="dash"),
+                name=f"{column} (예측)",
+                legendgroup=column,
+            )
+        )
+        drawn += 1
+    return drawn
+
+
+def pick_fx_level(start_date, end_date, width=900):
+    """
+    기간과 차트 폭(px)을 덮을 수 있는 가장 거친 레벨 선택.
+    (기간 / 레벨 간격) 점 개수가 폭을 채우면(width / FX_PX_PER_POINT 이상) 그 레벨 사용, 없으면 일별
+    """
+    span_days = (pd.Timestamp(end_date) - pd.Timestamp(start_date)).days + 1
+    needed = width / FX_PX_PER_POINT
+    for level in ["Q", "M", "W"]:
+        if span_days / FX_LEVEL_DAYS[level] >= needed:
+            return level
+    return "D"
+
+
+def fx_path(level):
+    return os.path.join(FX_DIR, f"fx_{level}.parquet")
+
+
+def load_fx(currencies, start_date, end_date, width=900, stat="mean"):
+    """
+    다중 해상도 환율 로드 -> (Date x 통화 wide 프레임, 선택된 레벨).
+    stat: mean / open / high / low / close / std
+    레벨 파일이 없으면 월평균(load_dataset)으로 대체합니다.
+    """
+    level = pick_fx_level(start_date, end_date, width)
+    version = file_version(fx_path(level))
+    if version is None:
+        return load_range("exchange", start_date, end_date, currencies), "M"
+    df, level = _load_fx(tuple(currencies), start_date, end_date, level, stat, version)
+    return df.copy(deep=False), level
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _load_fx(currencies, start_date, end_date, level, stat, version):
+    path = fx_path(level)
+    table = pq.read_table(
+        path,
+        columns=["date", "currency", stat],
+        filters=[
+            ("currency", "in", list(currencies)),
+            ("date", ">=", pd.Timestamp(start_date)),
+            ("date", "<=", pd.Timestamp(end_date)),
+        ],
+    )
+    df = table.to_pandas()
+    wide = df.pivot(index="date", columns="currency", values=stat).sort_index()
+    wide.index.name = "Date"
+    wide.columns.name = None
+    return wide, level
 
 
 @st.cache_resource  # 리소스(설정)는 이 데코레이터로 캐싱해야 함
@@ -71,6 +413,311 @@ def init_korean_font():
     return font_name
 
 
+# ---------------------------------------------------------
+# 날짜 구간 조회
+#  - 데이터셋 날짜 인덱스는 로드 시 정렬·중복 제거 (_load_dataset)
+#  - 구간은 searchsorted(O(log n))로 위치를 구해 iloc 슬라이스 (라벨 파싱/인덱스 검사 없음)
+#  - 최근 (데이터셋, 컬럼, 버전, 시작, 끝) 조회 결과는 LRU로 재사용 (슬라이더 왕복, 여러 세션)
+#    데이터셋 버전이 바뀌면 LRU를 비움 -> 이전 버전 프레임을 붙잡고 있지 않음
+# ---------------------------------------------------------
+RANGE_CACHE_SIZE = 128
+
+# 데이터셋별 마지막으로 조회한 버전 (바뀌면 _range_slice 캐시 비움)
+_range_versions = {}
+
+
+def _to_datetime64(value):
+    return pd.Timestamp(value).to_datetime64().astype("datetime64[ns]")
+
+
+def date_bounds(dates, start_date, end_date):
+    """
+    정렬된 datetime64 배열에서 [start_date, end_date] (양 끝 포함) 구간의 위치 (lo, hi).
+    None이면 해당 방향은 끝까지
+    """
+    lo = 0 if start_date is None else dates.searchsorted(_to_datetime64(start_date))
+    hi = (
+        len(dates)
+        if end_date is None
+        else dates.searchsorted(_to_datetime64(end_date), side="right")
+    )
+    return int(lo), int(hi)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _dataset_dates(name, version):
+    """데이터셋의 정렬된 날짜 배열 (datetime64[ns]). Date 컬럼만 읽음"""
+    return _load_dataset(name, (), version).index.to_numpy(dtype="datetime64[ns]")
+
+
+@functools.lru_cache(maxsize=RANGE_CACHE_SIZE)
+def _range_slice(name, columns, version, start, end):
+    lo, hi = date_bounds(_dataset_dates(name, version), start, end)
+    return _load_dataset(name, columns, version).iloc[lo:hi]
+
+
+def load_range(name, start_date=None, end_date=None, columns=None):
+    """
+    데이터셋의 날짜 구간 [start_date, end_date] (양 끝 포함).
+    filter_date_range(load_dataset(name, columns), ...)와 같은 결과를 O(log n) 위치 슬라이스로 반환
+    """
+    if columns is not None:
+        columns = tuple(columns)
+    start = None if start_date is None else pd.Timestamp(start_date)
+    end = None if end_date is None else pd.Timestamp(end_date)
+    version = dataset_version(name)
+    if _range_versions.setdefault(name, version) != version:
+        _range_slice.cache_clear()
+        _range_versions[name] = version
+    df = _range_slice(name, columns, version, start, end)
+    return df.copy(deep=False)
+
+
+# ---------------------------------------------------------
+# 구간 집계 인덱스
+#  - 누적합 / 중심화 누적합·제곱합 / 유효값 개수 -> 합계·평균·표준편차는 구간 양 끝 차이로 계산
+#  - min/max는 sparse table (2^k 길이 구간 최소/최대) -> 겹치는 두 구간으로 계산
+#    (메모리가 n log n이라 처음 요청될 때만 데이터셋·컬럼 조합별로 생성)
+#  - 인덱스는 요청한 컬럼만 읽어 만듦 (columns=None이면 전체)
+#  - 어떤 기간이든 O(컬럼 수). 결측(NaN)은 pandas와 같이 건너뜀
+# ---------------------------------------------------------
+RANGE_STATS = ["sum", "mean", "std", "min", "max", "count"]
+
+
+def _prefix(a):
+    """첫 행이 0인 누적합 (구간 [lo, hi)의 합 = p[hi] - p[lo])"""
+    return np.vstack([np.zeros((1, a.shape[1]), dtype=a.dtype), np.cumsum(a, axis=0)])
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _prefix_index(name, columns, version):
+    """
+    누적합 인덱스 dict: columns, count, sum, sq (+ 실수 데이터는 shift)
+     - 정수 데이터(인원수): x, x^2 누적합을 int64로 -> 합계·표준편차가 정확
+     - 실수 데이터(환율): 열 평균을 뺀 값의 누적합/제곱합 (자릿수 손실 완화)
+    """
+    df = _load_dataset(name, columns, version)
+    values = df.to_numpy(dtype="float64")
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    index = {"columns": df.columns.tolist(), "count": _prefix(present.astype(np.int64))}
+
+    top = np.abs(filled).max() if filled.size else 0
+    integral = np.array_equal(filled, np.round(filled))
+    if integral and top**2 * max(len(values), 1) < 2**62:
+        ints = filled.astype(np.int64)
+        index["sum"] = _prefix(ints)
+        index["sq"] = _prefix(ints * ints)
+        return index
+
+    counts = present.sum(axis=0)
+    shift = filled.sum(axis=0) / np.maximum(counts, 1)
+    centered = np.where(present, values - shift, 0.0)
+    index["sum"] = _prefix(filled)
+    index["centered"] = _prefix(centered)
+    index["sq"] = _prefix(centered**2)
+    return index
+
+
+def _range_std(index, lo, hi, positions, count):
+    """표본 표준편차 (ddof=1). 유효값 2개 미만이면 NaN"""
+    s2 = index["sq"][hi, positions] - index["sq"][lo, positions]
+    if "centered" in index:
+        s1 = index["centered"][hi, positions] - index["centered"][lo, positions]
+        var = (s2 - s1**2 / np.maximum(count, 1)) / np.maximum(count - 1, 1)
+    else:
+        # 정수 누적합: n*Σx² - (Σx)²를 파이썬 정수로 정확히 계산 (컬럼 수만큼)
+        s1 = index["sum"][hi, positions] - index["sum"][lo, positions]
+        n = count.astype(object)
+        numerator = n * s2.astype(object) - s1.astype(object) ** 2
+        var = np.array(
+            [num / (c * (c - 1)) if c > 1 else 0.0 for num, c in zip(numerator, n)],
+            dtype="float64",
+        )
+    return np.where(count > 1, np.sqrt(np.maximum(var, 0)), np.nan)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _sparse_tables(name, columns, version):
+    """min/max sparse table: table[k][i] = values[i : i + 2^k]의 최소/최대 (NaN 무시)"""
+    values = _load_dataset(name, columns, version).to_numpy(dtype="float64")
+    mins, maxs = [values], [values]
+    width = 1
+    while width * 2 <= len(values):
+        mins.append(np.fmin(mins[-1][:-width], mins[-1][width:]))
+        maxs.append(np.fmax(maxs[-1][:-width], maxs[-1][width:]))
+        width *= 2
+    return mins, maxs
+
+
+def _sparse_query(table, lo, hi, combine):
+    k = (hi - lo).bit_length() - 1
+    return combine(table[k][lo], table[k][hi - (1 << k)])
+
+
+def range_aggregate(name, start_date=None, end_date=None, stats=None, columns=None):
+    """
+    기간 [start_date, end_date] 집계 -> 행: 컬럼, 열: stats (sum/mean/std/min/max/count).
+    pandas의 df.loc[start:end].agg(...)와 같은 값 (std는 표본 표준편차, ddof=1)
+    """
+    stats = list(stats or RANGE_STATS)
+    if columns is not None:
+        columns = tuple(columns)
+    version = dataset_version(name)
+    index = _prefix_index(name, columns, version)
+    lo, hi = date_bounds(_dataset_dates(name, version), start_date, end_date)
+    # 인덱스는 요청 컬럼(없는 컬럼 제외)만, 요청 순서로 만들어짐
+    names = index["columns"]
+    positions = np.arange(len(names))
+
+    count = index["count"][hi, positions] - index["count"][lo, positions]
+    total = index["sum"][hi, positions] - index["sum"][lo, positions]
+    result = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if "count" in stats:
+            result["count"] = count
+        if "sum" in stats:
+            result["sum"] = total
+        if "mean" in stats:
+            result["mean"] = np.where(count > 0, total / np.maximum(count, 1), np.nan)
+        if "std" in stats:
+            result["std"] = _range_std(index, lo, hi, positions, count)
+        if {"min", "max"} & set(stats):
+            mins, maxs = _sparse_tables(name, columns, version)
+            for stat, table, combine in [
+                ("min", mins, np.fmin),
+                ("max", maxs, np.fmax),
+            ]:
+                if stat not in stats:
+                    continue
+                if hi > lo:
+                    result[stat] = _sparse_query(table, lo, hi, combine)[positions]
+                else:
+                    result[stat] = np.full(len(positions), np.nan)
+    return pd.DataFrame(result, index=pd.Index(names), columns=stats)
+
+
+def range_top(name, start_date=None, end_date=None, n=10, columns=None, stat="sum"):
+    """기간 집계값(stat) 기준 상위 n개 컬럼 (내림차순 Series)"""
+    values = range_aggregate(name, start_date, end_date, [stat], columns)[stat]
+    return values.sort_values(ascending=False).head(n)
+
+
+# ---------------------------------------------------------
+# 변수 쌍 단순 회귀 (y = a + b·x, 닫힌 해)
+#  - 모든 (x, y) 쌍의 기울기/절편/R²/표준오차/p-value를 (월 x 변수 x 변수) 배열 연산 한 번으로 계산
+#  - 로그-로그 기울기 = 탄력성 (양수 값만 사용)
+#  - (변수 구성, 기간, 데이터셋 버전)별 캐시 -> 축을 바꿔도 다시 적합하지 않음
+# ---------------------------------------------------------
+REGRESSION_COLUMNS = [
+    "n",
+    "slope",
+    "intercept",
+    "r",
+    "r2",
+    "se_slope",
+    "se_intercept",
+    "p_value",
+    "elasticity",
+    "elasticity_se",
+    "elasticity_r2",
+]
+
+
+def _spec_versions(spec):
+    return tuple(dataset_version(name) for name in sorted({s[0] for s in spec}))
+
+
+def load_merged(spec, start_date=None, end_date=None):
+    """
+    여러 데이터셋의 컬럼을 날짜 기준으로 합친 프레임 (모든 변수에 값이 있는 달만).
+    spec: ((데이터셋, 컬럼, 표시 이름), ...)
+    """
+    spec = tuple(tuple(s) for s in spec)
+    df = _load_merged(spec, start_date, end_date, _spec_versions(spec))
+    return df.copy(deep=False)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _load_merged(spec, start_date, end_date, versions):
+    columns = [
+        load_range(name, start_date, end_date, [column])[column].rename(label)
+        for name, column, label in spec
+    ]
+    return pd.concat(columns, axis=1).dropna()
+
+
+def _ols_pairs(values):
+    """
+    (월 x 변수) 배열 -> [i, j] = 변수 j를 변수 i에 회귀한 결과 (변수 x 변수 배열 dict).
+    쌍마다 둘 다 값이 있는 달만 사용
+    """
+    x = values[:, :, None]
+    y = values[:, None, :]
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=0)
+    count = np.maximum(n, 1)
+    x_mean = np.where(mask, x, 0.0).sum(axis=0) / count
+    y_mean = np.where(mask, y, 0.0).sum(axis=0) / count
+    dx = np.where(mask, x - x_mean, 0.0)
+    dy = np.where(mask, y - y_mean, 0.0)
+    sxx = (dx * dx).sum(axis=0)
+    syy = (dy * dy).sum(axis=0)
+    sxy = (dx * dy).sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        r = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+        dof = n - 2
+        s2 = np.maximum(syy - slope * sxy, 0.0) / dof  # 잔차 분산
+        se_slope = np.sqrt(s2 / sxx)
+        se_intercept = np.sqrt(s2 * (1.0 / count + x_mean**2 / sxx))
+        t = slope / se_slope
+    p_value = 2.0 * special.stdtr(np.maximum(dof, 1), -np.abs(t))
+
+    valid = (n >= 3) & (sxx > 0) & (syy > 0)
+    result = {
+        "n": n,
+        "slope": slope,
+        "intercept": y_mean - slope * x_mean,
+        "r": r,
+        "r2": r * r,
+        "se_slope": se_slope,
+        "se_intercept": se_intercept,
+        "p_value": np.where(se_slope > 0, p_value, 0.0),
+    }
+    return {k: v if k == "n" else np.where(valid, v, np.nan) for k, v in result.items()}
+
+
+def pair_regression(spec, start_date=None, end_date=None):
+    """
+    load_merged(spec, ...) 프레임의 모든 변수 쌍 회귀 결과.
+    반환: (x, y) MultiIndex DataFrame (REGRESSION_COLUMNS)
+    """
+    spec = tuple(tuple(s) for s in spec)
+    df = _pair_regression(spec, start_date, end_date, _spec_versions(spec))
+    return df.copy(deep=False)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def _pair_regression(spec, start_date, end_date, versions):
+    merged = _load_merged(spec, start_date, end_date, versions)
+    values = merged.to_numpy(dtype="float64")
+    level = _ols_pairs(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = _ols_pairs(np.log(np.where(values > 0, values, np.nan)))
+
+    names = merged.columns.tolist()
+    index = pd.MultiIndex.from_product([names, names], names=["x", "y"])
+    df = pd.DataFrame({k: v.ravel() for k, v in level.items()}, index=index)
+    df["elasticity"] = logs["slope"].ravel()
+    df["elasticity_se"] = logs["se_slope"].ravel()
+    df["elasticity_r2"] = logs["r2"].ravel()
+    # 자기 자신과의 회귀는 제외
+    df = df[df.index.get_level_values("x") != df.index.get_level_values("y")]
+    return df[REGRESSION_COLUMNS]
+
+
 def filter_date_range(df, start_date, end_date):
     if df.empty:
         return df
@@ -7,7 +7,6 @@ import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import utils
-import statsmodels.api as sm
 
 
 def analyze_correlation(country_name, currency_name, r_in, r_out):
@@ -71,28 +70,29 @@ def show():
         """
         )
 
-    data = utils.load_data()
-    df_in = data["inbound"]
-    df_out = data["outbound"]
-    df_fx = data["exchange"]
-
-    merged_df = pd.concat(
-        [
-            df_in[["Total"]].rename(columns={"Total": "총 입국자 수"}),
-            df_out[["Total Outbound"]].rename(
-                columns={"Total Outbound": "총 출국자 수"}
-            ),
-            df_fx,
-        ],
-        axis=1,
-    ).dropna()
+    # 페이지에서 쓰는 컬럼만 로드 (합계 + 주요 3개국)
+    countries = {"United States": "USD", "Japan": "JPY", "China": "CNH"}
+    df_in = utils.load_dataset("inbound", ["Total", *countries])
+    df_out = utils.load_dataset("outbound", ["Total Outbound", *countries])
+    df_fx = utils.load_dataset("exchange")
+
+    # 국가 x 통화 상관계수 순위/이동 상관 선택지는 파이프라인(data/processors/correlation.py)에서
+    # 미리 계산해 둔 값 사용
+    pair_table = utils.load_derived("correlation")
+
+    # 히트맵/산점도 변수: 합계 2개 + 전체 통화 (모든 변수에 값이 있는 달만)
+    merged_spec = (
+        ("inbound", "Total", "총 입국자 수"),
+        ("outbound", "Total Outbound", "총 출국자 수"),
+        *[("exchange", c, c) for c in df_fx.columns],
+    )
+    merged_df = utils.load_merged(merged_spec)
 
     st.divider()
 
     # --- 2. 주요 3개국 심층 비교 분석 ---
     st.subheader("🏆 주요 3개국(미·일·중) 환율 민감도 비교 분석")
 
-    countries = {"United States": "USD", "Japan": "JPY", "China": "CNH"}
     summary_data = []
 
     for country, currency in countries.items():
@@ -110,6 +110,7 @@ def show():
         temp_df = temp_df_raw.dropna()
 
         if not temp_df.empty:
+            # 그래프와 같은 기간 (입국·출국·환율 모두 값이 있는 달) 기준
             corr_in = temp_df["Rate"].corr(temp_df["Inbound"])
             corr_out = temp_df["Rate"].corr(temp_df["Outbound"])
             out_stat, out_desc, in_stat, in_desc = analyze_correlation(
@@ -261,6 +262,240 @@ def show():
                     )
                     st.plotly_chart(fig, use_container_width=True)
 
+    # 전체 국가 x 통화 조합 (사전 계산 결과)
+    if not pair_table.empty:
+        with st.expander("🌐 전체 국가 x 통화 상관관계 순위 (|r| 기준)"):
+            c1, c2 = st.columns(2)
+            with c1:
+                series_label = st.selectbox("대상", ["출국", "입국"])
+            with c2:
+                method_label = st.selectbox(
+                    "방법",
+                    ["피어슨 (수준)", "스피어만 (순위)", "로그 변화율 (월간)"],
+                )
+            series = {"출국": "outbound", "입국": "inbound"}[series_label]
+            method, count = {
+                "피어슨 (수준)": ("pearson", "n"),
+                "스피어만 (순위)": ("spearman", "n"),
+                "로그 변화율 (월간)": ("logdiff", "n_diff"),
+            }[method_label]
+
+            ranking = pair_table.loc[
+                (pair_table["series"] == series) & pair_table[method].notna(),
+                ["country", "currency", method, count],
+            ]
+            ranking = ranking.iloc[ranking[method].abs().argsort()[::-1]]
+            ranking.columns = ["국가", "통화", "상관계수", "표본 수(개월)"]
+            st.dataframe(
+                ranking.style.format({"상관계수": "{:.3f}"}).background_gradient(
+                    cmap="coolwarm", subset=["상관계수"], vmin=-1, vmax=1
+                ),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+    # 시차 상관관계 (사전 계산 결과: 시차 -24 ~ +24개월)
+    lag_table = utils.load_derived("lag_correlation")
+    if not lag_table.empty:
+        with st.expander("⏱️ 시차 상관관계 (Lead/Lag)"):
+            st.caption(
+                "시차 +k: 환율이 k개월 먼저 움직인 경우 / 시차 -k: 관광객 수가 먼저 움직인 경우"
+            )
+            c1, c2, c3, c4 = st.columns(4)
+            with c1:
+                lag_series = st.selectbox("대상", ["출국", "입국"], key="lag_series")
+            lag_series = {"출국": "outbound", "입국": "inbound"}[lag_series]
+            lag_rows = lag_table[lag_table["series"] == lag_series]
+            with c2:
+                lag_countries = sorted(lag_rows["country"].unique())
+                lag_country = st.selectbox(
+                    "국가",
+                    lag_countries,
+                    index=(
+                        lag_countries.index("Japan") if "Japan" in lag_countries else 0
+                    ),
+                )
+            with c3:
+                lag_currencies = sorted(lag_rows["currency"].unique())
+                lag_currency = st.selectbox(
+                    "통화",
+                    lag_currencies,
+                    index=lag_currencies.index("JPY") if "JPY" in lag_currencies else 0,
+                )
+            with c4:
+                lag_method = st.selectbox(
+                    "방법", ["로그 변화율 (월간)", "수준"], key="lag_method"
+                )
+            lag_method = {"로그 변화율 (월간)": "logdiff", "수준": "level"}[lag_method]
+
+            curve = lag_rows[
+                (lag_rows["country"] == lag_country)
+                & (lag_rows["currency"] == lag_currency)
+                & (lag_rows["method"] == lag_method)
+            ]
+            fig_lag = px.bar(
+                curve,
+                x="lag",
+                y="r",
+                color="r",
+                color_continuous_scale="RdBu_r",
+                range_color=[-1, 1],
+                hover_data=["n"],
+                labels={"lag": "시차 (개월)", "r": "상관계수", "n": "표본 수"},
+                title=f"{lag_country} vs {lag_currency} 시차별 상관계수",
+            )
+            st.plotly_chart(fig_lag, use_container_width=True)
+
+            peaks = utils.load_derived("lag_peak")
+            peak = peaks[
+                (peaks["series"] == lag_series)
+                & (peaks["method"] == lag_method)
+                & (peaks["country"] == lag_country)
+                & (peaks["currency"] == lag_currency)
+            ]
+            if peak.empty:
+                st.info("표본이 부족해 최대 상관 시차를 정할 수 없습니다.")
+            else:
+                peak = peak.iloc[0]
+                st.write(
+                    f"**최대 상관 시차:** {peak['peak_lag']:+d}개월 "
+                    f"(r = {peak['peak_r']:.3f}, 동시점 r = {peak['r_lag0']:.3f}, 표본 {peak['n']}개월)"
+                )
+
+    # 이동 상관관계 (사전 계산 결과: 12 / 24 / 36개월 창) -> 선택한 한 쌍만 읽음
+    if not pair_table.empty:
+        with st.expander("📉 이동 상관관계 (Rolling Correlation)"):
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                roll_series = st.selectbox("대상", ["출국", "입국"], key="roll_series")
+            roll_series = {"출국": "outbound", "입국": "inbound"}[roll_series]
+            roll_pairs = pair_table[pair_table["series"] == roll_series]
+            with c2:
+                roll_countries = sorted(roll_pairs["country"].unique())
+                roll_country = st.selectbox(
+                    "국가",
+                    roll_countries,
+                    index=(
+                        roll_countries.index("Japan")
+                        if "Japan" in roll_countries
+                        else 0
+                    ),
+                    key="roll_country",
+                )
+            with c3:
+                roll_currencies = sorted(roll_pairs["currency"].unique())
+                roll_currency = st.selectbox(
+                    "통화",
+                    roll_currencies,
+                    index=(
+                        roll_currencies.index("JPY") if "JPY" in roll_currencies else 0
+                    ),
+                    key="roll_currency",
+                )
+
+            rolling = utils.load_derived(
+                "rolling_correlation",
+                [
+                    ("series", "==", roll_series),
+                    ("country", "==", roll_country),
+                    ("currency", "==", roll_currency),
+                ],
+            )
+            if rolling.empty:
+                st.info("이동 상관계수를 계산할 수 있는 데이터가 부족합니다.")
+            else:
+                rolling["window"] = rolling["window"].astype(str) + "개월"
+                fig_roll = px.line(
+                    rolling,
+                    x="date",
+                    y="r",
+                    color="window",
+                    hover_data=["n"],
+                    labels={
+                        "date": "날짜 (창의 마지막 달)",
+                        "r": "상관계수",
+                        "window": "창",
+                        "n": "표본 수",
+                    },
+                    title=f"{roll_country} vs {roll_currency} 이동 상관계수",
+                )
+                fig_roll.add_hline(y=0, line_dash="dot")
+                fig_roll.update_yaxes(range=[-1, 1])
+                st.plotly_chart(fig_roll, use_container_width=True)
+
+    # 환율 탄력성 (파이프라인 패널 회귀 결과: 통화가 매핑된 모든 국가)
+    elasticity = utils.load_derived("elasticity")
+    if not elasticity.empty:
+        with st.expander("📐 국가별 환율 탄력성 (패널 회귀)"):
+            st.caption(
+                "log(관광객 수) = a + b·log(환율) + 월 더미 + 코로나 더미 / "
+                "b: 환율 1% 상승 시 관광객 수 변화율(%), 막대 끝 선은 95% 신뢰구간"
+            )
+            el_series = st.selectbox("대상", ["출국", "입국"], key="el_series")
+            el_series = {"출국": "outbound", "입국": "inbound"}[el_series]
+            el_df = elasticity[elasticity["series"] == el_series].sort_values(
+                "elasticity"
+            )
+            el_df["ci"] = 1.96 * el_df["se"]
+            el_df["유의성"] = el_df["p_value"].map(
+                lambda p: "유의함 (p<0.05)" if p < 0.05 else "유의하지 않음"
+            )
+            fig_el = px.bar(
+                el_df,
+                x="elasticity",
+                y="country",
+                orientation="h",
+                error_x="ci",
+                color="유의성",
+                hover_data=["currency", "n", "p_value", "r2"],
+                labels={
+                    "elasticity": "탄력성",
+                    "country": "국가",
+                    "currency": "통화",
+                    "n": "표본 수",
+                },
+                title="국가별 환율 탄력성",
+            )
+            fig_el.add_vline(x=0, line_dash="dot")
+            st.plotly_chart(fig_el, use_container_width=True)
+
+            el_table = el_df[
+                [
+                    "country",
+                    "currency",
+                    "elasticity",
+                    "se",
+                    "p_value",
+                    "covid",
+                    "r2",
+                    "n",
+                ]
+            ]
+            el_table.columns = [
+                "국가",
+                "통화",
+                "탄력성",
+                "표준오차",
+                "P-value",
+                "코로나 효과(log)",
+                "R²",
+                "표본 수(개월)",
+            ]
+            st.dataframe(
+                el_table.style.format(
+                    {
+                        "탄력성": "{:.3f}",
+                        "표준오차": "{:.3f}",
+                        "P-value": "{:.4f}",
+                        "코로나 효과(log)": "{:.3f}",
+                        "R²": "{:.3f}",
+                    },
+                    na_rep="N/A",
+                ),
+                use_container_width=True,
+                hide_index=True,
+            )
+
     st.divider()
 
     # --- 3. 사용자 자유 선택형 상세 분석 ---
@@ -269,9 +504,20 @@ def show():
 
     with col_left:
         st.markdown("##### 🔥 전체 지표 상관관계 (Heatmap)")
+        # 사전 계산된 상관행렬이 있으면 사용 (merged_df와 같은 변수·순서로 맞춤)
+        overview = utils.load_derived("correlation_overview")
+        if overview.empty:
+            corr_matrix = merged_df.corr()
+        else:
+            labels = {"Total": "총 입국자 수", "Total Outbound": "총 출국자 수"}
+            corr_matrix = (
+                overview.set_index("variable")
+                .rename(index=labels, columns=labels)
+                .reindex(index=merged_df.columns, columns=merged_df.columns)
+            )
         fig_heatmap, ax = plt.subplots(figsize=(8, 8))
         sns.heatmap(
-            merged_df.corr(),
+            corr_matrix,
             annot=True,
             cmap="coolwarm",
             fmt=".2f",
@@ -305,23 +551,42 @@ def show():
                 merged_df,
                 x=x_axis,
                 y=y_axis,
-                trendline="ols",
                 hover_data=[merged_df.index],
                 opacity=0.6,
                 title=f"{x_axis} vs {y_axis}",
                 labels={x_axis: f"{x_axis} (값)", y_axis: f"{y_axis} (값)"},
             )
-            st.plotly_chart(fig_scatter, use_container_width=True)
 
-            try:
-                results = px.get_trendline_results(fig_scatter)
-                model = results.px_fit_results.iloc[0]
-                r_val = merged_df[x_axis].corr(merged_df[y_axis])
-                p_val = model.pvalues[1]
+            # 회귀선: 모든 변수 쌍을 미리 계산해 둔 결과 사용 (축 변경 시 재적합 없음)
+            fit = utils.pair_regression(merged_spec).loc[(x_axis, y_axis)]
+            if not pd.isna(fit["slope"]):
+                x_line = [merged_df[x_axis].min(), merged_df[x_axis].max()]
+                fig_scatter.add_trace(
+                    go.Scatter(
+                        x=x_line,
+                        y=[fit["intercept"] + fit["slope"] * v for v in x_line],
+                        mode="lines",
+                        name="OLS",
+                        hovertemplate=(
+                            f"{y_axis} = {fit['intercept']:,.4g} + {fit['slope']:,.4g} × {x_axis}"
+                            f"<br>R² = {fit['r2']:.3f}<extra></extra>"
+                        ),
+                        showlegend=False,
+                    )
+                )
+            st.plotly_chart(fig_scatter, use_container_width=True)
 
-                msg = "유의함 ✅" if p_val < 0.05 else "유의하지 않음 ❌"
+            if not pd.isna(fit["p_value"]):
+                msg = "유의함 ✅" if fit["p_value"] < 0.05 else "유의하지 않음 ❌"
                 st.info(
-                    f"📊 **통계 요약:** 상관계수 **{r_val:.3f}** / P-value **{p_val:.4f}** ({msg})"
+                    f"📊 **통계 요약:** 상관계수 **{fit['r']:.3f}** / P-value **{fit['p_value']:.4f}** ({msg})"
+                )
+                elasticity_text = (
+                    f" / 탄력성(로그-로그) {fit['elasticity']:.3f}"
+                    if not pd.isna(fit["elasticity"])
+                    else ""
+                )
+                st.caption(
+                    f"기울기 {fit['slope']:,.4g} (±{fit['se_slope']:,.3g}) / "
+                    f"R² {fit['r2']:.3f} / 표본 {int(fit['n'])}개월{elasticity_text}"
                 )
-            except:
-                pass
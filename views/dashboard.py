@@ -12,10 +12,8 @@ def show():
     )
 
     # 데이터 로드
-    data = utils.load_data()
-    df_in = data["inbound"]
-    df_out = data["outbound"]
-    df_fx = data["exchange"]
+    # 페이지에서 쓰는 컬럼만 로드 (국가별 컬럼은 읽지 않음)
+    df_in = utils.load_dataset("inbound", ["Total"])
 
     if df_in.empty:
         st.error("데이터 로드에 실패했습니다. data 폴더를 확인해주세요.")
@@ -36,10 +34,12 @@ def show():
         format="YYYY-MM",
     )
 
-    # 데이터 필터링
-    df_in_filtered = utils.filter_date_range(df_in, start_date, end_date)
-    df_out_filtered = utils.filter_date_range(df_out, start_date, end_date)
-    df_fx_filtered = utils.filter_date_range(df_fx, start_date, end_date)
+    # 데이터 필터링 (정렬된 날짜 인덱스에서 위치 슬라이스, 최근 구간은 캐시 재사용)
+    df_in_filtered = utils.load_range("inbound", start_date, end_date, ["Total"])
+    df_out_filtered = utils.load_range(
+        "outbound", start_date, end_date, ["Total Outbound"]
+    )
+    df_fx_filtered = utils.load_range("exchange", start_date, end_date)
 
     # --- 2. KPI Metrics (주요 지표) ---
     st.subheader(f"📌 주요 지표 요약 ({end_date.strftime('%Y-%m')} 기준)")
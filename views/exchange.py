@@ -130,8 +130,7 @@ def show():
         )
 
     # 데이터 로드
-    data = utils.load_data()
-    df_fx = data["exchange"]
+    df_fx = utils.load_dataset("exchange")
 
     if df_fx.empty:
         return
@@ -149,7 +148,7 @@ def show():
         "조회 기간", min_date, max_date, (min_date, max_date)
     )
 
-    df_filtered = utils.filter_date_range(df_fx, start_date, end_date)
+    df_filtered = utils.load_range("exchange", start_date, end_date)
 
     if not selected_currencies:
         st.warning("통화를 선택해주세요.")
@@ -203,6 +202,31 @@ def show():
             )
         st.plotly_chart(fig_raw, use_container_width=True)
 
+        # 강조 구간 확대: 구간 길이에 맞는 해상도(분기/월/주/일)를 골라 다시 로드
+        if hp:
+            zoom_start = pd.Timestamp(hp["start"]) - pd.DateOffset(months=3)
+            zoom_end = pd.Timestamp(hp["end"]) + pd.DateOffset(months=3)
+            df_zoom, level = utils.load_fx(
+                tuple(selected_currencies), zoom_start, zoom_end
+            )
+            if not df_zoom.empty:
+                fig_zoom = px.line(
+                    df_zoom,
+                    y=df_zoom.columns.tolist(),
+                    title=f"🔎 사건 구간 확대: {hp['label']} ({level})",
+                    labels={"value": "환율(원)", "Date": "날짜"},
+                    markers=True,
+                )
+                fig_zoom.add_vrect(
+                    x0=hp["start"],
+                    x1=hp["end"],
+                    fillcolor="red",
+                    opacity=0.15,
+                    layer="below",
+                    line_width=0,
+                )
+                st.plotly_chart(fig_zoom, use_container_width=True)
+
     with tab2:
         df_rebased = df_filtered[selected_currencies].apply(
             lambda x: x / x.iloc[0] * 100
@@ -230,7 +254,13 @@ def show():
 
     # --- 5. 통계 요약 ---
     st.subheader("📊 기간 내 통계")
-    stats = df_filtered[selected_currencies].describe().T[["mean", "min", "max", "std"]]
+    stats = utils.range_aggregate(
+        "exchange",
+        start_date,
+        end_date,
+        ["mean", "min", "max", "std"],
+        selected_currencies,
+    )
     stats.columns = ["평균", "최저", "최고", "변동성"]
     st.dataframe(stats.style.format("{:,.2f}"), use_container_width=True)
     st.divider()
@@ -9,8 +9,7 @@ import pandas as pd
 def show():
     st.title("🛬 입국 상세 분석 (Inbound Analysis)")
 
-    data = utils.load_data()
-    df_in = data["inbound"]
+    df_in = utils.load_dataset("inbound")
 
     if df_in.empty:
         st.error("입국 데이터가 없습니다.")
@@ -46,7 +45,7 @@ def show():
         "조회 기간", min_date, max_date, (min_date, max_date)
     )
 
-    df_filtered = utils.filter_date_range(df_in, start_date, end_date)
+    df_filtered = utils.load_range("inbound", start_date, end_date)
 
     if not selected_countries:
         st.info("좌측 사이드바에서 국가를 선택해주세요.")
@@ -63,7 +62,16 @@ def show():
         labels={"value": "입국자 수 (명)", "variable": "국가", "Date": "날짜"},
         markers=True,
     )
+    # 조회 기간이 최신 달까지면 향후 12개월 예측(파이프라인에서 미리 적합)을 겹쳐 그림
+    show_forecast = end_date == max_date and st.sidebar.checkbox(
+        "향후 12개월 예측 표시", value=True
+    )
+    drawn = show_forecast and utils.add_forecast(
+        fig_line, "inbound", selected_countries
+    )
     st.plotly_chart(fig_line, use_container_width=True)
+    if drawn:
+        st.caption("* 점선: ETS 계절 모형 예측, 음영: 95% 예측구간")
 
     # 2. 대륙별 점유율 & Top 10 국가
     col1, col2 = st.columns(2)
@@ -79,8 +87,10 @@ def show():
         ]
         existing_continents = [c for c in continent_cols if c in df_in.columns]
 
-        # 합계가 아닌, 기간 평균 점유율 사용
-        avg_data = df_filtered[existing_continents].mean()
+        # 합계가 아닌, 기간 평균 점유율 사용 (구간 집계 인덱스: 기간 길이와 무관)
+        avg_data = utils.range_aggregate(
+            "inbound", start_date, end_date, ["mean"], existing_continents
+        )["mean"]
 
         labels_kor = {
             "Asia Total": "아시아",
@@ -101,8 +111,8 @@ def show():
     with col2:
         st.subheader(f"3. 누적 입국자 Top 10")
         # 기간 내 합계 기준 정렬
-        top_countries = (
-            df_filtered[country_options].sum().sort_values(ascending=False).head(10)
+        top_countries = utils.range_top(
+            "inbound", start_date, end_date, 10, country_options
         )
 
         fig_bar = px.bar(
@@ -12,8 +12,7 @@ import pandas as pd
 def show():
     st.title("🛫 출국 상세 분석 (Outbound Analysis)")
 
-    data = utils.load_data()
-    df_out = data["outbound"]
+    df_out = utils.load_dataset("outbound")
 
     if df_out.empty:
         st.error("출국 데이터가 없습니다.")
@@ -38,7 +37,7 @@ def show():
         "조회 기간", min_date, max_date, (min_date, max_date)
     )
 
-    df_filtered = utils.filter_date_range(df_out, start_date, end_date)
+    df_filtered = utils.load_range("outbound", start_date, end_date)
 
     if not selected_countries:
         st.info("좌측 사이드바에서 국가를 선택해주세요.")
@@ -55,7 +54,16 @@ def show():
         labels={"value": "출국자 수 (명)", "variable": "목적지", "Date": "날짜"},
         markers=True,
     )
+    # 조회 기간이 최신 달까지면 향후 12개월 예측(파이프라인에서 미리 적합)을 겹쳐 그림
+    show_forecast = end_date == max_date and st.sidebar.checkbox(
+        "향후 12개월 예측 표시", value=True
+    )
+    drawn = show_forecast and utils.add_forecast(
+        fig_line, "outbound", selected_countries
+    )
     st.plotly_chart(fig_line, use_container_width=True)
+    if drawn:
+        st.caption("* 점선: ETS 계절 모형 예측, 음영: 95% 예측구간")
 
     # 2. 대륙별 점유율 & Top 10 국가
     col1, col2 = st.columns(2)
@@ -153,13 +161,15 @@ def show():
         }
 
         # 필터링된 데이터에서 유효한 국가만 포함하여 대륙별 합계 계산
+        # (국가별 기간 합계는 구간 집계 인덱스에서 한 번에 -> 월평균 = 합계 / 개월 수)
+        sums = utils.range_aggregate("outbound", start_date, end_date, ["sum"])
+        months = len(df_filtered)
         continent_shares = {}
         for continent, countries in continent_groups.items():
             valid_countries = [c for c in countries if c in df_filtered.columns]
             if valid_countries:
-                continent_shares[continent] = (
-                    df_filtered[valid_countries].sum(axis=1).mean()
-                )
+                total = sums.loc[valid_countries, "sum"].sum()
+                continent_shares[continent] = total / months
 
         avg_data = pd.Series(continent_shares).sort_values(ascending=False)
 
@@ -174,8 +184,8 @@ def show():
     with col2:
         st.subheader(f"3. 누적 출국자 Top 10")
         # 기간 내 합계 기준 정렬
-        top_countries = (
-            df_filtered[country_options].sum().sort_values(ascending=False).head(10)
+        top_countries = utils.range_top(
+            "outbound", start_date, end_date, 10, country_options
         )
 
         fig_bar = px.bar(